@@ -0,0 +1,257 @@
+"""
+AES tek blok maliyeti: liste-liste durumlu ve gf_mul döngülü eski uygulama,
+düz bytearray durumlu adım adım uygulama (GF(2^8) çarpım tabloları) ve
+T-tablo çekirdeği. Ardından tracemalloc ile blok başına ayırma sayısı
+(take_snapshot().compare_to ile count_diff toplamı; çağrı sonunda canlı kalan
+nesneler) ve tepe ek bellek (çağrı içinde geçici ara nesneler); mesaj başına
+da aynısı: eski yol (blok başına yeni durum, out += ile büyüyen çıktı) ve
+önceden ayrılmış çıktıya memoryview üzerinden yerinde yazan yeni yol.
+
+    python benchmarks/aes_block_bench.py [--blocks 2000] [--repeat 5]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "server"))
+
+from aes_from_scratch import (  # noqa: E402
+    SBOX, INV_SBOX, gf_mul, key_expansion_128, pad_pkcs7,
+    aes_encrypt_block_steps, aes_decrypt_block_steps,
+    aes_encrypt_block_words, aes_decrypt_block_words, aes_encrypt_block_into,
+    encryption_round_words, decryption_round_words,
+)
+
+
+def bytes_to_state(block):
+    state = [[0] * 4 for _ in range(4)]
+    for i in range(16):
+        state[i % 4][i // 4] = block[i]
+    return state
+
+
+def state_to_bytes(state):
+    out = bytearray(16)
+    for i in range(16):
+        out[i] = state[i % 4][i // 4]
+    return bytes(out)
+
+
+def add_round_key(state, round_key):
+    for i in range(16):
+        state[i % 4][i // 4] ^= round_key[i]
+
+
+def sub_bytes(state, box=SBOX):
+    for r in range(4):
+        for c in range(4):
+            state[r][c] = box[state[r][c]]
+
+
+def inv_sub_bytes(state):
+    sub_bytes(state, INV_SBOX)
+
+
+def shift_rows(state):
+    state[1] = state[1][1:] + state[1][:1]
+    state[2] = state[2][2:] + state[2][:2]
+    state[3] = state[3][3:] + state[3][:3]
+
+
+def inv_shift_rows(state):
+    state[1] = state[1][-1:] + state[1][:-1]
+    state[2] = state[2][-2:] + state[2][:-2]
+    state[3] = state[3][-3:] + state[3][:-3]
+
+
+def legacy_mix_columns(state):
+    for c in range(4):
+        a0, a1, a2, a3 = (state[r][c] for r in range(4))
+        mixed = [
+            gf_mul(a0, 2) ^ gf_mul(a1, 3) ^ a2 ^ a3,
+            a0 ^ gf_mul(a1, 2) ^ gf_mul(a2, 3) ^ a3,
+            a0 ^ a1 ^ gf_mul(a2, 2) ^ gf_mul(a3, 3),
+            gf_mul(a0, 3) ^ a1 ^ a2 ^ gf_mul(a3, 2),
+        ]
+        for r in range(4):
+            state[r][c] = mixed[r]
+
+
+def legacy_inv_mix_columns(state):
+    for c in range(4):
+        a0, a1, a2, a3 = (state[r][c] for r in range(4))
+        mixed = [
+            gf_mul(a0, 14) ^ gf_mul(a1, 11) ^ gf_mul(a2, 13) ^ gf_mul(a3, 9),
+            gf_mul(a0, 9) ^ gf_mul(a1, 14) ^ gf_mul(a2, 11) ^ gf_mul(a3, 13),
+            gf_mul(a0, 13) ^ gf_mul(a1, 9) ^ gf_mul(a2, 14) ^ gf_mul(a3, 11),
+            gf_mul(a0, 11) ^ gf_mul(a1, 13) ^ gf_mul(a2, 9) ^ gf_mul(a3, 14),
+        ]
+        for r in range(4):
+            state[r][c] = mixed[r]
+
+
+def legacy_encrypt_block(block, round_keys):
+    state = bytes_to_state(block)
+    add_round_key(state, round_keys[0])
+    for rnd in range(1, 10):
+        sub_bytes(state)
+        shift_rows(state)
+        legacy_mix_columns(state)
+        add_round_key(state, round_keys[rnd])
+    sub_bytes(state)
+    shift_rows(state)
+    add_round_key(state, round_keys[10])
+    return state_to_bytes(state)
+
+
+def legacy_decrypt_block(block, round_keys):
+    state = bytes_to_state(block)
+    add_round_key(state, round_keys[10])
+    inv_shift_rows(state)
+    inv_sub_bytes(state)
+    for rnd in range(9, 0, -1):
+        add_round_key(state, round_keys[rnd])
+        legacy_inv_mix_columns(state)
+        inv_shift_rows(state)
+        inv_sub_bytes(state)
+    add_round_key(state, round_keys[0])
+    return state_to_bytes(state)
+
+
+def legacy_encrypt_message(data, round_keys):
+    out = bytearray()
+    for i in range(0, len(data), 16):
+        out += legacy_encrypt_block(data[i:i + 16], round_keys)
+    return out
+
+
+def ttable_encrypt_message(data, ek):
+    out = bytearray(len(data))
+    with memoryview(out) as view:
+        for i in range(0, len(data), 16):
+            aes_encrypt_block_into(data, i, view, i, ek)
+    return out
+
+
+def _snapshot():
+    return tracemalloc.take_snapshot().filter_traces(
+        (tracemalloc.Filter(False, tracemalloc.__file__),))
+
+
+def allocation_count(func, items):
+    """İş başına ayırma sayısı: snapshot farkında count_diff toplamı; sonuçlar canlı tutulur."""
+    results = [None] * len(items)
+    tracemalloc.start()
+    try:
+        before = _snapshot()
+        for i, item in enumerate(items):
+            results[i] = func(item)
+        after = _snapshot()
+    finally:
+        tracemalloc.stop()
+    count = sum(stat.count_diff for stat in after.compare_to(before, "lineno"))
+    return count / len(items)
+
+
+def block_peak(func, blocks):
+    """Blok başına tracemalloc tepe ek belleği (işlem sırasında canlı ara nesneler)."""
+    total = 0
+    tracemalloc.start()
+    try:
+        for block in blocks:
+            base, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            func(block)
+            total += tracemalloc.get_traced_memory()[1] - base
+    finally:
+        tracemalloc.stop()
+    return total / len(blocks)
+
+
+def message_peak(func, data):
+    """Mesaj başına tepe ek bellek, çıktı tamponunun kendisi hariç."""
+    tracemalloc.start()
+    try:
+        base, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = func(data)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return peak - base - len(result)
+
+
+def per_block(func, blocks, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        for block in blocks:
+            func(block)
+        best = min(best, time.perf_counter_ns() - start)
+    return best / len(blocks)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--blocks", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    round_keys = key_expansion_128(bytes(rng.randrange(256) for _ in range(16)))
+    ek, dk = encryption_round_words(round_keys), decryption_round_words(round_keys)
+    blocks = [bytes(rng.randrange(256) for _ in range(16)) for _ in range(args.blocks)]
+    ciphers = [aes_encrypt_block_words(b, ek) for b in blocks]
+
+    for b, c in zip(blocks[:50], ciphers[:50]):
+        assert legacy_encrypt_block(b, round_keys) == aes_encrypt_block_steps(b, round_keys) == c
+        assert legacy_decrypt_block(c, round_keys) == aes_decrypt_block_steps(c, round_keys) == b
+
+    rows = [
+        ("şifreleme", [
+            ("gf_mul döngüsü", lambda b: legacy_encrypt_block(b, round_keys), blocks),
+            ("MUL tabloları", lambda b: aes_encrypt_block_steps(b, round_keys), blocks),
+            ("T-tablo", lambda b: aes_encrypt_block_words(b, ek), blocks),
+        ]),
+        ("çözme", [
+            ("gf_mul döngüsü", lambda b: legacy_decrypt_block(b, round_keys), ciphers),
+            ("MUL tabloları", lambda b: aes_decrypt_block_steps(b, round_keys), ciphers),
+            ("T-tablo", lambda b: aes_decrypt_block_words(b, dk), ciphers),
+        ]),
+    ]
+    print(f"{args.blocks} blok, en iyi {args.repeat} ölçüm (blok başına)")
+    for op, variants in rows:
+        base = None
+        for name, func, data in variants:
+            cost = per_block(func, data, args.repeat)
+            base = base or cost
+            print(f"{op:10} {name:15} {cost / 1000:8.2f} µs   x{base / cost:5.1f}")
+
+    out = bytearray(16)
+    sample = blocks[:200]
+    print("\ntracemalloc, şifreleme (blok başına ayırma sayısı ve tepe ek bellek)")
+    for name, func in [
+        ("liste durum", lambda b: legacy_encrypt_block(b, round_keys)),
+        ("düz durum", lambda b: aes_encrypt_block_steps(b, round_keys)),
+        ("T-tablo", lambda b: aes_encrypt_block_words(b, ek)),
+        ("T-tablo into", lambda b: aes_encrypt_block_into(b, 0, out, 0, ek)),
+    ]:
+        print(f"{name:15} {allocation_count(func, sample):6.2f} ayırma  "
+              f"{block_peak(func, sample):8.1f} B")
+
+    data = pad_pkcs7(b"".join(blocks), 16)
+    print(f"\ntracemalloc, {len(data) // 16} bloklu mesaj "
+          f"(blok başına ayırma sayısı, çıktı tamponu hariç tepe ek bellek)")
+    for name, func in [
+        ("out += blok", lambda d: legacy_encrypt_message(d, round_keys)),
+        ("ayrılmış tampon", lambda d: ttable_encrypt_message(d, ek)),
+    ]:
+        count = allocation_count(func, [data]) / (len(data) // 16)
+        print(f"{name:15} {count:6.2f} ayırma  {message_peak(func, data):10.0f} B")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+Kayıt defterindeki tüm şifreler için verim ölçümü: 16 B - 1 MB mesaj
+boyutlarında ısınma + tekrar, perf_counter_ns ile p50/p99, ops/s ve MB/s.
+
+    python benchmarks/bench_ciphers.py --output baseline.json
+    python benchmarks/bench_ciphers.py --compare baseline.json [--threshold 0.10]
+    python benchmarks/bench_ciphers.py --ciphers caesar,aes --max-size 65536
+
+Bir ölçüm hücresi (şifre, işlem, boyut) --budget saniyeyi aşarsa o şifre ve
+işlem için daha büyük boyutlar atlanır; saf Python AES/DES 1 MB'de dakikalar sürer.
+Karşılaştırma modunda p50 süresi eşiğin üzerinde artan hücreler gerileme
+sayılır ve çıkış kodu 1 olur.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "server"))
+
+from cipher_registry import REGISTRY  # noqa: E402
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+SIZES = [16, 64, 256, 1024, 4096, 16384, 65536, 262144, 1048576]
+
+# varsayılan anahtarı olmayan şifreler
+KEYS = {"affine": "5,8", "aes_session": "oturumanahtari1"}
+
+
+def make_text(size, seed=0):
+    rng = random.Random(seed)
+    return "".join(rng.choice("abcdefghijklmnopqrstuvwxyz   ") for _ in range(size))
+
+
+def percentile(sorted_samples, pct):
+    index = max(0, min(len(sorted_samples) - 1, int(round(pct / 100 * len(sorted_samples) + 0.5)) - 1))
+    return sorted_samples[index]
+
+
+def measure(func, warmup, repeat, budget_ns):
+    deadline = time.perf_counter_ns() + budget_ns
+    for _ in range(warmup):
+        func()
+        if time.perf_counter_ns() > deadline:
+            break
+    samples = []
+    while len(samples) < repeat:
+        start = time.perf_counter_ns()
+        func()
+        end = time.perf_counter_ns()
+        samples.append(end - start)
+        if end > deadline:
+            break
+    return sorted(samples)
+
+
+def run(args):
+    names = args.ciphers.split(",") if args.ciphers else REGISTRY.names()
+    sizes = [s for s in SIZES if s <= args.max_size]
+    budget_ns = int(args.budget * 1e9)
+    texts = {size: make_text(size) for size in sizes}
+    results = []
+
+    for name in names:
+        key = KEYS.get(name)
+        for op in ("encrypt", "decrypt"):
+            for size in sizes:
+                text = texts[size]
+                if op == "decrypt":
+                    text = REGISTRY.encrypt(name, key, text)[0]
+                call = REGISTRY.encrypt if op == "encrypt" else REGISTRY.decrypt
+                started = time.perf_counter_ns()
+                samples = measure(lambda: call(name, key, text), args.warmup, args.repeat, budget_ns)
+                p50 = percentile(samples, 50)
+                row = {
+                    "cipher": name, "op": op, "size": size, "reps": len(samples),
+                    "p50_ns": p50, "p99_ns": percentile(samples, 99),
+                    "mean_ns": sum(samples) // len(samples),
+                    "ops_per_s": round(1e9 / p50, 2),
+                    "mb_per_s": round(size / p50 * 1e3, 4),
+                }
+                results.append(row)
+                if not args.quiet:
+                    print(f"{name:14} {op:7} {size:>8} B  p50 {p50 / 1e6:10.3f} ms  "
+                          f"{row['mb_per_s']:9.3f} MB/s  ({len(samples)} ölçüm)", file=sys.stderr)
+                if time.perf_counter_ns() - started > budget_ns:
+                    break
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np.__version__ if np is not None else None,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "warmup": args.warmup, "repeat": args.repeat, "budget_s": args.budget,
+        },
+        "results": results,
+    }
+
+
+def compare(report, baseline, threshold):
+    base = {(r["cipher"], r["op"], r["size"]): r for r in baseline["results"]}
+    regressions = []
+    for row in report["results"]:
+        old = base.get((row["cipher"], row["op"], row["size"]))
+        if old is None:
+            continue
+        ratio = row["p50_ns"] / old["p50_ns"]
+        row["baseline_p50_ns"] = old["p50_ns"]
+        row["ratio"] = round(ratio, 3)
+        if ratio > 1 + threshold:
+            regressions.append(row)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--ciphers", help="virgülle ayrılmış şifre adları (varsayılan: hepsi)")
+    parser.add_argument("--max-size", type=int, default=SIZES[-1])
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=30)
+    parser.add_argument("--budget", type=float, default=2.0, help="hücre başına saniye")
+    parser.add_argument("--output", help="JSON raporun yazılacağı dosya (varsayılan: stdout)")
+    parser.add_argument("--compare", metavar="BASELINE", help="karşılaştırılacak JSON rapor")
+    parser.add_argument("--threshold", type=float, default=0.10, help="izin verilen p50 artışı")
+    parser.add_argument("--quiet", action="store_true")
+    args = parser.parse_args()
+
+    report = run(args)
+    regressions = []
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        report["regressions"] = [
+            {k: r[k] for k in ("cipher", "op", "size", "baseline_p50_ns", "p50_ns", "ratio")}
+            for r in regressions
+        ]
+
+    data = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(data + "\n")
+    else:
+        print(data)
+
+    for r in regressions:
+        print(f"GERİLEME: {r['cipher']} {r['op']} {r['size']} B  "
+              f"{r['baseline_p50_ns'] / 1e6:.3f} ms -> {r['p50_ns'] / 1e6:.3f} ms (x{r['ratio']})",
+              file=sys.stderr)
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+DES: skaler tamsayı çekirdeği ile bitsliced NumPy yolunun mesaj
+boyutlarına göre karşılaştırması (ECB, aynı anahtar, en iyi ölçüm).
+
+    python benchmarks/des_bench.py [--max-size 1048576] [--repeat 3]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "server"))
+
+from des_from_scratch import (  # noqa: E402
+    np, DES_BITSLICE_THRESHOLD, password_to_key_hex, des_round_keys,
+    des_bitslice_key_masks, des_crypt_bytes, des_crypt_bytes_bitsliced,
+)
+
+SIZES = [64, 256, 1024, 4096, 16384, 65536, 262144, 1048576]
+
+
+def best_of(func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--max-size", type=int, default=SIZES[-1])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--password", default="despass1")
+    args = parser.parse_args()
+
+    if np is None:
+        sys.exit("NumPy yok: bitsliced yol kullanılamıyor")
+
+    key_hex = password_to_key_hex(args.password)
+    keys = des_round_keys(key_hex)
+    masks = des_bitslice_key_masks(key_hex)
+
+    print(f"otomatik eşik: {DES_BITSLICE_THRESHOLD} blok ({DES_BITSLICE_THRESHOLD * 8} bayt)")
+    print(f"{'boyut':>9} {'skaler':>12} {'bitsliced':>12} {'hızlanma':>9}")
+    for size in (s for s in SIZES if s <= args.max_size):
+        data = os.urandom(size)
+        assert des_crypt_bytes(data, keys) == des_crypt_bytes_bitsliced(data, masks)
+        repeat = args.repeat if size <= 65536 else 1
+        scalar = best_of(lambda: des_crypt_bytes(data, keys), repeat)
+        sliced = best_of(lambda: des_crypt_bytes_bitsliced(data, masks), repeat)
+        print(f"{size:>8}B {scalar * 1000:10.2f}ms {sliced * 1000:10.2f}ms {scalar / sliced:8.1f}x "
+              f"({size / sliced / 1e6:.2f} MB/s)")
+
+
+if __name__ == "__main__":
+    main()
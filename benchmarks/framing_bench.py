@@ -0,0 +1,149 @@
+"""
+Tek bağlantı üzerinde mesaj/s: eski biçim (her mesajdan sonra OK beklenir),
+çerçeveli bekle-gönder ve çerçeveli art arda gönderim (pipelining, onaylar
+ayrı thread'de sayılır). 100 B ve 64 KB mesajlar; ayrıca FrameParser'ın
+tek başına ayrıştırma hızı.
+
+    python benchmarks/framing_bench.py [--messages 2000] [--large-messages 200]
+    python benchmarks/framing_bench.py --algorithm aes --key parola --mode blocking
+
+Varsayılan algoritma boştur: sunucu mesajı çözmeden geçmişe ekler, böylece
+protokol ve dinleyici maliyeti ölçülür. Eski biçimde 64 KB mesajlar
+bölündüğünden sunucunun gördüğü mesaj sayısı da raporlanır. Ölçümden önce
+MAGIC'in başıyla aynı eski biçimli bir mesajın (b"K") kilitlenmeden
+onaylandığı doğrulanır.
+"""
+import argparse
+import os
+import random
+import socket
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "server"))
+
+import server  # noqa: E402
+from cipher_registry import REGISTRY  # noqa: E402
+from framing import DETECT_TIMEOUT, MAGIC, FrameParser, encode_frame, encode_frames  # noqa: E402
+
+PIPELINE_BATCH = 64
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def recv_exact(sock, size):
+    got = 0
+    while got < size:
+        chunk = sock.recv(min(65536, size - got))
+        if not chunk:
+            raise ConnectionError("bağlantı kapandı")
+        got += len(chunk)
+
+
+def make_payload(size, algorithm, key):
+    rng = random.Random(size)
+    text = "".join(rng.choice("abcdefghijklmnopqrstuvwxyz ") for _ in range(size))
+    if algorithm:
+        text = REGISTRY.encrypt(algorithm, key, text)[0]
+    payload = f"{algorithm}||{key or ''}||{text}".encode("utf-8")
+    return payload
+
+
+def legacy(port, payload, count):
+    with socket.create_connection(("127.0.0.1", port)) as s:
+        for _ in range(count):
+            s.sendall(payload)
+            recv_exact(s, 2)
+
+
+def check_legacy_prefix(port):
+    """Bağlantıyı açık tutup OK bekleyen eski istemci, ön ekin başında takılmamalı."""
+    server.messages.clear()
+    with socket.create_connection(("127.0.0.1", port), timeout=DETECT_TIMEOUT + 2) as s:
+        s.sendall(MAGIC[:1])
+        try:
+            recv_exact(s, 2)
+        except socket.timeout:
+            raise AssertionError("MAGIC ön ekinin başıyla biten eski mesaj onaylanmadı") from None
+    assert [m["encrypted"] for m in server.messages] == ["K"], server.messages
+
+
+def framed_wait(port, payload, count):
+    frame = encode_frame(payload)
+    with socket.create_connection(("127.0.0.1", port)) as s:
+        s.sendall(MAGIC)
+        for _ in range(count):
+            s.sendall(frame)
+            recv_exact(s, 2)
+
+
+def framed_pipelined(port, payload, count):
+    batch = encode_frames([payload] * PIPELINE_BATCH)
+    with socket.create_connection(("127.0.0.1", port)) as s:
+        reader = threading.Thread(target=recv_exact, args=(s, 2 * count))
+        reader.start()
+        s.sendall(MAGIC)
+        sent = 0
+        while sent < count:
+            n = min(PIPELINE_BATCH, count - sent)
+            s.sendall(batch if n == PIPELINE_BATCH else encode_frames([payload] * n))
+            sent += n
+        reader.join()
+
+
+def timed(func, port, payload, count):
+    server.messages.clear()
+    start = time.perf_counter()
+    func(port, payload, count)
+    elapsed = time.perf_counter() - start
+    # eski biçimde son onaydan sonra bölünmüş parçalar hâlâ işleniyor olabilir
+    time.sleep(0.05)
+    return count / elapsed, len(server.messages)
+
+
+def parser_rate(payload, count):
+    data = MAGIC + encode_frames([payload] * count)
+    start = time.perf_counter()
+    parser = FrameParser()
+    total = 0
+    for i in range(0, len(data), 65536):
+        total += len(parser.feed(data[i:i + 65536]))
+    elapsed = time.perf_counter() - start
+    assert total == count
+    return count / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=2000, help="100 B mesaj sayısı")
+    parser.add_argument("--large-messages", type=int, default=200, help="64 KB mesaj sayısı")
+    parser.add_argument("--algorithm", default="")
+    parser.add_argument("--key")
+    parser.add_argument("--mode", choices=("asyncio", "blocking"), default=server.LISTENER_MODE)
+    args = parser.parse_args()
+
+    port = free_port()
+    server.start_socket_server("127.0.0.1", port, None, args.mode)
+    time.sleep(0.2)
+
+    check_legacy_prefix(port)
+    print(f"dinleyici {args.mode}, algoritma {args.algorithm or '(yok)'}")
+    for size, count in ((100, args.messages), (65536, args.large_messages)):
+        payload = make_payload(size, args.algorithm, args.key)
+        print(f"\n{size} B mesaj, {count} adet (yük {len(payload)} B)")
+        for name, func in (("eski, OK bekle", legacy),
+                           ("çerçeveli, OK bekle", framed_wait),
+                           ("çerçeveli, art arda", framed_pipelined)):
+            rate, seen = timed(func, port, payload, count)
+            note = f"  sunucu {seen} mesaj gördü" if seen != count else ""
+            print(f"  {name:22} {rate:10.1f} mesaj/s{note}")
+        print(f"  {'FrameParser.feed':22} {parser_rate(payload, count):10.1f} mesaj/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+pycryptodome sarmalayıcılarında mesaj başına sabit maliyet: her mesajda
+AES.new/DES.new çağıran eski yol, önbellekteki bağlamı kullanan
+encrypt_bytes ve tekrar kullanılan çıktı tamponuna yazan bağlam. Küçük
+mesajlarda süre büyük ölçüde anahtar hazırlığı ve nesne oluşturmadır.
+Sonda bağlamın CTR/CBC/GCM akışları için parça parça verim ölçülür.
+
+    python benchmarks/lib_context_bench.py [--count 20000] [--repeat 5]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "server"))
+
+from Crypto.Cipher import AES, DES  # noqa: E402
+
+import aes_with_library  # noqa: E402
+import des_with_library  # noqa: E402
+
+SIZES = [16, 64, 256, 1024]
+
+
+def legacy_encrypt(module, factory, block, data, password):
+    cipher = factory.new(module.password_to_key_bytes(password), factory.MODE_ECB)
+    return cipher.encrypt(module.pad(data, block))
+
+
+def per_call(func, count, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        for _ in range(count):
+            func()
+        best = min(best, time.perf_counter_ns() - start)
+    return best / count
+
+
+def stream_throughput(ctx, mode, data, chunk, repeat):
+    out = bytearray(chunk + 16)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        enc = ctx.encryptor(mode)
+        for i in range(0, len(data), chunk):
+            enc.update(data[i:i + chunk], out)
+        enc.finalize()
+        best = min(best, time.perf_counter_ns() - start)
+    return len(data) / best * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--stream-size", type=int, default=8 * 1024 * 1024)
+    parser.add_argument("--chunk", type=int, default=65536)
+    args = parser.parse_args()
+
+    password = "parola12345"
+    print(f"mesaj başına şifreleme, {args.count} çağrı, en iyi {args.repeat} ölçüm")
+    for name, module, factory, block in [
+        ("AES", aes_with_library, AES, 16),
+        ("DES", des_with_library, DES, 8),
+    ]:
+        ctx = module.context(password)
+        for size in SIZES:
+            data = os.urandom(size)
+            out = bytearray(size + block)
+            assert legacy_encrypt(module, factory, block, data, password) == module.encrypt_bytes(data, password)
+            old = per_call(lambda: legacy_encrypt(module, factory, block, data, password), args.count, args.repeat)
+            wrapped = per_call(lambda: module.encrypt_bytes(data, password), args.count, args.repeat)
+            reused = per_call(lambda: ctx.encrypt_bytes(data, out), args.count, args.repeat)
+            print(f"{name} {size:>5} B  new/mesaj {old / 1000:7.2f} µs   "
+                  f"bağlam {wrapped / 1000:7.2f} µs (x{old / wrapped:4.1f})   "
+                  f"bağlam+out {reused / 1000:7.2f} µs (x{old / reused:4.1f})")
+
+    data = os.urandom(args.stream_size)
+    print(f"\nakış verimi, {args.stream_size // 1024} KB, {args.chunk // 1024} KB parçalar")
+    for name, module, modes in [
+        ("AES", aes_with_library, ("ctr", "cbc", "gcm")),
+        ("DES", des_with_library, ("ctr", "cbc")),
+    ]:
+        ctx = module.context(password)
+        for mode in modes:
+            mbps = stream_throughput(ctx, mode, data, args.chunk, args.repeat)
+            print(f"{name} {mode:4} {mbps:9.1f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
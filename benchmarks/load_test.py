@@ -0,0 +1,119 @@
+"""
+server.py soket dinleyicisi için yük testi: C eşzamanlı istemci, her biri
+kalıcı bir bağlantı üzerinden M mesaj gönderir ve her mesaj için "OK"
+bekler. Her istemci sayısı için toplam mesaj/s ve mesaj başına p50/p99
+gidiş-dönüş süresi raporlanır.
+
+    python benchmarks/load_test.py [--clients 1,2,4,8,16,32] [--messages 200]
+    python benchmarks/load_test.py --algorithm caesar --key 3 --think-ms 2
+    python benchmarks/load_test.py --mode blocking --max-connections 1   # eski sıralı dinleyici gibi
+    python benchmarks/load_test.py --idle 2000   # ölçüm sırasında 2000 boşta bağlantı
+
+--think-ms, istemcinin mesajlar arasında beklediği süredir (kullanıcı yazıyor);
+sıralı dinleyicide ikinci istemci birincinin bağlantısı kapanana kadar bekler.
+--idle, ölçümden önce açılıp açık tutulan bağlantı sayısıdır; engelleyen modda
+her biri bir işçi thread'i tutar (max_connections'ı doldurur).
+"""
+import argparse
+import os
+import random
+import socket
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "server"))
+
+import server  # noqa: E402
+from cipher_registry import REGISTRY  # noqa: E402
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_listening(port, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError("sunucu dinlemeye başlamadı")
+
+
+def client(port, payload, count, think, latencies, errors):
+    try:
+        with socket.create_connection(("127.0.0.1", port)) as s:
+            for _ in range(count):
+                start = time.perf_counter_ns()
+                s.sendall(payload)
+                if s.recv(16) != b"OK":
+                    errors.append("OK gelmedi")
+                    return
+                latencies.append(time.perf_counter_ns() - start)
+                if think:
+                    time.sleep(think)
+    except OSError as e:
+        errors.append(str(e))
+
+
+def run(port, clients, payload, messages, think):
+    latencies, errors = [], []
+    threads = [threading.Thread(target=client, args=(port, payload, messages, think, latencies, errors))
+               for _ in range(clients)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+    server.messages.clear()
+    latencies.sort()
+    return elapsed, latencies, errors
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", default="1,2,4,8,16,32")
+    parser.add_argument("--messages", type=int, default=200, help="istemci başına")
+    parser.add_argument("--algorithm", default="aes")
+    parser.add_argument("--key", default="parola")
+    parser.add_argument("--size", type=int, default=64, help="düz metin uzunluğu")
+    parser.add_argument("--think-ms", type=float, default=0.0)
+    parser.add_argument("--mode", choices=("asyncio", "blocking"), default=server.LISTENER_MODE)
+    parser.add_argument("--max-connections", type=int, help="varsayılan: moda göre")
+    parser.add_argument("--idle", type=int, default=0, help="boşta tutulan bağlantı sayısı")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    text = "".join(rng.choice("abcdefghijklmnopqrstuvwxyz ") for _ in range(args.size))
+    cipher_text = REGISTRY.encrypt(args.algorithm, args.key, text)[0]
+    payload = f"{args.algorithm}||{args.key}||{cipher_text}".encode("utf-8")
+
+    port = free_port()
+    server.start_socket_server("127.0.0.1", port, args.max_connections, args.mode)
+    wait_listening(port)
+    idle = [socket.create_connection(("127.0.0.1", port)) for _ in range(args.idle)]
+
+    print(f"{args.algorithm}, {args.size} B, istemci başına {args.messages} mesaj, "
+          f"düşünme {args.think_ms} ms, {args.mode}, "
+          f"max_connections {server.socket_listener.max_connections}, boşta {len(idle)} bağlantı")
+    base = None
+    for clients in (int(c) for c in args.clients.split(",")):
+        elapsed, latencies, errors = run(port, clients, payload, args.messages, args.think_ms / 1000)
+        rate = len(latencies) / elapsed
+        base = base or rate
+        p50 = latencies[len(latencies) // 2] / 1e6 if latencies else 0.0
+        p99 = latencies[int(len(latencies) * 0.99)] / 1e6 if latencies else 0.0
+        print(f"{clients:4} istemci  {rate:9.1f} mesaj/s  x{rate / base:5.2f}  "
+              f"p50 {p50:7.3f} ms  p99 {p99:7.3f} ms" + (f"  hata: {len(errors)}" if errors else ""))
+    for s in idle:
+        s.close()
+
+
+if __name__ == "__main__":
+    main()
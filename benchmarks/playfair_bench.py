@@ -0,0 +1,98 @@
+"""
+Playfair: eski (matris + doğrusal arama) uygulama ile tablo tabanlı
+uygulamanın 100 KB metin üzerinde karşılaştırması.
+
+    python benchmarks/playfair_bench.py [--size 102400] [--repeat 5]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "server"))
+
+from crypto_algorithms import (  # noqa: E402
+    normalize_text, prepare_playfair_matrix, playfair_find_position,
+    playfair_prepare_text, playfair_encrypt, playfair_decrypt, playfair_tables,
+)
+
+
+def legacy_playfair_encrypt(text, key):
+    matrix = prepare_playfair_matrix(key)
+    pairs = playfair_prepare_text(text)
+    result = ""
+    for a, b in pairs:
+        row_a, col_a = playfair_find_position(matrix, a)
+        row_b, col_b = playfair_find_position(matrix, b)
+        if row_a == row_b:
+            result += matrix[row_a][(col_a + 1) % 5]
+            result += matrix[row_b][(col_b + 1) % 5]
+        elif col_a == col_b:
+            result += matrix[(row_a + 1) % 5][col_a]
+            result += matrix[(row_b + 1) % 5][col_b]
+        else:
+            result += matrix[row_a][col_b]
+            result += matrix[row_b][col_a]
+    return result.upper()
+
+
+def legacy_playfair_decrypt(cipher, key):
+    matrix = prepare_playfair_matrix(key)
+    cipher = normalize_text(cipher.lower().replace("j", "i"))
+    pairs = [(cipher[i], cipher[i + 1]) for i in range(0, len(cipher), 2)]
+    result = ""
+    for a, b in pairs:
+        row_a, col_a = playfair_find_position(matrix, a)
+        row_b, col_b = playfair_find_position(matrix, b)
+        if row_a == row_b:
+            result += matrix[row_a][(col_a - 1) % 5]
+            result += matrix[row_b][(col_b - 1) % 5]
+        elif col_a == col_b:
+            result += matrix[(row_a - 1) % 5][col_a]
+            result += matrix[(row_b - 1) % 5][col_b]
+        else:
+            result += matrix[row_a][col_b]
+            result += matrix[row_b][col_a]
+    return result.upper()
+
+
+def best_of(func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=100 * 1024)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--key", default="monarchy")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    text = "".join(rng.choice("abcdefghijklmnopqrstuvwxyz ") for _ in range(args.size))
+    cipher = playfair_encrypt(text, args.key)
+
+    assert cipher == legacy_playfair_encrypt(text, args.key)
+    assert playfair_decrypt(cipher, args.key) == legacy_playfair_decrypt(cipher, args.key)
+
+    setup = best_of(lambda: (playfair_tables.cache_clear(), playfair_tables(args.key)), args.repeat)
+
+    rows = [
+        ("encrypt", lambda: legacy_playfair_encrypt(text, args.key), lambda: playfair_encrypt(text, args.key)),
+        ("decrypt", lambda: legacy_playfair_decrypt(cipher, args.key), lambda: playfair_decrypt(cipher, args.key)),
+    ]
+    print(f"metin: {args.size} bayt, anahtar: {args.key!r}, en iyi {args.repeat} ölçüm")
+    for name, legacy, table in rows:
+        old = best_of(legacy, args.repeat)
+        new = best_of(table, args.repeat)
+        print(f"{name:8} eski {old * 1000:9.2f} ms   tablo {new * 1000:8.2f} ms   hızlanma x{old / new:5.1f}")
+    print(f"anahtar başına tablo kurulumu: {setup * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+asyncio.start_server tabanlı TCP dinleyici. Flask-SocketIO "threading"
+modunda kaldığından dinleyici kendi event loop'unu bir arka plan
+thread'inde çalıştırır. Boştaki bir bağlantı yalnızca bir StreamReader /
+StreamWriter çifti tutar; binlerce bağlantı için thread gerekmez.
+
+Mesajlar framing.FrameParser ile ayrılır (çerçeveli veya eski biçim); bir
+okumadan çıkan tüm mesajlar tek executor çağrısında işlenir ve yanıtları
+tek yazımda döner.
+
+Geri basınç: bir bağlantıda mesajlar işlenirken sonraki okuma yapılmaz; okuma tamponu
+READ_HIGH_WATER'ın iki katını aşınca transport okumayı durdurur ve TCP
+penceresi dolar. Yazma tamponu WRITE_HIGH_WATER'ı aşınca drain() bekler.
+Çözme gibi CPU işleri executor'da çalışır, event loop bloklanmaz.
+"""
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from framing import DETECT_TIMEOUT, READ_SIZE, FrameParser
+
+READ_HIGH_WATER = 64 * 1024
+WRITE_HIGH_WATER = 64 * 1024
+WRITE_LOW_WATER = 16 * 1024
+MAX_CONNECTIONS = 4096
+LISTEN_BACKLOG = 1024
+EXECUTOR_WORKERS = 8
+
+
+class AsyncListener:
+    """
+    on_data(mesaj bytes) -> yanıt bytes veya None; executor thread'inde,
+    bağlantı başına sırayla çağrılır. max_connections aşılınca yeni bağlantı kapatılır.
+    """
+
+    def __init__(self, on_data, max_connections=MAX_CONNECTIONS, executor=None):
+        if max_connections < 1:
+            raise ValueError("max_connections en az 1 olmalı")
+        self.on_data = on_data
+        self.max_connections = max_connections
+        self._own_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=EXECUTOR_WORKERS, thread_name_prefix="listener-cpu")
+        self._loop = None
+        self._server = None
+        self._thread = None
+        self._writers = set()
+        # sayaçlar ve _writers yalnızca event loop thread'inde değişir
+        self.active = 0
+        self.served = 0
+        self.rejected = 0
+
+    @property
+    def running(self):
+        return self._server is not None and self._server.is_serving()
+
+    def start(self, host, port, timeout=5.0):
+        """Arka planda dinlemeye başlar; bind hatası (port dolu vb.) burada fırlatılır."""
+        ready = Future()
+        self._thread = threading.Thread(target=self._run, args=(host, int(port), ready),
+                                        name="async-listener", daemon=True)
+        self._thread.start()
+        ready.result(timeout)
+
+    def _run(self, host, port, ready):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            self._server = loop.run_until_complete(asyncio.start_server(
+                self._handle, host, port, limit=READ_HIGH_WATER,
+                backlog=LISTEN_BACKLOG, reuse_address=True))
+        except Exception as e:
+            loop.close()
+            ready.set_exception(e)
+            return
+        self._loop = loop
+        ready.set_result(None)
+        try:
+            loop.run_until_complete(self._server.serve_forever())
+        except asyncio.CancelledError:
+            pass
+        finally:
+            # açık bağlantılar kapatılır; görevler EOF görüp kendiliğinden biter
+            for writer in list(self._writers):
+                writer.close()
+            tasks = asyncio.all_tasks(loop)
+            loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            loop.close()
+            if self._own_executor:
+                self._executor.shutdown(wait=False)
+
+    async def _handle(self, reader, writer):
+        if self.active >= self.max_connections:
+            self.rejected += 1
+            writer.close()
+            return
+        self.active += 1
+        self._writers.add(writer)
+        writer.transport.set_write_buffer_limits(high=WRITE_HIGH_WATER, low=WRITE_LOW_WATER)
+        loop = asyncio.get_running_loop()
+        parser = FrameParser()
+        try:
+            while True:
+                try:
+                    data = await asyncio.wait_for(
+                        reader.read(READ_SIZE), DETECT_TIMEOUT if parser.detecting else None)
+                except asyncio.TimeoutError:
+                    # ön ekin başıyla aynı eski biçimli mesaj; karşı taraf OK bekliyor
+                    data, frames = None, parser.expire()
+                else:
+                    frames = parser.feed(data) if data else parser.flush()
+                if frames:
+                    reply = await loop.run_in_executor(self._executor, self._process, frames)
+                    if reply:
+                        writer.write(reply)
+                        await writer.drain()
+                if data == b"":
+                    break
+        except Exception:
+            pass
+        finally:
+            self.active -= 1
+            self.served += 1
+            self._writers.discard(writer)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except Exception:
+                pass
+
+    def _process(self, frames):
+        return b"".join(filter(None, map(self.on_data, frames)))
+
+    def stop(self):
+        """Dinlemeyi bırakır; serve_forever iptal edilir ve loop kapanır."""
+        if self._loop is not None and self._server is not None:
+            self._loop.call_soon_threadsafe(self._server.close)
+
+    def stats(self):
+        return {"mode": "asyncio", "active": self.active, "served": self.served,
+                "rejected": self.rejected, "max_connections": self.max_connections}
@@ -0,0 +1,218 @@
+import math
+from time import perf_counter_ns
+
+from crypto_algorithms import (
+    caesar_encrypt, caesar_decrypt,
+    vigenere_encrypt, vigenere_decrypt,
+    substitution_encrypt, substitution_decrypt,
+    affine_encrypt, affine_decrypt,
+    playfair_encrypt, playfair_decrypt,
+    rail_fence_encrypt, rail_fence_decrypt,
+    route_encrypt, route_decrypt,
+    columnar_encrypt, columnar_decrypt,
+    polybius_encrypt, polybius_decrypt,
+    pigpen_encrypt, pigpen_decrypt,
+    hill_prepare_key, hill_apply,
+    des_encrypt_message, des_decrypt_message,
+    des_encrypt_message_lib, des_decrypt_message_lib,
+    aes_encrypt_message, aes_decrypt_message,
+    aes_encrypt_message_lib, aes_decrypt_message_lib,
+)
+from aes_from_scratch import aes_ctr_encrypt_message, aes_ctr_decrypt_message
+from cipher_pipeline import PIPELINE_SEPARATOR, PipelineCipher
+from lru import LRUCache
+from timing import PhaseTimer, TimingStats
+
+SUBSTITUTION_KEY_MAP = {chr(97 + i): chr(97 + ((i + 5) % 26)) for i in range(26)}
+
+
+class Cipher:
+    """
+    Bir algoritmanın anahtar hazırlama ve şifreleme adımları.
+    encrypt/decrypt her zaman (metin, süre) döndürür; timer verilirse fazlar
+    ona eklenir, verilmezse yalnızca toplam süre ölçülür. timed=True
+    fonksiyonlar (anahtar, metin, timer) alıp fazları kendileri ayırır,
+    diğerlerinin tüm süresi "core" sayılır.
+    """
+
+    def __init__(self, name, encrypt, decrypt, prepare=None, default_key=None, timed=False):
+        self.name = name
+        self.default_key = default_key
+        self.timed = timed
+        self._encrypt = encrypt
+        self._decrypt = decrypt
+        self._prepare = prepare
+
+    def prepare(self, key):
+        key = key if key else self.default_key
+        return self._prepare(key) if self._prepare else key
+
+    def _run(self, func, prepared, text, timer):
+        if self.timed:
+            return func(prepared, text, timer)
+        if timer is None:
+            start = perf_counter_ns()
+            result = func(prepared, text)
+            return (result, (perf_counter_ns() - start) / 1e9)
+        result = func(prepared, text)
+        timer.lap("core")
+        return (result, timer.seconds)
+
+    def encrypt(self, prepared, text, timer=None):
+        return self._run(self._encrypt, prepared, text, timer)
+
+    def decrypt(self, prepared, text, timer=None):
+        return self._run(self._decrypt, prepared, text, timer)
+
+
+class CipherRegistry:
+    def __init__(self, maxsize=256):
+        self._ciphers = {}
+        self._prepared = LRUCache(maxsize)
+        self.timings = TimingStats()
+
+    def register(self, cipher):
+        self._ciphers[cipher.name] = cipher
+        return cipher
+
+    def get(self, name):
+        cipher = self._ciphers.get(name)
+        if cipher is None and name and PIPELINE_SEPARATOR in name:
+            cipher = PipelineCipher(self, name)
+        return cipher
+
+    def names(self):
+        return list(self._ciphers)
+
+    def prepare(self, name, key=None):
+        cipher = self.get(name)
+        if cipher is None:
+            raise ValueError(f"Bilinmeyen algoritma: {name}")
+        return self._prepare(cipher, name, key)
+
+    def _prepare(self, cipher, name, key):
+        return self._prepared.get_or_create((name, key), lambda: cipher.prepare(key))
+
+    def _call_timed(self, op, name, key, text):
+        timer = PhaseTimer()
+        cipher = self.get(name)
+        if cipher is None:
+            return (text, None)
+        prepared = self._prepare(cipher, name, key)
+        timer.lap("key")
+        result = getattr(cipher, op)(prepared, text, timer)[0]
+        self.timings.record(name, op, timer.phases)
+        return (result, timer)
+
+    def _call(self, op, name, key, text):
+        cipher = self.get(name)
+        if cipher is None:
+            return (text, 0.0)
+        return getattr(cipher, op)(self._prepare(cipher, name, key), text)
+
+    def encrypt_timed(self, name, key, text):
+        """
+        (metin, PhaseTimer); fazlar timings'e kaydedilir. Bilinmeyen
+        algoritmada metin aynen, timer None döner.
+        """
+        return self._call_timed("encrypt", name, key, text)
+
+    def decrypt_timed(self, name, key, text):
+        return self._call_timed("decrypt", name, key, text)
+
+    def encrypt(self, name, key, text):
+        """(metin, saniye); faz ölçümü ve kayıt yapılmaz, küçük mesajlarda ek yük olmaz."""
+        return self._call("encrypt", name, key, text)
+
+    def decrypt(self, name, key, text):
+        return self._call("decrypt", name, key, text)
+
+    def stats(self):
+        return self._prepared.stats()
+
+
+def parse_affine_key(key):
+    if not key or "," not in key:
+        raise ValueError("Affine anahtarı a,b şeklinde olmalı")
+    a, b = map(int, key.split(","))
+    if math.gcd(a, 26) != 1:
+        raise ValueError(f"a={a} 26 ile aralarında asal değil!")
+    return a, b
+
+
+def build_default_registry():
+    registry = CipherRegistry()
+    register = registry.register
+
+    register(Cipher("caesar",
+                    lambda shift, text: caesar_encrypt(text, shift),
+                    lambda shift, text: caesar_decrypt(text, shift),
+                    prepare=int, default_key="3"))
+    register(Cipher("vigenere",
+                    lambda key, text: vigenere_encrypt(text, key),
+                    lambda key, text: vigenere_decrypt(text, key),
+                    default_key="anahtar"))
+    register(Cipher("substitution",
+                    lambda key_map, text: substitution_encrypt(text, key_map),
+                    lambda key_map, text: substitution_decrypt(text, key_map),
+                    prepare=lambda key: SUBSTITUTION_KEY_MAP))
+    register(Cipher("affine",
+                    lambda ab, text: affine_encrypt(text, *ab),
+                    lambda ab, text: affine_decrypt(text, *ab),
+                    prepare=parse_affine_key))
+    register(Cipher("playfair",
+                    lambda key, text: playfair_encrypt(text, key),
+                    lambda key, text: playfair_decrypt(text, key),
+                    default_key="monarchy"))
+    register(Cipher("railfence",
+                    lambda rails, text: rail_fence_encrypt(text, rails),
+                    lambda rails, text: rail_fence_decrypt(text, rails),
+                    prepare=int, default_key="2"))
+    register(Cipher("route",
+                    lambda cols, text: route_encrypt(text, cols),
+                    lambda cols, text: route_decrypt(text, cols),
+                    prepare=int, default_key="5"))
+    register(Cipher("columnar",
+                    lambda key, text: columnar_encrypt(text, key),
+                    lambda key, text: columnar_decrypt(text, key),
+                    default_key="TRUVA"))
+    register(Cipher("polybius",
+                    lambda _, text: polybius_encrypt(text),
+                    lambda _, text: polybius_decrypt(text)))
+    register(Cipher("pigpen",
+                    lambda _, text: pigpen_encrypt(text),
+                    lambda _, text: pigpen_decrypt(text)))
+    register(Cipher("hill",
+                    lambda keys, text: hill_apply(text, keys[0]),
+                    lambda keys, text: hill_apply(text, keys[1]),
+                    prepare=hill_prepare_key, default_key="3 3 2 5"))
+
+    register(Cipher("des",
+                    lambda key, text, timer: des_encrypt_message(text, key, timer),
+                    lambda key, text, timer: des_decrypt_message(text, key, timer),
+                    default_key="despass1", timed=True))
+    register(Cipher("des_lib",
+                    lambda key, text, timer: des_encrypt_message_lib(text, key, timer),
+                    lambda key, text, timer: des_decrypt_message_lib(text, key, timer),
+                    default_key="despass1", timed=True))
+    register(Cipher("aes",
+                    lambda key, text, timer: aes_encrypt_message(text, key, timer),
+                    lambda key, text, timer: aes_decrypt_message(text, key, timer),
+                    default_key="aespass123", timed=True))
+    register(Cipher("aes_ctr",
+                    lambda key, text, timer: aes_ctr_encrypt_message(text, key, timer),
+                    lambda key, text, timer: aes_ctr_decrypt_message(text, key, timer),
+                    default_key="aespass123", timed=True))
+    register(Cipher("aes_lib",
+                    lambda key, text, timer: aes_encrypt_message_lib(text, key, timer),
+                    lambda key, text, timer: aes_decrypt_message_lib(text, key, timer),
+                    default_key="aespass123", timed=True))
+    # anahtar, RSA ile kurulan oturum anahtarından çağıran tarafça verilir
+    register(Cipher("aes_session",
+                    lambda key, text, timer: aes_encrypt_message(text, key, timer),
+                    lambda key, text, timer: aes_decrypt_message(text, key, timer),
+                    timed=True))
+    return registry
+
+
+REGISTRY = build_default_registry()
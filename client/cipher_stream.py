@@ -0,0 +1,219 @@
+"""
+Klasik şifreler için update(chunk)/finalize() ile parça parça şifreleme.
+Parçalar arası durum nesnede tutulur; çıktı tek seferlik şifrelemeyle aynıdır.
+Transpozisyonlar uzunluğa bağlı olduğundan finalize'a kadar tamponlanır ya da
+block_size ile bağımsız bloklar halinde işlenir (iki taraf aynı değeri kullanmalı).
+"""
+from abc import ABC, abstractmethod
+
+from crypto_algorithms import (
+    normalize_text, caesar_encrypt, caesar_decrypt, affine_encrypt, affine_decrypt,
+    substitution_encrypt, substitution_decrypt, vigenere_shifts, vigenere_transform,
+    playfair_tables, playfair_letters, playfair_digraphs,
+    rail_fence_encrypt, rail_fence_decrypt, route_encrypt, route_decrypt,
+    columnar_encrypt, columnar_decrypt, transposition_width,
+    polybius_encrypt, polybius_decode, pigpen_encrypt, pigpen_decrypt, hill_apply,
+)
+from cipher_registry import REGISTRY
+
+
+class StreamCipher(ABC):
+    @abstractmethod
+    def update(self, chunk):
+        ...
+
+    def finalize(self):
+        return ""
+
+
+class MapStream(StreamCipher):
+    """Her karakteri bağımsız dönüştüren şifreler (Caesar, Affine, Substitution, Polybius, Pigpen)."""
+
+    def __init__(self, func):
+        self.func = func
+
+    def update(self, chunk):
+        return self.func(chunk)
+
+
+class VigenereStream(StreamCipher):
+    def __init__(self, key, sign):
+        self.shifts = vigenere_shifts(key)
+        self.sign = sign
+        self.key_index = 0
+
+    def update(self, chunk):
+        out, self.key_index = vigenere_transform(normalize_text(chunk), self.shifts, self.sign, self.key_index)
+        return out
+
+
+class PlayfairEncryptStream(StreamCipher):
+    def __init__(self, key):
+        self.table = playfair_tables(key)[0]
+        self.pending = ""
+
+    def update(self, chunk):
+        pairs, self.pending = playfair_digraphs(self.pending + playfair_letters(chunk))
+        return "".join([self.table[pair] for pair in pairs])
+
+    def finalize(self):
+        pending, self.pending = self.pending, ""
+        return self.table[pending + "x"] if pending else ""
+
+
+class PlayfairDecryptStream(StreamCipher):
+    def __init__(self, key):
+        self.table = playfair_tables(key)[1]
+        self.pending = ""
+
+    def update(self, chunk):
+        text = self.pending + normalize_text(chunk.lower().replace("j", "i"))
+        end = len(text) - len(text) % 2
+        self.pending = text[end:]
+        return "".join([self.table[text[i:i + 2]] for i in range(0, end, 2)])
+
+    def finalize(self):
+        if self.pending:
+            raise ValueError("Playfair şifreli metni çift sayıda harf içermeli")
+        return ""
+
+
+class HillStream(StreamCipher):
+    def __init__(self, matrix):
+        self.matrix = matrix
+        self.size = len(matrix)
+        self.pending = ""
+
+    def update(self, chunk):
+        text = normalize_text(chunk).lower()
+        letters = self.pending + "".join([ch for ch in text if ch.isalpha()])
+        end = len(letters) - len(letters) % self.size
+        self.pending = letters[end:]
+        return hill_apply(letters[:end], self.matrix) if end else ""
+
+    def finalize(self):
+        pending, self.pending = self.pending, ""
+        return hill_apply(pending, self.matrix) if pending else ""
+
+
+class PolybiusDecryptStream(StreamCipher):
+    def __init__(self):
+        self.pending = ""
+
+    def update(self, chunk):
+        out, self.pending = polybius_decode(self.pending + chunk.replace(" ", ""))
+        return out
+
+    def finalize(self):
+        self.pending = ""
+        return ""
+
+
+class BlockStream(StreamCipher):
+    """
+    Transpozisyonlar: block_size yoksa tüm metin finalize'da işlenir;
+    varsa her tam blok (genişliğin katına yuvarlanmış) hemen işlenir.
+    """
+
+    def __init__(self, func, width=1, block_size=None, preprocess=None):
+        self.func = func
+        self.preprocess = preprocess
+        self.block_size = max(width, block_size // width * width) if block_size else None
+        self.buffer = []
+        self.buffered = 0
+
+    def update(self, chunk):
+        if self.preprocess:
+            chunk = self.preprocess(chunk)
+        self.buffer.append(chunk)
+        self.buffered += len(chunk)
+        if not self.block_size or self.buffered < self.block_size:
+            return ""
+        text = "".join(self.buffer)
+        end = len(text) - len(text) % self.block_size
+        self.buffer = [text[end:]]
+        self.buffered = len(text) - end
+        return "".join(self.func(text[i:i + self.block_size]) for i in range(0, end, self.block_size))
+
+    def finalize(self):
+        text = "".join(self.buffer)
+        self.buffer = []
+        self.buffered = 0
+        return self.func(text) if text else ""
+
+
+def _strip_upper(chunk):
+    return chunk.replace(" ", "").upper()
+
+
+def _transposition(algorithm, prepared, decrypt, block_size):
+    width = transposition_width(algorithm, prepared.upper() if algorithm == "columnar" else prepared)
+    if algorithm == "railfence":
+        func = rail_fence_decrypt if decrypt else rail_fence_encrypt
+        return BlockStream(lambda t: func(t, prepared), 1, block_size)
+    if algorithm == "route":
+        func = route_decrypt if decrypt else route_encrypt
+    else:
+        func = columnar_decrypt if decrypt else columnar_encrypt
+    return BlockStream(lambda t: func(t, prepared), width, block_size,
+                       preprocess=None if decrypt else _strip_upper)
+
+
+_ENCRYPTORS = {
+    "caesar": lambda shift: MapStream(lambda t: caesar_encrypt(t, shift)),
+    "affine": lambda ab: MapStream(lambda t: affine_encrypt(t, *ab)),
+    "substitution": lambda key_map: MapStream(lambda t: substitution_encrypt(t, key_map)),
+    "vigenere": lambda key: VigenereStream(key, 1),
+    "playfair": PlayfairEncryptStream,
+    "hill": lambda keys: HillStream(keys[0]),
+    "polybius": lambda _: MapStream(polybius_encrypt),
+    "pigpen": lambda _: MapStream(pigpen_encrypt),
+}
+
+_DECRYPTORS = {
+    "caesar": lambda shift: MapStream(lambda t: caesar_decrypt(t, shift)),
+    "affine": lambda ab: MapStream(lambda t: affine_decrypt(t, *ab)),
+    "substitution": lambda key_map: MapStream(lambda t: substitution_decrypt(t, key_map)),
+    "vigenere": lambda key: VigenereStream(key, -1),
+    "playfair": PlayfairDecryptStream,
+    "hill": lambda keys: HillStream(keys[1]),
+    "polybius": lambda _: PolybiusDecryptStream(),
+    "pigpen": lambda _: MapStream(pigpen_decrypt),
+}
+
+TRANSPOSITIONS = ("railfence", "route", "columnar")
+
+
+def _open(algorithm, key, block_size, decrypt):
+    prepared = REGISTRY.prepare(algorithm, key)
+    if algorithm in TRANSPOSITIONS:
+        return _transposition(algorithm, prepared, decrypt, block_size)
+    builders = _DECRYPTORS if decrypt else _ENCRYPTORS
+    if algorithm not in builders:
+        raise ValueError(f"Akış desteklenmeyen algoritma: {algorithm}")
+    return builders[algorithm](prepared)
+
+
+def open_encryptor(algorithm, key=None, block_size=None):
+    return _open(algorithm, key, block_size, decrypt=False)
+
+
+def open_decryptor(algorithm, key=None, block_size=None):
+    return _open(algorithm, key, block_size, decrypt=True)
+
+
+def transform_chunks(stream, chunks):
+    for chunk in chunks:
+        out = stream.update(chunk)
+        if out:
+            yield out
+    out = stream.finalize()
+    if out:
+        yield out
+
+
+def pipe(stream, reader, writer, chunk_size=65536):
+    """Metin dosyası benzeri reader'dan okuyup writer'a sabit bellekle yazar."""
+    chunks = iter(lambda: reader.read(chunk_size), "")
+    for out in transform_chunks(stream, chunks):
+        writer.write(out)
@@ -2,10 +2,18 @@ from flask import Flask, render_template, request, jsonify
 from flask_socketio import SocketIO
 import socket
 import threading
-from crypto_algorithms import *
-import math
+from concurrent.futures import Future
+from cipher_registry import REGISTRY
+from batch import POOL_THRESHOLD, submit_decrypt
+import key_schedule
+from timing import timing_fields
+from pigpen_sprite import sprite_response, sprite_version
 import requests
 from rsa_key_exchange import rsa_encrypt_key
+from framing import FrameError, FrameParser, encode_frame, read_frames
+from connection_pool import ConnectionPool
+from send_batch import encrypt_items, parse_items, send_grouped
+from async_listener import AsyncListener
 
 app = Flask(__name__)
 socketio = SocketIO(app, async_mode="threading", cors_allowed_origins="*")
@@ -13,22 +21,27 @@ socketio = SocketIO(app, async_mode="threading", cors_allowed_origins="*")
 CURRENT_IP = None
 CURRENT_PORT = None
 SESSION_AES_KEY = None
+# aes_session için parola biçimi; anahtar kurulurken bir kez çözülür
+SESSION_AES_PASSWORD = None
 
 incoming_messages = []
 
+# "asyncio" veya "blocking"; /update_config'te listener_mode ile seçilebilir
+LISTENER_MODE = "asyncio"
 listener_thread = None
 listener_socket = None
 listener_running = False
+async_listener = None
 
-client_socket = None
-client_connected = False
+# sunucuya giden kalıcı bağlantılar; kopan bağlantı bir sonraki mesajda yenilenir
+outbound = ConnectionPool()
 
 CURRENT_DECRYPT_ALGO = None
 CURRENT_DECRYPT_KEY = None
 
 @app.route("/rsa/setup", methods=["POST"])
 def rsa_setup():
-    global SESSION_AES_KEY
+    global SESSION_AES_KEY, SESSION_AES_PASSWORD
     server_http = request.form.get("server_http")
     aes_password = request.form.get("aes_password")
 
@@ -41,6 +54,7 @@ def rsa_setup():
     elif len(b) > 16:
         b = b[:16]
     SESSION_AES_KEY = b
+    SESSION_AES_PASSWORD = b.decode("utf-8", errors="ignore")
 
     try:
         r = requests.get(f"{server_http}/rsa/public_key", timeout=10)
@@ -54,112 +68,106 @@ def rsa_setup():
     except Exception as e:
         return jsonify({"success": False, "error": str(e)})
 
+def session_key(algorithm, key):
+    if algorithm != "aes_session":
+        return key
+    if SESSION_AES_KEY is None:
+        raise ValueError("Önce RSA ile AES anahtarı kurulmalı.")
+    return SESSION_AES_PASSWORD
+
 def decrypt_message(algorithm, text, key=None):
+    """(düz metin, fazlar); fazlar ns cinsinden PhaseTimer sözlüğü, hata varsa None."""
     try:
         if not algorithm:
-            return (text, 0.0)
-
-        if algorithm == "caesar":
-            shift = int(key) if key else 3
-            return (caesar_decrypt(text, shift), 0.0)
-        elif algorithm == "vigenere":
-            key = key if key else "anahtar"
-            return (vigenere_decrypt(text, key), 0.0)
-        elif algorithm == "substitution":
-            key_map = {chr(97 + i): chr(97 + ((i + 5) % 26)) for i in range(26)}
-            return (substitution_decrypt(text, key_map), 0.0)
-        elif algorithm == "affine":
-            if not key or "," not in key:
-                return ("Hatalı affine anahtarı!", 0.0)
-            a, b = map(int, key.split(","))
-            if math.gcd(a, 26) != 1:
-                return (f"a={a} 26 ile aralarında asal değil!", 0.0)
-            return (affine_decrypt(text, a, b), 0.0)
-        elif algorithm == "playfair":
-            key = key if key else "monarchy"
-            return (playfair_decrypt(text, key), 0.0)
-        elif algorithm == "railfence":
-            key = int(key) if key else 2
-            return (rail_fence_decrypt(text, key), 0.0)
-        elif algorithm == "route":
-            cols = int(key) if key else 5
-            return (route_decrypt(text, cols), 0.0)
-        elif algorithm == "columnar":
-            key = key if key else "TRUVA"
-            return (columnar_decrypt(text, key), 0.0)
-        elif algorithm == "polybius":
-            return (polybius_decrypt(text), 0.0)
-        elif algorithm == "pigpen":
-            return (pigpen_decrypt(text), 0.0)
-        elif algorithm == "hill":
-            key = key if key else "3 3 2 5"
-            return (hill_decrypt(text, key), 0.0)
-        elif algorithm == "des":
-            key = key if key else "despass1"
-            return des_decrypt_message(text, key)
-        elif algorithm == "des_lib":
-            key = key if key else "despass1"
-            return des_decrypt_message_lib(text, key)
-        elif algorithm == "aes":
-            key = key if key else "aespass123"
-            return aes_decrypt_message(text, key)
-        elif algorithm == "aes_lib":
-            key = key if key else "aespass123"
-            return aes_decrypt_message_lib(text, key)
-        elif algorithm == "aes_session":
-            if SESSION_AES_KEY is None:
-                return ("Hata: RSA ile AES anahtarı kurulmadı (SESSION_AES_KEY boş)", 0.0)
-            return aes_decrypt_message(text, SESSION_AES_KEY.decode("utf-8", errors="ignore"))
-        else:
-            return (text, 0.0)
+            return (text, None)
+        if algorithm == "aes_session" and SESSION_AES_KEY is None:
+            return ("Hata: RSA ile AES anahtarı kurulmadı (SESSION_AES_KEY boş)", None)
+        key = session_key(algorithm, key)
+        if len(text) >= POOL_THRESHOLD:
+            # büyük mesajlar GIL'i tutmasın diye süreç havuzunda çözülür
+            result = submit_decrypt(algorithm, key, text).result()
+            if result.error is not None:
+                return (f"Hata: {result.error}", None)
+            if result.phases is not None:
+                REGISTRY.timings.record(algorithm, "decrypt", result.phases)
+            return (result.text, result.phases)
+        text, timer = REGISTRY.decrypt_timed(algorithm, key, text)
+        return (text, timer.phases if timer else None)
     except Exception as e:
-        return (f"Hata: {e}", 0.0)
-
-def start_client_listener(ip, port):
-    global listener_thread, listener_socket, listener_running
+        return (f"Hata: {e}", None)
+
+def process_incoming(raw):
+    """Sunucudan gelen tek mesajı çözer ve arayüze yollar; yanıt gönderilmez."""
+    data = raw.decode("utf-8", errors="replace").strip()
+
+    algorithm = CURRENT_DECRYPT_ALGO
+    key = CURRENT_DECRYPT_KEY
+    encrypted_text = data
+
+    parts = data.split("||", 2)
+    if len(parts) == 3:
+        algorithm, key, encrypted_text = parts[0], parts[1], parts[2]
+        if key == "":
+            key = None
+
+    decrypted, decrypt_phases = decrypt_message(algorithm, encrypted_text, key)
+
+    msg_data = {
+        "from": "server",
+        "algorithm": algorithm or "unknown",
+        "key": key or "-",
+        "encrypted": encrypted_text,
+        "decrypted": decrypted,
+        **timing_fields("decrypt", decrypt_phases),
+    }
+
+    incoming_messages.append(msg_data)
+    socketio.emit("incoming_new", msg_data)
+
+def start_client_listener(ip, port, mode=None):
+    """
+    mode "asyncio" (varsayılan) veya "blocking" (tek thread'li yedek mod).
+    Her iki modda da bind/listen hatası çağırana fırlatılır.
+    """
+    global listener_thread, listener_socket, listener_running, async_listener
     if listener_running:
         return
+    mode = mode or LISTENER_MODE
+    if mode == "asyncio":
+        async_listener = AsyncListener(process_incoming)
+        async_listener.start("0.0.0.0", port)
+        listener_running = True
+        return
+    if mode != "blocking":
+        raise ValueError(f"Bilinmeyen dinleyici modu: {mode}")
 
-    def listener():
+    def listener(bind_port, ready):
         global listener_socket, listener_running
+        listener_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         try:
-            listener_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             listener_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            listener_socket.bind(("0.0.0.0", int(port)))
+            listener_socket.bind(("0.0.0.0", int(bind_port)))
             listener_socket.listen(5)
+        except Exception as e:
+            listener_socket.close()
+            ready.set_exception(e)
+            return
+        try:
             listener_running = True
+            ready.set_result(None)
 
             while True:
                 conn, addr = listener_socket.accept()
+                parser = FrameParser()
                 while True:
-                    raw = conn.recv(4096)
-                    if not raw:
+                    try:
+                        raw, frames = read_frames(conn, parser)
+                    except (OSError, FrameError):
+                        break
+                    for frame in frames:
+                        process_incoming(frame)
+                    if raw == b"":
                         break
-                    data = raw.decode("utf-8", errors="replace").strip()
-
-                    algorithm = CURRENT_DECRYPT_ALGO
-                    key = CURRENT_DECRYPT_KEY
-                    encrypted_text = data
-
-                    parts = data.split("||", 2)
-                    if len(parts) == 3:
-                        algorithm, key, encrypted_text = parts[0], parts[1], parts[2]
-                        if key == "":
-                            key = None
-
-                    decrypted, decrypt_time = decrypt_message(algorithm, encrypted_text, key)
-
-                    msg_data = {
-                        "from": "server",
-                        "algorithm": algorithm or "unknown",
-                        "key": key or "-",
-                        "encrypted": encrypted_text,
-                        "decrypted": decrypted,
-                        "decrypt_time": f"{decrypt_time:.6f}" if decrypt_time > 0 else None
-                    }
-
-                    incoming_messages.append(msg_data)
-                    socketio.emit("incoming_new", msg_data)
 
                 conn.close()
         except OSError:
@@ -167,74 +175,17 @@ def start_client_listener(ip, port):
         finally:
             listener_running = False
 
-    listener_thread = threading.Thread(target=listener, daemon=True)
+    ready = Future()
+    listener_thread = threading.Thread(target=listener, args=(port, ready), daemon=True)
     listener_thread.start()
+    ready.result(5.0)
 
 def send_message(ip, port, message, algorithm="caesar", key=None):
-    global client_socket, client_connected
     try:
-        if not client_connected:
-            client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            client_socket.connect((ip, int(port)))
-            client_connected = True
-
-        encrypt_time = 0.0
-        if algorithm == "caesar":
-            shift = int(key) if key else 3
-            encrypted = caesar_encrypt(message, shift)
-        elif algorithm == "vigenere":
-            key = key if key else "anahtar"
-            encrypted = vigenere_encrypt(message, key)
-        elif algorithm == "substitution":
-            key_map = {chr(97 + i): chr(97 + ((i + 5) % 26)) for i in range(26)}
-            encrypted = substitution_encrypt(message, key_map)
-        elif algorithm == "affine":
-            if not key or "," not in key:
-                raise ValueError("Affine anahtarı a,b şeklinde olmalı!")
-            a, b = map(int, key.split(","))
-            if math.gcd(a, 26) != 1:
-                raise ValueError(f"a={a} 26 ile aralarında asal değil!")
-            encrypted = affine_encrypt(message, a, b)
-        elif algorithm == "playfair":
-            key = key if key else "monarchy"
-            encrypted = playfair_encrypt(message, key)
-        elif algorithm == "railfence":
-            key = int(key) if key else 2
-            encrypted = rail_fence_encrypt(message, key)
-        elif algorithm == "route":
-            cols = int(key) if key else 5
-            encrypted = route_encrypt(message, cols)
-        elif algorithm == "columnar":
-            key = key if key else "TRUVA"
-            encrypted = columnar_encrypt(message, key)
-        elif algorithm == "polybius":
-            encrypted = polybius_encrypt(message)
-        elif algorithm == "pigpen":
-            encrypted = pigpen_encrypt(message)
-        elif algorithm == "hill":
-            key = key if key else "3 3 2 5"
-            encrypted = hill_encrypt(message, key)
-        elif algorithm == "des":
-            key = key if key else "despass1"
-            encrypted, encrypt_time = des_encrypt_message(message, key)
-        elif algorithm == "des_lib":
-            key = key if key else "despass1"
-            encrypted, encrypt_time = des_encrypt_message_lib(message, key)
-        elif algorithm == "aes":
-            key = key if key else "aespass123"
-            encrypted, encrypt_time = aes_encrypt_message(message, key)
-        elif algorithm == "aes_lib":
-            key = key if key else "aespass123"
-            encrypted, encrypt_time = aes_encrypt_message_lib(message, key)
-        elif algorithm == "aes_session":
-            if SESSION_AES_KEY is None:
-                return "Hata: Önce RSA ile AES anahtarı kurulmalı."
-            encrypted, encrypt_time = aes_encrypt_message(message, SESSION_AES_KEY.decode("utf-8", errors="ignore"))
-        else:
-            encrypted = message
+        encrypted, timer = REGISTRY.encrypt_timed(algorithm, session_key(algorithm, key), message)
 
         payload = f"{algorithm}||{key or ''}||{encrypted}"
-        client_socket.send(payload.encode("utf-8"))
+        outbound.send(ip, port, encode_frame(payload.encode("utf-8")))
 
         msg_data = {
             "from": "client",
@@ -242,7 +193,7 @@ def send_message(ip, port, message, algorithm="caesar", key=None):
             "key": key or "-",
             "encrypted": encrypted,
             "decrypted": message,
-            "encrypt_time": f"{encrypt_time:.6f}" if encrypt_time > 0 else None
+            **timing_fields("encrypt", timer.phases if timer else None),
         }
         incoming_messages.append(msg_data)
         socketio.emit("incoming_new", msg_data)
@@ -259,7 +210,10 @@ def update_config():
         return jsonify({"status": "error", "message": "IP veya Port eksik!"})
 
     CURRENT_PORT = int(CURRENT_PORT)
-    start_client_listener(CURRENT_IP, CURRENT_PORT)
+    try:
+        start_client_listener(CURRENT_IP, CURRENT_PORT, request.form.get("listener_mode") or None)
+    except (OSError, ValueError) as e:
+        return jsonify({"status": "error", "message": str(e)})
     return jsonify({"status": "ok", "ip": CURRENT_IP, "port": CURRENT_PORT})
 
 @app.route("/send_message", methods=["POST"])
@@ -277,6 +231,34 @@ def send_message_ajax():
     success = not str(response).startswith("Hata:")
     return jsonify({"success": success, "response": response})
 
+@app.route("/send_batch", methods=["POST"])
+def send_batch():
+    """JSON: öğe listesi veya {"items": [...], "target": "ip:port"}; öğe başına sonuç döner."""
+    try:
+        items = parse_items(request.get_json(silent=True))
+    except ValueError as e:
+        return jsonify({"success": False, "error": str(e)})
+
+    encrypt_items(items, session_key)
+    send_grouped(outbound, items)
+
+    for item in items:
+        if item.ok:
+            msg_data = {
+                "from": "client",
+                "algorithm": item.algorithm,
+                "key": item.key or "-",
+                "encrypted": item.encrypted,
+                "decrypted": item.message,
+                **timing_fields("encrypt", item.phases),
+            }
+            incoming_messages.append(msg_data)
+            socketio.emit("incoming_new", msg_data)
+
+    results = [item.result() for item in items]
+    return jsonify({"success": all(r["success"] for r in results),
+                    "sent": sum(r["success"] for r in results), "results": results})
+
 @app.route("/update_decryption_algo", methods=["POST"])
 def update_decryption_algo():
     global CURRENT_DECRYPT_ALGO, CURRENT_DECRYPT_KEY
@@ -292,7 +274,23 @@ def clear_messages():
 
 @app.route("/")
 def index():
-    return render_template("client.html", ip=CURRENT_IP, port=CURRENT_PORT)
+    return render_template("client.html", ip=CURRENT_IP, port=CURRENT_PORT,
+                           pigpen_version=sprite_version(app))
+
+@app.route("/pigpen/sprite.svg")
+def pigpen_sprite():
+    return sprite_response(app)
+
+@app.route("/cache_stats", methods=["GET"])
+def cache_stats():
+    return jsonify({"prepared_keys": REGISTRY.stats(), "key_schedules": key_schedule.stats(),
+                    "listener": async_listener.stats() if async_listener else None,
+                    "outbound": outbound.stats()})
+
+@app.route("/timing_stats", methods=["GET"])
+def timing_stats():
+    """Algoritma ve işlem başına son ölçümlerin faz ortalamaları, p50/p99 ve histogramı."""
+    return jsonify(REGISTRY.timings.summary())
 
 if __name__ == "__main__":
     socketio.run(app, host="0.0.0.0", port=5001)
@@ -0,0 +1,233 @@
+"""
+Giden bağlantı havuzu: (ip, port) başına bir kalıcı, çerçeveli TCP bağlantısı.
+MAGIC ön eki bağlantı açılırken bir kez gönderilir, sonraki mesajlar yalnızca
+çerçevedir; böylece her mesajda el sıkışma ve TIME_WAIT oluşmaz.
+
+- Kullanım öncesi sağlık kontrolü: karşının yolladığı "OK" onayları bloklamadan
+  okunup atılır; recv b"" dönerse karşı taraf kapatmıştır, bağlantı yenilenir.
+- Kopuk bağlantı yazımın ilk baytında fark edilirse (hiç veri gitmeden) bir
+  kez yeniden bağlanılıp aynı veri gönderilir. Bir kısmı yazıldıktan sonra
+  koparsa tekrar gönderilmez (çerçeveler çift gidebilir); PartialSendError
+  fırlatılır, karşıya ne kadarının ulaştığı bilinmez.
+- idle_timeout'tan uzun süre kullanılmayan bağlantılar bir sonraki
+  çağrıda kapatılır; en fazla max_connections bağlantı tutulur (en eski boşta
+  olan kapanır, yazım sürenler atlanır).
+- SO_KEEPALIVE açıktır; uzun boşlukta ölen bağlantıları çekirdek de fark eder.
+- Yazım send_timeout ile sınırlıdır; karşı taraf okumuyorsa bağlantı kilidi
+  süresiz tutulmaz. Süre dolan yazım başarısız sayılır, bağlantı atılır ve
+  tekrar denenmez.
+
+Aynı hedefe yazımlar bağlantı kilidiyle sıralanır, çerçeveler karışmaz.
+"""
+import socket
+import threading
+import time
+from collections import OrderedDict
+
+from framing import MAGIC
+
+IDLE_TIMEOUT = 60.0
+MAX_CONNECTIONS = 64
+CONNECT_TIMEOUT = 5.0
+SEND_TIMEOUT = 10.0
+KEEPALIVE_IDLE = 30
+DRAIN_SIZE = 4096
+
+
+class PartialSendError(ConnectionError):
+    """Veri kısmen yazıldıktan sonra bağlantı koptu; kalanı gönderilmedi."""
+
+    def __init__(self, sent, total, cause):
+        super().__init__(f"Bağlantı {sent}/{total} bayt yazıldıktan sonra koptu: {cause}")
+        self.sent = sent
+        self.total = total
+
+
+class PooledConnection:
+    def __init__(self, addr, timeout, send_timeout=SEND_TIMEOUT):
+        self.addr = addr
+        self.send_timeout = send_timeout
+        self.sock = socket.create_connection(addr, timeout=timeout)
+        try:
+            self.sock.settimeout(send_timeout)
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            if hasattr(socket, "TCP_KEEPIDLE"):
+                self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, KEEPALIVE_IDLE)
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.sock.sendall(MAGIC)
+        except Exception:
+            self.sock.close()
+            raise
+        self.lock = threading.Lock()
+        self.last_used = time.monotonic()
+        self.acks = 0
+        self.closed = False
+
+    def healthy(self):
+        """Bekleyen onayları boşaltır; karşı taraf kapattıysa False."""
+        if self.closed:
+            return False
+        # MSG_DONTWAIT her platformda yok; soket geçici olarak bloklamaz yapılır
+        try:
+            self.sock.setblocking(False)
+            while True:
+                data = self.sock.recv(DRAIN_SIZE)
+                if not data:
+                    return False
+                self.acks += len(data) // 2
+        except (BlockingIOError, InterruptedError):
+            return True
+        except OSError:
+            return False
+        finally:
+            try:
+                self.sock.settimeout(self.send_timeout)
+            except OSError:
+                pass
+
+    def write(self, data):
+        """sendall gibi; hata olursa kaç bayt yazıldığı ayırt edilir. Süre aşımında socket.timeout."""
+        view = memoryview(data)
+        sent = 0
+        try:
+            while sent < len(view):
+                sent += self.sock.send(view[sent:])
+        except OSError as e:
+            if sent:
+                raise PartialSendError(sent, len(view), e) from e
+            raise
+
+    def close(self):
+        self.closed = True
+        try:
+            self.sock.close()
+        except OSError:
+            pass
+
+
+class ConnectionPool:
+    def __init__(self, idle_timeout=IDLE_TIMEOUT, max_connections=MAX_CONNECTIONS,
+                 connect_timeout=CONNECT_TIMEOUT, send_timeout=SEND_TIMEOUT):
+        self.idle_timeout = idle_timeout
+        self.max_connections = max_connections
+        self.connect_timeout = connect_timeout
+        self.send_timeout = send_timeout
+        self._conns = OrderedDict()
+        self._lock = threading.Lock()
+        self.opened = 0
+        self.reused = 0
+        self.reconnects = 0
+        self.evicted = 0
+
+    def send(self, ip, port, data):
+        """
+        data'yı (ip, port) bağlantısına yazar. Bağlantı daha ilk baytta kopuksa
+        bir kez yeniden bağlanır; kısmi yazımda PartialSendError, süre
+        aşımında socket.timeout fırlatır ve bağlantıyı atar.
+        """
+        addr = (ip, int(port))
+        conn = self._get(addr)
+        with conn.lock:
+            if not conn.healthy():
+                conn = self._replace(addr, conn)
+            try:
+                conn.write(data)
+            except (PartialSendError, socket.timeout):
+                self._discard(addr, conn)
+                raise
+            except OSError:
+                conn = self._replace(addr, conn)
+                try:
+                    conn.write(data)
+                except OSError:
+                    self._discard(addr, conn)
+                    raise
+            conn.last_used = time.monotonic()
+
+    def _get(self, addr):
+        with self._lock:
+            self._evict_idle()
+            conn = self._conns.get(addr)
+            if conn is not None:
+                self._conns.move_to_end(addr)
+                self.reused += 1
+                return conn
+        conn = PooledConnection(addr, self.connect_timeout, self.send_timeout)
+        with self._lock:
+            # aynı anda açılmış başka bağlantı varsa o kullanılır
+            existing = self._conns.get(addr)
+            if existing is not None:
+                conn.close()
+                return existing
+            self._conns[addr] = conn
+            self.opened += 1
+            self._evict_oldest(keep=addr)
+        return conn
+
+    def _replace(self, addr, old):
+        """Kilit altındaki kopuk bağlantıyı kapatıp yerine yenisini koyar."""
+        old.close()
+        with self._lock:
+            current = self._conns.get(addr)
+        if current is not None and current is not old and current.lock is old.lock:
+            # kilidi bekleyen başka bir thread zaten yeniledi
+            return current
+        try:
+            new = PooledConnection(addr, self.connect_timeout, self.send_timeout)
+        except OSError:
+            self._discard(addr, old)
+            raise
+        # yeni bağlantı eskinin kilidini devralır; bekleyen yazımlar sıralı kalır
+        new.lock = old.lock
+        with self._lock:
+            self._conns[addr] = new
+            self.reconnects += 1
+            self._evict_oldest(keep=addr)
+        return new
+
+    def _discard(self, addr, conn):
+        """Kopan bağlantıyı havuzdan çıkarır; sonraki gönderim yenisini açar."""
+        conn.close()
+        with self._lock:
+            if self._conns.get(addr) is conn:
+                del self._conns[addr]
+
+    def _evict_oldest(self, keep):
+        """Sınır aşıldıysa en eski boştaki bağlantıları kapatır; yazım sürenler kalır."""
+        excess = len(self._conns) - self.max_connections
+        for addr, conn in list(self._conns.items()):
+            if excess <= 0:
+                break
+            if addr == keep or conn.lock.locked():
+                continue
+            del self._conns[addr]
+            conn.close()
+            self.evicted += 1
+            excess -= 1
+
+    def _evict_idle(self):
+        now = time.monotonic()
+        for addr, conn in list(self._conns.items()):
+            if now - conn.last_used > self.idle_timeout and not conn.lock.locked():
+                del self._conns[addr]
+                conn.close()
+                self.evicted += 1
+
+    def close(self, ip=None, port=None):
+        """Verilen hedefin ya da (argümansız) tüm bağlantıları kapatır."""
+        with self._lock:
+            if ip is None:
+                conns = list(self._conns.values())
+                self._conns.clear()
+            else:
+                conn = self._conns.pop((ip, int(port)), None)
+                conns = [conn] if conn else []
+        for conn in conns:
+            conn.close()
+
+    def stats(self):
+        with self._lock:
+            return {"open": len(self._conns), "opened": self.opened, "reused": self.reused,
+                    "reconnects": self.reconnects, "evicted": self.evicted,
+                    "idle_timeout": self.idle_timeout, "max_connections": self.max_connections,
+                    "send_timeout": self.send_timeout}
@@ -1,7 +1,10 @@
-import time
 from Crypto.Cipher import DES
 from Crypto.Util.Padding import pad, unpad
 
+import key_schedule
+from cipher_context import CipherContext
+from timing import PhaseTimer
+
 def password_to_key_bytes(password: str) -> bytes:
     b = password.encode("utf-8")
     if len(b) < 8:
@@ -10,22 +13,51 @@ def password_to_key_bytes(password: str) -> bytes:
         b = b[:8]
     return b
 
-def des_encrypt_message_lib(message: str, password: str) -> tuple:
-    start_time = time.time()
-    key = password_to_key_bytes(password)
-    cipher = DES.new(key, DES.MODE_ECB)
-    data = pad(message.encode("utf-8"), 8)
-    ct = cipher.encrypt(data)
+class DESContext(CipherContext):
+    """Hazırlanmış DES anahtarı; ECB bayt API'si ve CTR/CBC akışları (GCM yok)."""
+
+    factory = DES
+    block_size = 8
+    pad = staticmethod(pad)
+    unpad = staticmethod(unpad)
+
+def context(password: str) -> DESContext:
+    """Parolanın türetilmiş anahtarı için önbellekteki bağlam."""
+    return key_schedule.cached_schedule("des_lib", password_to_key_bytes(password), DESContext)
+
+def encrypt_bytes(data, password: str, out=None, timer=None):
+    """
+    PKCS7 + ECB, bayt girdi/çıktı. out verilirse (en az len(data)//8*8 + 8
+    bayt) oraya yazılır ve yazılan bayt sayısı döner; verilmezse bytes döner.
+    """
+    ctx = context(password)
+    if timer is not None:
+        timer.lap("key")
+    return ctx.encrypt_bytes(data, out)
+
+def decrypt_bytes(data, password: str, out=None, timer=None):
+    """encrypt_bytes'ın tersi; out en az len(data) bayt olmalı, verilirse düz metin uzunluğu döner."""
+    ctx = context(password)
+    if timer is not None:
+        timer.lap("key")
+    return ctx.decrypt_bytes(data, out)
+
+def des_encrypt_message_lib(message: str, password: str, timer=None) -> tuple:
+    timer = PhaseTimer() if timer is None else timer
+    data = message.encode("utf-8")
+    timer.lap("encode")
+    ct = encrypt_bytes(data, password, timer=timer)
+    timer.lap("core")
     result = ct.hex().upper()
-    elapsed = time.time() - start_time
-    return (result, elapsed)
-
-def des_decrypt_message_lib(cipher_hex: str, password: str) -> tuple:
-    start_time = time.time()
-    key = password_to_key_bytes(password)
-    cipher = DES.new(key, DES.MODE_ECB)
-    ct = bytes.fromhex(cipher_hex)
-    pt = unpad(cipher.decrypt(ct), 8)
+    timer.lap("serialize")
+    return (result, timer.seconds)
+
+def des_decrypt_message_lib(cipher_hex: str, password: str, timer=None) -> tuple:
+    timer = PhaseTimer() if timer is None else timer
+    raw = bytes.fromhex(cipher_hex)
+    timer.lap("serialize")
+    pt = decrypt_bytes(raw, password, timer=timer)
+    timer.lap("core")
     result = pt.decode("utf-8", errors="ignore")
-    elapsed = time.time() - start_time
-    return (result, elapsed)
+    timer.lap("encode")
+    return (result, timer.seconds)
@@ -0,0 +1,132 @@
+"""
+Çerçeveli mesaj protokolü (sürüm 1). Bağlantı MAGIC ön ekiyle başlar,
+ardından her mesaj 4 bayt big-endian uzunluk + gövdedir (utf-8
+"algo||key||cipher"). Gönderen OK beklemeden mesajları art arda
+yollayabilir; alıcı her mesaj için yine 2 baytlık b"OK" döner, böylece
+gönderen onayları sayarak eşleyebilir.
+
+Ön ek ile başlamayan bağlantı eski biçimdedir: her okuma bir mesaj sayılır
+(büyük mesajlar bölünebilir, art arda gönderilenler birleşebilir). Eski
+biçimli bir mesaj ön ekin başıyla aynıysa (ör. b"K") ve karşı taraf OK
+bekliyorsa tespit DETECT_TIMEOUT sonra eski biçime düşer.
+"""
+import socket
+import struct
+
+MAGIC = b"KFRM1\n"
+HEADER = struct.Struct(">I")
+MAX_FRAME = 64 * 1024 * 1024
+# dinleyicilerin tek okumada istediği bayt; çerçeveli modda birçok mesaj sığar
+READ_SIZE = 64 * 1024
+# ön ekin başı alındıktan sonra devamı için beklenen süre (s)
+DETECT_TIMEOUT = 0.5
+
+
+class FrameError(ValueError):
+    pass
+
+
+def encode_frame(payload):
+    if len(payload) > MAX_FRAME:
+        raise FrameError(f"Çerçeve en fazla {MAX_FRAME} bayt olabilir")
+    return HEADER.pack(len(payload)) + payload
+
+
+def encode_frames(payloads):
+    """Birden çok mesajı tek sendall için birleştirir."""
+    return b"".join(encode_frame(p) for p in payloads)
+
+
+class FrameParser:
+    """
+    Akış ayrıştırıcı: feed(veri) tamamlanan mesajların listesini döndürür;
+    tek okumadan birçok mesaj, birçok okumadan tek mesaj çıkabilir.
+    mode: None (henüz belirsiz), "framed" veya "legacy".
+    """
+
+    def __init__(self, max_frame=MAX_FRAME):
+        self.max_frame = max_frame
+        self.mode = None
+        self._buf = bytearray()
+
+    def feed(self, data):
+        if self.mode == "legacy":
+            return [bytes(data)] if data else []
+        self._buf += data
+        if self.mode is None and not self._detect():
+            return []
+        if self.mode == "legacy":
+            return self.flush()
+        return self._frames()
+
+    def _detect(self):
+        buf = self._buf
+        if len(buf) < len(MAGIC) and MAGIC.startswith(buf):
+            # ön ekin başı olabilir, devamı beklenir
+            return False
+        if buf.startswith(MAGIC):
+            self.mode = "framed"
+            del buf[:len(MAGIC)]
+        else:
+            self.mode = "legacy"
+        return True
+
+    def _frames(self):
+        buf = self._buf
+        frames = []
+        pos = 0
+        with memoryview(buf) as view:
+            while len(buf) - pos >= HEADER.size:
+                (size,) = HEADER.unpack_from(buf, pos)
+                if size > self.max_frame:
+                    raise FrameError(f"Çerçeve çok büyük: {size} bayt")
+                end = pos + HEADER.size + size
+                if end > len(buf):
+                    break
+                frames.append(view[pos + HEADER.size:end].tobytes())
+                pos = end
+        del buf[:pos]
+        return frames
+
+    @property
+    def detecting(self):
+        """Ön ekin başı alındı, biçim henüz belirsiz."""
+        return self.mode is None and bool(self._buf)
+
+    def expire(self):
+        """Ön ek zamanında tamamlanmadı: bağlantı eski biçimdedir, bekleyen baytlar tek mesajdır."""
+        if self.mode is None:
+            self.mode = "legacy"
+        return self.flush()
+
+    def flush(self):
+        """Bağlantı kapanırken: eski biçimde (veya belirsiz) bekleyen baytlar tek mesajdır."""
+        if self.mode == "framed" or not self._buf:
+            return []
+        data = bytes(self._buf)
+        self._buf.clear()
+        return [data]
+
+    @property
+    def pending(self):
+        """Tamamlanmamış çerçevede bekleyen bayt sayısı."""
+        return len(self._buf)
+
+
+def read_frames(sock, parser):
+    """
+    Engelleyen soketten tek okuma: (veri, mesajlar). Tespit sürerken okuma
+    DETECT_TIMEOUT ile sınırlıdır; süre dolarsa veri None, bekleyen baytlar
+    eski biçimde tek mesaj olarak döner. Bağlantı kapandıysa veri b"".
+    """
+    if not parser.detecting:
+        data = sock.recv(READ_SIZE)
+    else:
+        sock.settimeout(DETECT_TIMEOUT)
+        try:
+            data = sock.recv(READ_SIZE)
+        except socket.timeout:
+            return None, parser.expire()
+        finally:
+            sock.settimeout(None)
+    return data, (parser.feed(data) if data else parser.flush())
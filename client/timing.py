@@ -0,0 +1,126 @@
+"""
+perf_counter_ns tabanlı faz ölçümü. Bir şifreleme/çözme çağrısı dört faza
+ayrılır:
+    key        anahtar hazırlama (kayıt defteri prepare + round anahtarları)
+    encode     metin kodlama ve dolgu (utf-8, PKCS7 ekleme/çıkarma)
+    core       şifre çekirdeği
+    serialize  HEX'e çevirme / HEX'ten okuma
+Klasik şifrelerde normalleştirme çekirdeğin içindedir, encode ve serialize 0 olur.
+"""
+import threading
+from collections import deque
+from time import perf_counter_ns
+
+from lru import LRUCache
+
+PHASES = ("key", "encode", "core", "serialize")
+_ZEROS = (0,) * len(PHASES)
+
+# algoritma başına tutulan son ölçüm sayısı
+HISTOGRAM_WINDOW = 1024
+
+
+class PhaseTimer:
+    """lap(faz): son lap'ten bu yana geçen süreyi o faza ekler."""
+
+    __slots__ = ("phases", "_last")
+
+    def __init__(self):
+        self.phases = dict.fromkeys(PHASES, 0)
+        self._last = perf_counter_ns()
+
+    def lap(self, phase):
+        now = perf_counter_ns()
+        self.phases[phase] += now - self._last
+        self._last = now
+
+    @property
+    def total_ns(self):
+        return sum(self.phases.values())
+
+    @property
+    def seconds(self):
+        return self.total_ns / 1e9
+
+    def as_dict(self):
+        return phases_ms(self.phases)
+
+
+def phases_ms(phases):
+    """Arayüze giden biçim: milisaniye cinsinden toplam ve fazlar."""
+    return {
+        "total_ms": round(sum(phases.values()) / 1e6, 4),
+        "phases_ms": {p: round(phases.get(p, 0) / 1e6, 4) for p in PHASES},
+    }
+
+
+def timing_fields(prefix, phases):
+    """Mesaj alanları: <prefix>_time (saniye, eski biçim) ve <prefix>_timing (faz dökümü)."""
+    if not phases:
+        return {f"{prefix}_time": None, f"{prefix}_timing": None}
+    return {
+        f"{prefix}_time": f"{sum(phases.values()) / 1e9:.6f}",
+        f"{prefix}_timing": phases_ms(phases),
+    }
+
+
+def _percentile(sorted_values, pct):
+    index = max(0, min(len(sorted_values) - 1, int(round(pct / 100 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+class PhaseHistogram:
+    """Son HISTOGRAM_WINDOW ölçümün fazları; özet log2 µs kovalarıyla hesaplanır."""
+
+    def __init__(self, window=HISTOGRAM_WINDOW):
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def add(self, phases):
+        sample = tuple(map(phases.get, PHASES, _ZEROS))
+        with self._lock:
+            self._samples.append(sample)
+
+    def summary(self):
+        with self._lock:
+            samples = list(self._samples)
+        if not samples:
+            return {"count": 0}
+        totals = sorted(sum(s) for s in samples)
+        buckets = {}
+        for total in totals:
+            # kova üst sınırı: totali aşan en küçük 2'nin kuvveti (µs)
+            bound = 1 << max(0, (total // 1000).bit_length())
+            buckets[bound] = buckets.get(bound, 0) + 1
+        n = len(samples)
+        return {
+            "count": n,
+            "p50_ms": round(_percentile(totals, 50) / 1e6, 4),
+            "p99_ms": round(_percentile(totals, 99) / 1e6, 4),
+            "mean_phases_ms": {
+                p: round(sum(s[i] for s in samples) / n / 1e6, 4) for i, p in enumerate(PHASES)
+            },
+            "histogram_us": {f"<{bound}": buckets[bound] for bound in sorted(buckets)},
+        }
+
+
+class TimingStats:
+    """(algoritma, işlem) başına PhaseHistogram; zincir adları sınırsız olabildiğinden LRU."""
+
+    def __init__(self, maxsize=256, window=HISTOGRAM_WINDOW):
+        self.window = window
+        self._histograms = LRUCache(maxsize)
+
+    def record(self, algorithm, op, phases):
+        self._histograms.get_or_create(
+            (algorithm, op), lambda: PhaseHistogram(self.window)).add(phases)
+
+    def summary(self):
+        result = {}
+        for (algorithm, op), histogram in self._histograms.items():
+            result.setdefault(algorithm, {})[op] = histogram.summary()
+        return result
+
+    def clear(self):
+        self._histograms.clear()
+
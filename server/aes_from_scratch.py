@@ -1,7 +1,17 @@
 
-import time
+import os
+import struct
 from typing import List, Tuple
 
+from buffers import byte_view, output_view
+from key_schedule import cached_schedule
+from timing import PhaseTimer
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 
 SBOX = [
@@ -72,21 +82,17 @@ def unpad_pkcs7(data: bytes, block_size: int = 16) -> bytes:
         raise ValueError("Padding hatalı")
     return data[:-pad_len]
 
-def bytes_to_state(block: bytes) -> List[List[int]]:
-   
-    state = [[0]*4 for _ in range(4)]
-    for i in range(16):
-        state[i % 4][i // 4] = block[i]
-    return state
+# Referans uygulama: adım adım AES (SubBytes, ShiftRows, MixColumns,
+# AddRoundKey). Mesaj yolları T-tablo çekirdeğini kullanır; bu adımlar yalnızca
+# benchmarks/aes_block_bench.py'de doğrulama ve karşılaştırma için durur.
+# durum: 16 baytlık düz bytearray, state[r + 4*c] = satır r, sütun c
+# (blok bayt sırasıyla aynı); tüm adımlar yerinde çalışır
+def bytes_to_state(block: bytes) -> bytearray:
+    return bytearray(block)
 
-def state_to_bytes(state: List[List[int]]) -> bytes:
-    out = bytearray(16)
-    for i in range(16):
-        out[i] = state[i % 4][i // 4]
-    return bytes(out)
+def state_to_bytes(state: bytearray) -> bytes:
+    return bytes(state)
 
-def xor_bytes(a: bytes, b: bytes) -> bytes:
-    return bytes([x ^ y for x, y in zip(a, b)])
 
 
 
@@ -102,68 +108,49 @@ def gf_mul(a: int, b: int) -> int:
         b >>= 1
     return res & 0xFF
 
+# MixColumns / InvMixColumns sabitleri için GF(2^8) çarpım tabloları
+MUL2, MUL3, MUL9, MUL11, MUL13, MUL14 = (
+    tuple(gf_mul(x, c) for x in range(256)) for c in (2, 3, 9, 11, 13, 14)
+)
 
-def sub_bytes(state: List[List[int]]) -> None:
-    for r in range(4):
-        for c in range(4):
-            state[r][c] = SBOX[state[r][c]]
-
-def inv_sub_bytes(state: List[List[int]]) -> None:
-    for r in range(4):
-        for c in range(4):
-            state[r][c] = INV_SBOX[state[r][c]]
-
-def shift_rows(state: List[List[int]]) -> None:
-    
-    state[1] = state[1][1:] + state[1][:1]
-    state[2] = state[2][2:] + state[2][:2]
-    state[3] = state[3][3:] + state[3][:3]
 
-def inv_shift_rows(state: List[List[int]]) -> None:
-    state[1] = state[1][-1:] + state[1][:-1]
-    state[2] = state[2][-2:] + state[2][:-2]
-    state[3] = state[3][-3:] + state[3][:-3]
+def sub_bytes(state: bytearray) -> None:
+    for i in range(16):
+        state[i] = SBOX[state[i]]
 
-def mix_single_column(col: List[int]) -> List[int]:
-   
-    a0,a1,a2,a3 = col
-    return [
-        gf_mul(a0,2) ^ gf_mul(a1,3) ^ a2 ^ a3,
-        a0 ^ gf_mul(a1,2) ^ gf_mul(a2,3) ^ a3,
-        a0 ^ a1 ^ gf_mul(a2,2) ^ gf_mul(a3,3),
-        gf_mul(a0,3) ^ a1 ^ a2 ^ gf_mul(a3,2),
-    ]
-
-def mix_columns(state: List[List[int]]) -> None:
-    for c in range(4):
-        col = [state[r][c] for r in range(4)]
-        mixed = mix_single_column(col)
-        for r in range(4):
-            state[r][c] = mixed[r] & 0xFF
-
-def inv_mix_single_column(col: List[int]) -> List[int]:
- 
-    a0,a1,a2,a3 = col
-    return [
-        gf_mul(a0,14) ^ gf_mul(a1,11) ^ gf_mul(a2,13) ^ gf_mul(a3,9),
-        gf_mul(a0,9)  ^ gf_mul(a1,14) ^ gf_mul(a2,11) ^ gf_mul(a3,13),
-        gf_mul(a0,13) ^ gf_mul(a1,9)  ^ gf_mul(a2,14) ^ gf_mul(a3,11),
-        gf_mul(a0,11) ^ gf_mul(a1,13) ^ gf_mul(a2,9)  ^ gf_mul(a3,14),
-    ]
-
-def inv_mix_columns(state: List[List[int]]) -> None:
-    for c in range(4):
-        col = [state[r][c] for r in range(4)]
-        mixed = inv_mix_single_column(col)
-        for r in range(4):
-            state[r][c] = mixed[r] & 0xFF
-
-def add_round_key(state: List[List[int]], round_key: bytes) -> None:
-    
+def inv_sub_bytes(state: bytearray) -> None:
     for i in range(16):
-        r = i % 4
-        c = i // 4
-        state[r][c] ^= round_key[i]
+        state[i] = INV_SBOX[state[i]]
+
+def shift_rows(state: bytearray) -> None:
+    state[1], state[5], state[9], state[13] = state[5], state[9], state[13], state[1]
+    state[2], state[6], state[10], state[14] = state[10], state[14], state[2], state[6]
+    state[3], state[7], state[11], state[15] = state[15], state[3], state[7], state[11]
+
+def inv_shift_rows(state: bytearray) -> None:
+    state[1], state[5], state[9], state[13] = state[13], state[1], state[5], state[9]
+    state[2], state[6], state[10], state[14] = state[10], state[14], state[2], state[6]
+    state[3], state[7], state[11], state[15] = state[7], state[11], state[15], state[3]
+
+def mix_columns(state: bytearray) -> None:
+    for c in range(0, 16, 4):
+        a0, a1, a2, a3 = state[c], state[c + 1], state[c + 2], state[c + 3]
+        state[c] = MUL2[a0] ^ MUL3[a1] ^ a2 ^ a3
+        state[c + 1] = a0 ^ MUL2[a1] ^ MUL3[a2] ^ a3
+        state[c + 2] = a0 ^ a1 ^ MUL2[a2] ^ MUL3[a3]
+        state[c + 3] = MUL3[a0] ^ a1 ^ a2 ^ MUL2[a3]
+
+def inv_mix_columns(state: bytearray) -> None:
+    for c in range(0, 16, 4):
+        a0, a1, a2, a3 = state[c], state[c + 1], state[c + 2], state[c + 3]
+        state[c] = MUL14[a0] ^ MUL11[a1] ^ MUL13[a2] ^ MUL9[a3]
+        state[c + 1] = MUL9[a0] ^ MUL14[a1] ^ MUL11[a2] ^ MUL13[a3]
+        state[c + 2] = MUL13[a0] ^ MUL9[a1] ^ MUL14[a2] ^ MUL11[a3]
+        state[c + 3] = MUL11[a0] ^ MUL13[a1] ^ MUL9[a2] ^ MUL14[a3]
+
+def add_round_key(state: bytearray, round_key: bytes) -> None:
+    for i in range(16):
+        state[i] ^= round_key[i]
 
 
 
@@ -200,7 +187,8 @@ def key_expansion_128(key: bytes) -> List[bytes]:
 
 
 
-def aes_encrypt_block(block16: bytes, round_keys: List[bytes]) -> bytes:
+def aes_encrypt_block_steps(block16: bytes, round_keys: List[bytes]) -> bytes:
+    """Referans: yalnızca benchmark/doğrulama için."""
     state = bytes_to_state(block16)
 
     add_round_key(state, round_keys[0])
@@ -218,7 +206,8 @@ def aes_encrypt_block(block16: bytes, round_keys: List[bytes]) -> bytes:
 
     return state_to_bytes(state)
 
-def aes_decrypt_block(block16: bytes, round_keys: List[bytes]) -> bytes:
+def aes_decrypt_block_steps(block16: bytes, round_keys: List[bytes]) -> bytes:
+    """Referans: yalnızca benchmark/doğrulama için."""
     state = bytes_to_state(block16)
 
     add_round_key(state, round_keys[10])
@@ -237,37 +226,345 @@ def aes_decrypt_block(block16: bytes, round_keys: List[bytes]) -> bytes:
 
 
 
-def aes_encrypt_message(message: str, password: str) -> tuple:
-    start_time = time.time()
-    key = password_to_key_bytes(password)
+
+def _rotr8(word: int) -> int:
+    return ((word >> 8) | (word << 24)) & 0xFFFFFFFF
+
+def _build_t_tables():
+    """
+    T-tabloları: SubBytes + ShiftRows + MixColumns tek bir 32-bit arama.
+    TE0[x] = (2·S[x], S[x], S[x], 3·S[x]), TE1..TE3 bunun byte döndürmeleri.
+    TD0[x] = (14·S⁻¹[x], 9·S⁻¹[x], 13·S⁻¹[x], 11·S⁻¹[x]).
+    """
+    te0, td0 = [], []
+    for x in range(256):
+        s = SBOX[x]
+        te0.append((MUL2[s] << 24) | (s << 16) | (s << 8) | MUL3[s])
+        i = INV_SBOX[x]
+        td0.append((MUL14[i] << 24) | (MUL9[i] << 16) | (MUL13[i] << 8) | MUL11[i])
+    te = [te0]
+    td = [td0]
+    for _ in range(3):
+        te.append([_rotr8(w) for w in te[-1]])
+        td.append([_rotr8(w) for w in td[-1]])
+    return tuple(tuple(t) for t in te), tuple(tuple(t) for t in td)
+
+(TE0, TE1, TE2, TE3), (TD0, TD1, TD2, TD3) = _build_t_tables()
+
+
+def encryption_round_words(round_keys: List[bytes]) -> Tuple[int, ...]:
+    """Round anahtarlarını 44 adet big-endian 32-bit sütun kelimesine çevirir."""
+    return tuple(int.from_bytes(rk[i:i + 4], "big") for rk in round_keys for i in range(0, 16, 4))
+
+def decryption_round_words(round_keys: List[bytes]) -> Tuple[int, ...]:
+    """
+    Eşdeğer ters şifre için anahtarlar: ters sırada, ilk ve son hariç
+    InvMixColumns uygulanmış (TD[S[b]] = InvMixColumns katsayıları · b).
+    """
+    ek = encryption_round_words(round_keys)
+    dk = list(ek[40:44])
+    for rnd in range(9, 0, -1):
+        for w in ek[4 * rnd:4 * rnd + 4]:
+            dk.append(TD0[SBOX[w >> 24]] ^ TD1[SBOX[(w >> 16) & 255]]
+                      ^ TD2[SBOX[(w >> 8) & 255]] ^ TD3[SBOX[w & 255]])
+    dk.extend(ek[0:4])
+    return tuple(dk)
+
+
+_WORDS = struct.Struct(">4I")
+_unpack_words = _WORDS.unpack_from
+_pack_words = _WORDS.pack_into
+
+
+def aes_encrypt_block_into(src, src_offset: int, dst, dst_offset: int, ek: Tuple[int, ...]) -> None:
+    """src[src_offset:+16] bloğunu şifreleyip dst[dst_offset:+16] içine yazar (ara tampon yok)."""
+    s0, s1, s2, s3 = _unpack_words(src, src_offset)
+    s0 ^= ek[0]
+    s1 ^= ek[1]
+    s2 ^= ek[2]
+    s3 ^= ek[3]
+
+    for k in range(4, 40, 4):
+        t0 = TE0[s0 >> 24] ^ TE1[(s1 >> 16) & 255] ^ TE2[(s2 >> 8) & 255] ^ TE3[s3 & 255] ^ ek[k]
+        t1 = TE0[s1 >> 24] ^ TE1[(s2 >> 16) & 255] ^ TE2[(s3 >> 8) & 255] ^ TE3[s0 & 255] ^ ek[k + 1]
+        t2 = TE0[s2 >> 24] ^ TE1[(s3 >> 16) & 255] ^ TE2[(s0 >> 8) & 255] ^ TE3[s1 & 255] ^ ek[k + 2]
+        s3 = TE0[s3 >> 24] ^ TE1[(s0 >> 16) & 255] ^ TE2[(s1 >> 8) & 255] ^ TE3[s2 & 255] ^ ek[k + 3]
+        s0, s1, s2 = t0, t1, t2
+
+    # son round: MixColumns yok
+    S = SBOX
+    _pack_words(
+        dst, dst_offset,
+        (S[s0 >> 24] << 24 | S[(s1 >> 16) & 255] << 16 | S[(s2 >> 8) & 255] << 8 | S[s3 & 255]) ^ ek[40],
+        (S[s1 >> 24] << 24 | S[(s2 >> 16) & 255] << 16 | S[(s3 >> 8) & 255] << 8 | S[s0 & 255]) ^ ek[41],
+        (S[s2 >> 24] << 24 | S[(s3 >> 16) & 255] << 16 | S[(s0 >> 8) & 255] << 8 | S[s1 & 255]) ^ ek[42],
+        (S[s3 >> 24] << 24 | S[(s0 >> 16) & 255] << 16 | S[(s1 >> 8) & 255] << 8 | S[s2 & 255]) ^ ek[43],
+    )
+
+def aes_decrypt_block_into(src, src_offset: int, dst, dst_offset: int, dk: Tuple[int, ...]) -> None:
+    s0, s1, s2, s3 = _unpack_words(src, src_offset)
+    s0 ^= dk[0]
+    s1 ^= dk[1]
+    s2 ^= dk[2]
+    s3 ^= dk[3]
+
+    for k in range(4, 40, 4):
+        t0 = TD0[s0 >> 24] ^ TD1[(s3 >> 16) & 255] ^ TD2[(s2 >> 8) & 255] ^ TD3[s1 & 255] ^ dk[k]
+        t1 = TD0[s1 >> 24] ^ TD1[(s0 >> 16) & 255] ^ TD2[(s3 >> 8) & 255] ^ TD3[s2 & 255] ^ dk[k + 1]
+        t2 = TD0[s2 >> 24] ^ TD1[(s1 >> 16) & 255] ^ TD2[(s0 >> 8) & 255] ^ TD3[s3 & 255] ^ dk[k + 2]
+        s3 = TD0[s3 >> 24] ^ TD1[(s2 >> 16) & 255] ^ TD2[(s1 >> 8) & 255] ^ TD3[s0 & 255] ^ dk[k + 3]
+        s0, s1, s2 = t0, t1, t2
+
+    S = INV_SBOX
+    _pack_words(
+        dst, dst_offset,
+        (S[s0 >> 24] << 24 | S[(s3 >> 16) & 255] << 16 | S[(s2 >> 8) & 255] << 8 | S[s1 & 255]) ^ dk[40],
+        (S[s1 >> 24] << 24 | S[(s0 >> 16) & 255] << 16 | S[(s3 >> 8) & 255] << 8 | S[s2 & 255]) ^ dk[41],
+        (S[s2 >> 24] << 24 | S[(s1 >> 16) & 255] << 16 | S[(s0 >> 8) & 255] << 8 | S[s3 & 255]) ^ dk[42],
+        (S[s3 >> 24] << 24 | S[(s2 >> 16) & 255] << 16 | S[(s1 >> 8) & 255] << 8 | S[s0 & 255]) ^ dk[43],
+    )
+
+def aes_encrypt_block_words(block16: bytes, ek: Tuple[int, ...]) -> bytes:
+    out = bytearray(16)
+    aes_encrypt_block_into(block16, 0, out, 0, ek)
+    return bytes(out)
+
+def aes_decrypt_block_words(block16: bytes, dk: Tuple[int, ...]) -> bytes:
+    out = bytearray(16)
+    aes_decrypt_block_into(block16, 0, out, 0, dk)
+    return bytes(out)
+
+
+def _expand_round_words(key: bytes):
     round_keys = key_expansion_128(key)
+    return encryption_round_words(round_keys), decryption_round_words(round_keys)
 
-    data = pad_pkcs7(message.encode("utf-8"), 16)
-    out = bytearray()
+def aes_key_schedule(key: bytes) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """(şifreleme, çözme) round kelimeleri; türetilmiş anahtar başına bir kez hesaplanır."""
+    return cached_schedule("aes", key, _expand_round_words)
 
-    for i in range(0, len(data), 16):
-        block = data[i:i+16]
-        out += aes_encrypt_block(block, round_keys)
 
-    result = out.hex().upper()
-    elapsed = time.time() - start_time
-    return (result, elapsed)
+def aes_encrypt_block(block16: bytes, round_keys: List[bytes]) -> bytes:
+    return aes_encrypt_block_words(block16, encryption_round_words(round_keys))
 
-def aes_decrypt_message(cipher_hex: str, password: str) -> tuple:
-    start_time = time.time()
+def aes_decrypt_block(block16: bytes, round_keys: List[bytes]) -> bytes:
+    return aes_decrypt_block_words(block16, decryption_round_words(round_keys))
+
+
+
+# NumPy toplu motoru: N blok (N,16) uint8 dizisinde, tüm round adımları
+# bloklar boyunca vektörel. Bu bayt eşiğinin altında T-tablo döngüsü daha hızlıdır.
+AES_BATCH_THRESHOLD = 1024
+AES_BATCH_CHUNK = 65536
+
+if np is not None:
+    _SBOX_NP = np.array(SBOX, dtype=np.uint8)
+    _INV_SBOX_NP = np.array(INV_SBOX, dtype=np.uint8)
+    _MUL2_NP, _MUL3_NP, _MUL9_NP, _MUL11_NP, _MUL13_NP, _MUL14_NP = (
+        np.array(t, dtype=np.uint8) for t in (MUL2, MUL3, MUL9, MUL11, MUL13, MUL14)
+    )
+    # ShiftRows: yeni[r + 4c] = eski[r + 4((c + r) % 4)]
+    _SHIFT_ROWS_NP = np.array([i % 4 + 4 * ((i // 4 + i % 4) % 4) for i in range(16)])
+    _INV_SHIFT_ROWS_NP = np.argsort(_SHIFT_ROWS_NP)
+
+
+def _mix_columns_np(state):
+    s = state.reshape(-1, 4, 4)
+    a0, a1, a2, a3 = s[:, :, 0], s[:, :, 1], s[:, :, 2], s[:, :, 3]
+    out = np.empty_like(s)
+    out[:, :, 0] = _MUL2_NP[a0] ^ _MUL3_NP[a1] ^ a2 ^ a3
+    out[:, :, 1] = a0 ^ _MUL2_NP[a1] ^ _MUL3_NP[a2] ^ a3
+    out[:, :, 2] = a0 ^ a1 ^ _MUL2_NP[a2] ^ _MUL3_NP[a3]
+    out[:, :, 3] = _MUL3_NP[a0] ^ a1 ^ a2 ^ _MUL2_NP[a3]
+    return out.reshape(-1, 16)
+
+def _inv_mix_columns_np(state):
+    s = state.reshape(-1, 4, 4)
+    a0, a1, a2, a3 = s[:, :, 0], s[:, :, 1], s[:, :, 2], s[:, :, 3]
+    out = np.empty_like(s)
+    out[:, :, 0] = _MUL14_NP[a0] ^ _MUL11_NP[a1] ^ _MUL13_NP[a2] ^ _MUL9_NP[a3]
+    out[:, :, 1] = _MUL9_NP[a0] ^ _MUL14_NP[a1] ^ _MUL11_NP[a2] ^ _MUL13_NP[a3]
+    out[:, :, 2] = _MUL13_NP[a0] ^ _MUL9_NP[a1] ^ _MUL14_NP[a2] ^ _MUL11_NP[a3]
+    out[:, :, 3] = _MUL11_NP[a0] ^ _MUL13_NP[a1] ^ _MUL9_NP[a2] ^ _MUL14_NP[a3]
+    return out.reshape(-1, 16)
+
+def aes_round_key_array(key: bytes):
+    """(11,16) uint8 round anahtarları (NumPy motoru için, önbellekli)."""
+    return cached_schedule("aes_np", key, lambda k: np.frombuffer(
+        b"".join(key_expansion_128(k)), dtype=np.uint8).reshape(11, 16))
+
+def aes_encrypt_blocks_np(blocks, rk):
+    """blocks: (N,16) uint8; rk: (11,16) round anahtarları."""
+    s = blocks ^ rk[0]
+    for rnd in range(1, 10):
+        s = _mix_columns_np(_SBOX_NP[s[:, _SHIFT_ROWS_NP]]) ^ rk[rnd]
+    return _SBOX_NP[s[:, _SHIFT_ROWS_NP]] ^ rk[10]
+
+def aes_decrypt_blocks_np(blocks, rk):
+    s = _INV_SBOX_NP[(blocks ^ rk[10])[:, _INV_SHIFT_ROWS_NP]]
+    for rnd in range(9, 0, -1):
+        s = _INV_SBOX_NP[_inv_mix_columns_np(s ^ rk[rnd])[:, _INV_SHIFT_ROWS_NP]]
+    return s ^ rk[0]
+
+def _ecb_np(src, dst, rk, decrypt: bool) -> None:
+    func = aes_decrypt_blocks_np if decrypt else aes_encrypt_blocks_np
+    blocks = np.frombuffer(src, dtype=np.uint8).reshape(-1, 16)
+    out = np.frombuffer(dst, dtype=np.uint8).reshape(-1, 16)
+    for i in range(0, len(blocks), AES_BATCH_CHUNK):
+        out[i:i + AES_BATCH_CHUNK] = func(blocks[i:i + AES_BATCH_CHUNK], rk)
+
+def _ecb_words(src, dst, words, decrypt: bool) -> None:
+    crypt_block = aes_decrypt_block_into if decrypt else aes_encrypt_block_into
+    for i in range(0, len(src), 16):
+        crypt_block(src, i, dst, i, words)
+
+def _ecb_engine(key: bytes, length: int, decrypt: bool):
+    """length baytlık ECB işi için (çalıştırıcı, round anahtarları)."""
+    if np is not None and length >= AES_BATCH_THRESHOLD:
+        return _ecb_np, aes_round_key_array(key)
+    return _ecb_words, aes_key_schedule(key)[1 if decrypt else 0]
+
+def _ecb(src, dst, engine, decrypt: bool) -> None:
+    """src'yi dst'ye _ecb_engine'in verdiği motorla işler; ikisi aynı uzunlukta, 16'nın katı."""
+    run, keys = engine
+    run(src, dst, keys, decrypt)
+
+
+def _ctr_uses_np(length: int) -> bool:
+    return np is not None and (length + 15) // 16 * 16 >= AES_BATCH_THRESHOLD
+
+def aes_ctr_round_keys(key: bytes, length: int):
+    """length baytlık anahtar akışının okuyacağı (önbellekli) round anahtarları."""
+    return aes_round_key_array(key) if _ctr_uses_np(length) else aes_key_schedule(key)[0]
+
+def aes_ctr_keystream(key: bytes, nonce: bytes, length: int, counter: int = 0,
+                      round_keys=None) -> bytes:
+    """
+    CTR anahtar akışı: blok i = nonce (8 bayt) || sayaç + i (8 bayt, big-endian).
+    NumPy varsa tüm sayaç blokları tek seferde şifrelenir. round_keys
+    verilmezse aes_ctr_round_keys(key, length) kullanılır.
+    """
+    count = (length + 15) // 16
+    if round_keys is None:
+        round_keys = aes_ctr_round_keys(key, length)
+    if _ctr_uses_np(length):
+        rk = round_keys
+        stream = np.empty((count, 16), dtype=np.uint8)
+        for i in range(0, count, AES_BATCH_CHUNK):
+            n = min(AES_BATCH_CHUNK, count - i)
+            blocks = np.empty((n, 16), dtype=np.uint8)
+            blocks[:, :8] = np.frombuffer(nonce, dtype=np.uint8)
+            counters = np.arange(counter + i, counter + i + n, dtype=np.uint64)
+            blocks[:, 8:] = counters.astype(">u8").view(np.uint8).reshape(n, 8)
+            stream[i:i + n] = aes_encrypt_blocks_np(blocks, rk)
+        return stream.tobytes()[:length]
+
+    ek = round_keys
+    stream = bytearray(count * 16)
+    counter_block = bytearray(nonce + bytes(8))
+    with memoryview(stream) as view:
+        for i in range(count):
+            struct.pack_into(">Q", counter_block, 8, (counter + i) & 0xFFFFFFFFFFFFFFFF)
+            aes_encrypt_block_into(counter_block, 0, view, 16 * i, ek)
+    return bytes(stream[:length])
+
+def aes_ctr_xor(data: bytes, key: bytes, nonce: bytes, counter: int = 0,
+                round_keys=None) -> bytes:
+    stream = aes_ctr_keystream(key, nonce, len(data), counter, round_keys)
+    if np is not None and len(data) >= AES_BATCH_THRESHOLD:
+        return (np.frombuffer(data, dtype=np.uint8) ^ np.frombuffer(stream, dtype=np.uint8)).tobytes()
+    return (int.from_bytes(data, "big") ^ int.from_bytes(stream, "big")).to_bytes(len(data), "big")
+
+
+
+def encrypt_bytes(data, password: str, out=None, timer=None):
+    """
+    PKCS7 + ECB, bayt girdi/çıktı. data buffer protokolünü destekleyen herhangi
+    bir nesne olabilir. out verilirse (en az len(data)//16*16 + 16 bayt) şifreli
+    metin oraya yazılır ve yazılan bayt sayısı döner; verilmezse bytes döner.
+    timer verilirse anahtar hazırlığı "key" fazı olarak işaretlenir.
+    """
+    src = byte_view(data)
     key = password_to_key_bytes(password)
-    round_keys = key_expansion_128(key)
+    full = len(src) - len(src) % 16
+    dst = output_view(out, full + 16)
+    body = _ecb_engine(key, full, decrypt=False)
+    tail = _ecb_engine(key, 16, decrypt=False)
+    if timer is not None:
+        timer.lap("key")
+    if full:
+        _ecb(src[:full], dst[:full], body, decrypt=False)
+    _ecb(pad_pkcs7(bytes(src[full:]), 16), dst[full:], tail, decrypt=False)
+    return bytes(dst) if out is None else len(dst)
+
+def decrypt_bytes(data, password: str, out=None, timer=None):
+    """
+    encrypt_bytes'ın tersi. out en az len(data) bayt olmalı (dolgu da yazılır);
+    out verilirse dolgusuz düz metnin uzunluğu döner, verilmezse bytes döner.
+    """
+    src = byte_view(data)
+    if len(src) % 16 != 0:
+        raise ValueError("Şifreli veri uzunluğu 16'nın (blok) katı olmalı.")
+    key = password_to_key_bytes(password)
+    dst = output_view(out, len(src))
+    engine = _ecb_engine(key, len(src), decrypt=True)
+    if timer is not None:
+        timer.lap("key")
+    _ecb(src, dst, engine, decrypt=True)
+    size = len(src) - 16 + len(unpad_pkcs7(bytes(dst[-16:]), 16))
+    return bytes(dst[:size]) if out is None else size
+
+
+def aes_encrypt_message(message: str, password: str, timer=None) -> tuple:
+    timer = PhaseTimer() if timer is None else timer
+    data = message.encode("utf-8")
+    timer.lap("encode")
+    ct = encrypt_bytes(data, password, timer=timer)
+    timer.lap("core")
+    result = ct.hex().upper()
+    timer.lap("serialize")
+    return (result, timer.seconds)
+
+def aes_decrypt_message(cipher_hex: str, password: str, timer=None) -> tuple:
+    timer = PhaseTimer() if timer is None else timer
 
     if len(cipher_hex) % 32 != 0:
         raise ValueError("Cipher HEX uzunluğu 32'nin (16 byte) katı olmalı.")
 
-    ct = bytes.fromhex(cipher_hex)
-    out = bytearray()
-
-    for i in range(0, len(ct), 16):
-        out += aes_decrypt_block(ct[i:i+16], round_keys)
-
-    pt = unpad_pkcs7(bytes(out), 16)
+    raw = bytes.fromhex(cipher_hex)
+    timer.lap("serialize")
+    pt = decrypt_bytes(raw, password, timer=timer)
+    timer.lap("core")
+    result = pt.decode("utf-8", errors="ignore")
+    timer.lap("encode")
+    return (result, timer.seconds)
+
+def aes_ctr_encrypt_message(message: str, password: str, timer=None) -> tuple:
+    """CTR modu: dolgu yok, çıktı HEX(nonce (8 bayt) || şifreli metin)."""
+    timer = PhaseTimer() if timer is None else timer
+    data = message.encode("utf-8")
+    timer.lap("encode")
+    key = password_to_key_bytes(password)
+    round_keys = aes_ctr_round_keys(key, len(data))
+    nonce = os.urandom(8)
+    timer.lap("key")
+    ct = aes_ctr_xor(data, key, nonce, round_keys=round_keys)
+    timer.lap("core")
+    result = (nonce + ct).hex().upper()
+    timer.lap("serialize")
+    return (result, timer.seconds)
+
+def aes_ctr_decrypt_message(cipher_hex: str, password: str, timer=None) -> tuple:
+    timer = PhaseTimer() if timer is None else timer
+    raw = bytes.fromhex(cipher_hex)
+    if len(raw) < 8:
+        raise ValueError("CTR şifreli metni en az 8 baytlık nonce içermeli.")
+    timer.lap("serialize")
+    key = password_to_key_bytes(password)
+    round_keys = aes_ctr_round_keys(key, len(raw) - 8)
+    timer.lap("key")
+    pt = aes_ctr_xor(raw[8:], key, raw[:8], round_keys=round_keys)
+    timer.lap("core")
     result = pt.decode("utf-8", errors="ignore")
-    elapsed = time.time() - start_time
-    return (result, elapsed)
+    timer.lap("encode")
+    return (result, timer.seconds)
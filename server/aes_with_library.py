@@ -1,6 +1,9 @@
-import time
 from Crypto.Cipher import AES
 
+import key_schedule
+from cipher_context import CipherContext
+from timing import PhaseTimer
+
 def password_to_key_bytes(password: str) -> bytes:
     b = password.encode("utf-8")
     if len(b) < 16:
@@ -13,26 +16,57 @@ def pad(data: bytes, bs: int = 16) -> bytes:
     pad_len = bs - (len(data) % bs)
     return data + bytes([pad_len] * pad_len)
 
-def unpad(data: bytes) -> bytes:
+def unpad(data: bytes, bs: int = 16) -> bytes:
     pad_len = data[-1]
-    if pad_len < 1 or pad_len > 16:
+    if pad_len < 1 or pad_len > bs:
         raise ValueError("Padding hatalı")
     return data[:-pad_len]
 
-def aes_encrypt_message_lib(message: str, password: str) -> tuple:
-    start_time = time.time()
-    key = password_to_key_bytes(password)
-    cipher = AES.new(key, AES.MODE_ECB)
-    ct = cipher.encrypt(pad(message.encode("utf-8"), 16))
+class AESContext(CipherContext):
+    """Hazırlanmış AES anahtarı; ECB bayt API'si ve CTR/CBC/GCM akışları."""
+
+    factory = AES
+    block_size = 16
+    pad = staticmethod(pad)
+    unpad = staticmethod(unpad)
+
+def context(password: str) -> AESContext:
+    """Parolanın türetilmiş anahtarı için önbellekteki bağlam."""
+    return key_schedule.cached_schedule("aes_lib", password_to_key_bytes(password), AESContext)
+
+def encrypt_bytes(data, password: str, out=None, timer=None):
+    """
+    PKCS7 + ECB, bayt girdi/çıktı. out verilirse (en az len(data)//16*16 + 16
+    bayt) oraya yazılır ve yazılan bayt sayısı döner; verilmezse bytes döner.
+    """
+    ctx = context(password)
+    if timer is not None:
+        timer.lap("key")
+    return ctx.encrypt_bytes(data, out)
+
+def decrypt_bytes(data, password: str, out=None, timer=None):
+    """encrypt_bytes'ın tersi; out en az len(data) bayt olmalı, verilirse düz metin uzunluğu döner."""
+    ctx = context(password)
+    if timer is not None:
+        timer.lap("key")
+    return ctx.decrypt_bytes(data, out)
+
+def aes_encrypt_message_lib(message: str, password: str, timer=None) -> tuple:
+    timer = PhaseTimer() if timer is None else timer
+    data = message.encode("utf-8")
+    timer.lap("encode")
+    ct = encrypt_bytes(data, password, timer=timer)
+    timer.lap("core")
     result = ct.hex().upper()
-    elapsed = time.time() - start_time
-    return (result, elapsed)
-
-def aes_decrypt_message_lib(cipher_hex: str, password: str) -> tuple:
-    start_time = time.time()
-    key = password_to_key_bytes(password)
-    cipher = AES.new(key, AES.MODE_ECB)
-    pt = unpad(cipher.decrypt(bytes.fromhex(cipher_hex)))
+    timer.lap("serialize")
+    return (result, timer.seconds)
+
+def aes_decrypt_message_lib(cipher_hex: str, password: str, timer=None) -> tuple:
+    timer = PhaseTimer() if timer is None else timer
+    raw = bytes.fromhex(cipher_hex)
+    timer.lap("serialize")
+    pt = decrypt_bytes(raw, password, timer=timer)
+    timer.lap("core")
     result = pt.decode("utf-8", errors="ignore")
-    elapsed = time.time() - start_time
-    return (result, elapsed)
+    timer.lap("encode")
+    return (result, timer.seconds)
@@ -0,0 +1,108 @@
+"""
+Toplu şifreleme/çözme: (algoritma, anahtar, metin) işleri parçalara bölünüp
+bir ProcessPoolExecutor'a dağıtılır. Saf Python AES/DES ve klasik şifreler
+GIL'i tuttuğundan büyük mesajlar ayrı süreçte işlenir; Flask/Socket.IO
+thread'leri beklemez. Sonuçlar iş sırasıyla döner, hatalar iş başınadır.
+"""
+import math
+import multiprocessing
+import os
+import threading
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from cipher_registry import REGISTRY
+
+# bu boyutun altındaki mesajlar süreç geçişine değmez
+POOL_THRESHOLD = 16384
+MAX_WORKERS = os.cpu_count() or 1
+# forkserver'da önceden yüklenenler; bulunamayanlar atlanır
+PRELOAD_MODULES = ["batch", "flask", "flask_socketio", "requests"]
+
+# phases: timing.PhaseTimer fazları (ns); işçi süreçteki ölçüm çağırana taşınır
+BatchResult = namedtuple("BatchResult", "text elapsed error phases", defaults=(None,))
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _mp_context():
+    """
+    forkserver, yoksa spawn. İki yöntemde de her işçi ana betiği (__main__)
+    yeniden çalıştırır; betikler ağır kurulumu (RSA anahtarı, dinleyici) tembel
+    yapmalı ya da `if __name__ == "__main__":` altına koymalıdır. forkserver
+    şifre ve web modüllerini bir kez yükler, işçiler bunları hazır devralır.
+    """
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+    ctx = multiprocessing.get_context("forkserver")
+    ctx.set_forkserver_preload(PRELOAD_MODULES)
+    return ctx
+
+
+def get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # havuz Flask/asyncio thread'leri çalışırken açılır; fork tutulu bir
+            # kilidi çocuğa kopyalayabilir, bu yüzden forkserver/spawn kullanılır
+            _pool = ProcessPoolExecutor(max_workers=MAX_WORKERS, mp_context=_mp_context())
+        return _pool
+
+
+def shutdown_pool():
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _run_one(decrypt, algorithm, key, text):
+    call = REGISTRY.decrypt_timed if decrypt else REGISTRY.encrypt_timed
+    try:
+        out, timer = call(algorithm, key, text)
+        if timer is None:
+            return BatchResult(out, 0.0, None)
+        return BatchResult(out, timer.seconds, None, timer.phases)
+    except Exception as e:
+        # istisna nesneleri her zaman pickle edilemez, mesajı taşınır
+        return BatchResult(None, 0.0, str(e))
+
+
+def _run_chunk(decrypt, jobs):
+    return [_run_one(decrypt, *job) for job in jobs]
+
+
+def _run_many(decrypt, jobs, chunk_size=None):
+    jobs = [tuple(job) for job in jobs]
+    if not jobs:
+        return []
+    pool = get_pool()
+    if chunk_size is None:
+        chunk_size = max(1, math.ceil(len(jobs) / (MAX_WORKERS * 4)))
+    chunks = [jobs[i:i + chunk_size] for i in range(0, len(jobs), chunk_size)]
+    futures = [pool.submit(_run_chunk, decrypt, chunk) for chunk in chunks]
+
+    results = []
+    for chunk, future in zip(chunks, futures):
+        try:
+            results.extend(future.result())
+        except Exception as e:
+            # işçi süreç çöktüyse (BrokenProcessPool vb.) parçadaki tüm işler hatalıdır
+            results.extend(BatchResult(None, 0.0, str(e) or type(e).__name__) for _ in chunk)
+    return results
+
+
+def encrypt_many(jobs, chunk_size=None):
+    """jobs: (algoritma, anahtar, metin) listesi; aynı sırada BatchResult listesi döner."""
+    return _run_many(False, jobs, chunk_size)
+
+
+def decrypt_many(jobs, chunk_size=None):
+    return _run_many(True, jobs, chunk_size)
+
+
+def submit_decrypt(algorithm, key, text):
+    """Tek bir çözme işini havuza gönderir; Future[BatchResult] döner."""
+    return get_pool().submit(_run_one, True, algorithm, key, text)
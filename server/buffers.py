@@ -0,0 +1,24 @@
+"""
+encrypt_bytes/decrypt_bytes için tampon yardımcıları: girdi buffer
+protokolünü destekleyen herhangi bir nesne olabilir (bytes, bytearray,
+memoryview, array, mmap...), çıktı isteğe bağlı olarak çağıranın tamponudur.
+"""
+
+
+def byte_view(data):
+    view = memoryview(data)
+    if view.ndim != 1 or view.format != "B":
+        view = view.cast("B")
+    return view
+
+
+def output_view(out, size):
+    """out'un ilk size baytına yazılabilir görünüm; out None ise yeni bytearray."""
+    if out is None:
+        return memoryview(bytearray(size))
+    view = byte_view(out)
+    if view.readonly:
+        raise TypeError("out yazılabilir bir tampon olmalı")
+    if len(view) < size:
+        raise ValueError(f"out en az {size} bayt olmalı")
+    return view[:size]
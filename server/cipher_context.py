@@ -0,0 +1,200 @@
+"""
+pycryptodome tabanlı şifreler için yeniden kullanılabilir bağlam nesneleri.
+Bağlam türetilmiş anahtarı ve bir ECB nesnesini bir kez hazırlar; CTR/CBC/GCM
+akışları parça parça update(chunk, out=None) / finalize() ile çalışır.
+out verilirse çıktı pycryptodome'un output= parametresiyle doğrudan o tampona
+yazılır ve yazılan bayt sayısı döner; verilmezse bytes döner.
+
+Akış biçimi: encryptor.header (nonce/IV) + update çıktıları + finalize()
+(CBC'de son dolgulu blok, GCM'de 16 baytlık etiket). GCM çözücüsü düz metni
+etiket doğrulanana kadar tutar; tamamı finalize()'da döner.
+"""
+import os
+
+from buffers import byte_view, output_view
+
+GCM_TAG_SIZE = 16
+# bu boyutun altında out verilse bile tek çağrı + kopya daha hızlı
+SMALL_MESSAGE = 4096
+
+
+class _Stream:
+    def __init__(self, cipher, encrypt, header):
+        self.header = header
+        self._op = cipher.encrypt if encrypt else cipher.decrypt
+
+    def _emit(self, data, out):
+        if out is None:
+            return self._op(data)
+        dst = output_view(out, len(data))
+        self._op(data, output=dst)
+        return len(dst)
+
+    def update(self, chunk, out=None):
+        return self._emit(byte_view(chunk), out)
+
+    def finalize(self):
+        return b""
+
+
+class CTRStream(_Stream):
+    pass
+
+
+class CBCEncryptStream(_Stream):
+    """Tam blokları hemen işler, kalan baytları finalize'da dolgu ile kapatır."""
+
+    def __init__(self, cipher, header, block_size, pad):
+        super().__init__(cipher, True, header)
+        self.block_size = block_size
+        self._pad = pad
+        self._pending = b""
+
+    def update(self, chunk, out=None):
+        data = self._pending + bytes(chunk)
+        full = len(data) - len(data) % self.block_size
+        self._pending = data[full:]
+        return self._emit(data[:full], out)
+
+    def finalize(self):
+        pending, self._pending = self._pending, b""
+        return self._op(self._pad(pending, self.block_size))
+
+
+class CBCDecryptStream(_Stream):
+    """Dolgu kontrolü için son blok finalize'a kadar tutulur."""
+
+    def __init__(self, cipher, header, block_size, unpad):
+        super().__init__(cipher, False, header)
+        self.block_size = block_size
+        self._unpad = unpad
+        self._pending = b""
+
+    def update(self, chunk, out=None):
+        data = self._pending + bytes(chunk)
+        keep = len(data) % self.block_size or min(len(data), self.block_size)
+        self._pending = data[len(data) - keep:]
+        return self._emit(data[:len(data) - keep], out)
+
+    def finalize(self):
+        pending, self._pending = self._pending, b""
+        if len(pending) != self.block_size:
+            raise ValueError("CBC şifreli verisi blok boyutunun katı olmalı.")
+        return self._unpad(self._op(pending))
+
+
+class GCMEncryptStream(_Stream):
+    def __init__(self, cipher, header):
+        super().__init__(cipher, True, header)
+        self._cipher = cipher
+
+    def finalize(self):
+        return self._cipher.digest()
+
+
+class GCMDecryptStream(_Stream):
+    """
+    Son GCM_TAG_SIZE bayt etikettir. Doğrulanmamış düz metin dışarı
+    verilmez: update veriyi biriktirir (out verilse 0 döner), finalize
+    etiketi doğrulayıp düz metnin tamamını döndürür.
+    """
+
+    def __init__(self, cipher, header):
+        super().__init__(cipher, False, header)
+        self._cipher = cipher
+        self._chunks = []
+
+    def update(self, chunk, out=None):
+        self._chunks.append(bytes(chunk))
+        return b"" if out is None else 0
+
+    def finalize(self):
+        data, self._chunks = b"".join(self._chunks), []
+        if len(data) < GCM_TAG_SIZE:
+            raise ValueError("GCM doğrulama etiketi eksik")
+        split = len(data) - GCM_TAG_SIZE
+        try:
+            return self._cipher.decrypt_and_verify(data[:split], data[split:])
+        except ValueError:
+            raise ValueError("GCM doğrulama etiketi hatalı") from None
+
+
+class CipherContext:
+    """
+    Alt sınıflar factory (Crypto.Cipher.AES / DES), block_size ve
+    pad/unpad(veri, blok) fonksiyonlarını (staticmethod) belirler.
+    ECB nesnesi durumsuzdur; bağlam thread'ler arasında paylaşılabilir,
+    akış nesneleri paylaşılamaz.
+    """
+
+    factory = None
+    block_size = 16
+    pad = None
+    unpad = None
+
+    def __init__(self, key):
+        self.key = bytes(key)
+        self._ecb = self.factory.new(self.key, self.factory.MODE_ECB)
+
+    def encrypt_bytes(self, data, out=None):
+        src = byte_view(data)
+        bs = self.block_size
+        full = len(src) - len(src) % bs
+        if out is None or full < SMALL_MESSAGE:
+            # tek çağrı: ctypes arka ucunda her memoryview dönüşümü µs'ler sürer
+            ct = self._ecb.encrypt(self.pad(src.tobytes(), bs))
+            if out is None:
+                return ct
+            output_view(out, len(ct))[:] = ct
+            return len(ct)
+        dst = output_view(out, full + bs)
+        self._ecb.encrypt(src[:full], output=dst[:full])
+        self._ecb.encrypt(self.pad(src[full:].tobytes(), bs), output=dst[full:])
+        return len(dst)
+
+    def decrypt_bytes(self, data, out=None):
+        src = byte_view(data)
+        bs = self.block_size
+        if out is None or len(src) < SMALL_MESSAGE:
+            pt = self.unpad(self._ecb.decrypt(src.tobytes()), bs)
+            if out is None:
+                return pt
+            output_view(out, len(pt))[:] = pt
+            return len(pt)
+        dst = output_view(out, len(src))
+        self._ecb.decrypt(src, output=dst)
+        return len(src) - bs + len(self.unpad(bytes(dst[-bs:]), bs))
+
+    def _header_size(self, mode):
+        if mode == "ctr":
+            return self.block_size // 2
+        if mode == "cbc":
+            return self.block_size
+        if mode == "gcm":
+            if self.block_size != 16:
+                raise ValueError("GCM yalnızca 128-bit blok şifrelerle (AES) kullanılabilir.")
+            return 12
+        raise ValueError(f"Bilinmeyen mod: {mode}")
+
+    def _stream(self, mode, header, encrypt):
+        f = self.factory
+        if mode == "ctr":
+            return CTRStream(f.new(self.key, f.MODE_CTR, nonce=header), encrypt, header)
+        if mode == "cbc":
+            cipher = f.new(self.key, f.MODE_CBC, iv=header)
+            if encrypt:
+                return CBCEncryptStream(cipher, header, self.block_size, self.pad)
+            return CBCDecryptStream(cipher, header, self.block_size, lambda d: self.unpad(d, self.block_size))
+        cipher = f.new(self.key, f.MODE_GCM, nonce=header)
+        return GCMEncryptStream(cipher, header) if encrypt else GCMDecryptStream(cipher, header)
+
+    def encryptor(self, mode="ctr", header=None):
+        """header (nonce/IV) verilmezse rastgele üretilir; stream.header ile okunur."""
+        size = self._header_size(mode)
+        return self._stream(mode, header if header is not None else os.urandom(size), True)
+
+    def decryptor(self, mode, header):
+        size = self._header_size(mode)
+        if len(header) != size:
+            raise ValueError(f"{mode.upper()} başlığı {size} bayt olmalı.")
+        return self._stream(mode, bytes(header), False)
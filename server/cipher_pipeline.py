@@ -0,0 +1,205 @@
+"""
+Zincirlenmiş şifreler: algoritma alanında "vigenere+columnar", anahtar
+alanında "anahtar;TRUVA" gibi. Zincir prepare aşamasında derlenir: ardışık
+tek-alfabeli yer değiştirmeler (caesar, affine, substitution) tek tabloda,
+ardışık transpozisyonlar tek permütasyonda birleştirilir.
+"""
+from crypto_algorithms import (
+    CharTable, Permutation, apply_table,
+    caesar_encrypt, caesar_decrypt, affine_encrypt, affine_decrypt,
+    substitution_encrypt, substitution_decrypt, pigpen_encrypt, pigpen_decrypt,
+    transposition_width, transposition_permutation, transposition_inverse,
+)
+from timing import PhaseTimer
+
+PIPELINE_SEPARATOR = "+"
+PIPELINE_KEY_SEPARATOR = ";"
+
+# karakter bazlı (her karakteri bağımsız dönüştüren) aşamalar
+_TABLE_STAGES = {
+    "caesar": (lambda shift: lambda t: caesar_encrypt(t, shift),
+               lambda shift: lambda t: caesar_decrypt(t, shift)),
+    "affine": (lambda ab: lambda t: affine_encrypt(t, *ab),
+               lambda ab: lambda t: affine_decrypt(t, *ab)),
+    "substitution": (lambda key_map: lambda t: substitution_encrypt(t, key_map),
+                     lambda key_map: lambda t: substitution_decrypt(t, key_map)),
+    "pigpen": (lambda _: pigpen_encrypt, lambda _: pigpen_decrypt),
+}
+
+# route ve columnar şifrelemeden önce boşlukları siler ve büyük harfe çevirir
+_TRANSPOSITIONS = {"railfence": False, "route": True, "columnar": True}
+
+
+def _transposition_key(name, prepared):
+    return prepared.upper() if name == "columnar" else prepared
+
+
+def _is_identity(name, key):
+    if name == "railfence":
+        return not isinstance(key, int) or key <= 1
+    if name == "route":
+        return not key or key <= 0
+    return False
+
+
+class TableRun:
+    def __init__(self, funcs):
+        self.funcs = funcs
+        if len(funcs) == 1:
+            self.table = None
+        else:
+            self.table = CharTable(self._compose)
+
+    def _compose(self, ch):
+        for func in self.funcs:
+            ch = func(ch)
+        return ch
+
+    def __call__(self, text):
+        if self.table is None:
+            return self.funcs[0](text)
+        return apply_table(text, self.table)
+
+
+class TranspositionRun:
+    """
+    Ardışık transpozisyonları uzunluk başına tek bir indeks dizisine
+    derler. Dolgu "X" karakterleri girdinin sonundaki sanal konumdan okunur.
+    """
+
+    def __init__(self, stages, decrypt):
+        self.stages = [(name, key) for name, key in stages if not _is_identity(name, key)]
+        self.decrypt = decrypt
+        self.strips = not decrypt and _TRANSPOSITIONS[stages[0][0]]
+        self._plans = {}
+
+    def _plan(self, length):
+        plan = self._plans.get(length)
+        if plan is not None:
+            return plan
+        indices = list(range(length))
+        if self.decrypt:
+            for name, key in self.stages:
+                inverse = transposition_inverse(name, key, length).indices
+                indices = [indices[j] for j in inverse]
+        else:
+            for name, key in self.stages:
+                width = transposition_width(name, key)
+                full = (len(indices) + width - 1) // width * width
+                indices += [length] * (full - len(indices))
+                order = transposition_permutation(name, key, full).indices
+                indices = [indices[j] for j in order]
+        plan = Permutation(indices)
+        if len(self._plans) < 64:
+            self._plans[length] = plan
+        return plan
+
+    def __call__(self, text):
+        if self.strips:
+            text = text.replace(" ", "").upper()
+        if not self.stages:
+            return text
+        return self._plan(len(text)).gather(text + "X")
+
+
+class OpaqueRun:
+    def __init__(self, cipher, prepared, decrypt):
+        self.call = cipher.decrypt if decrypt else cipher.encrypt
+        self.prepared = prepared
+
+    def __call__(self, text, timer):
+        return self.call(self.prepared, text, timer)[0]
+
+
+def _compile(stages, decrypt):
+    ops = []
+    group, kind = [], None
+
+    def flush():
+        if kind == "table":
+            ops.append(TableRun(group))
+        elif kind == "transposition":
+            ops.append(TranspositionRun(group, decrypt))
+
+    for name, cipher, prepared in stages:
+        if name in _TABLE_STAGES:
+            func = _TABLE_STAGES[name][1 if decrypt else 0](prepared)
+            if kind != "table":
+                flush()
+                group, kind = [], "table"
+            group.append(func)
+        elif name in _TRANSPOSITIONS:
+            key = _transposition_key(name, prepared)
+            # boşluk silen bir aşama, ancak grup zaten boşluksuz çıktı üretiyorsa katılabilir
+            joins = kind == "transposition" and (
+                decrypt or not _TRANSPOSITIONS[name] or _TRANSPOSITIONS[group[0][0]])
+            if not joins:
+                flush()
+                group, kind = [], "transposition"
+            group.append((name, key))
+        else:
+            flush()
+            group, kind = [], None
+            ops.append(OpaqueRun(cipher, prepared, decrypt))
+    flush()
+    return ops
+
+
+class CompiledPipeline:
+    def __init__(self, stages):
+        self.stages = stages
+        self.encrypt_ops = _compile(stages, decrypt=False)
+        self.decrypt_ops = _compile(list(reversed(stages)), decrypt=True)
+
+    @staticmethod
+    def _run(ops, text, timer):
+        timer = PhaseTimer() if timer is None else timer
+        for op in ops:
+            if isinstance(op, OpaqueRun):
+                text = op(text, timer)
+            else:
+                text = op(text)
+                timer.lap("core")
+        return text, timer.seconds
+
+    def encrypt(self, text, timer=None):
+        return self._run(self.encrypt_ops, text, timer)
+
+    def decrypt(self, text, timer=None):
+        return self._run(self.decrypt_ops, text, timer)
+
+
+def split_pipeline(name, key):
+    names = name.split(PIPELINE_SEPARATOR)
+    keys = key.split(PIPELINE_KEY_SEPARATOR) if key else []
+    keys += [""] * (len(names) - len(keys))
+    if len(keys) != len(names):
+        raise ValueError("Zincirdeki anahtar sayısı algoritma sayısından fazla")
+    return names, [k or None for k in keys]
+
+
+class PipelineCipher:
+    """Kayıt defterindeki Cipher arayüzünü zincirler için sağlar."""
+
+    timed = True
+    default_key = None
+
+    def __init__(self, registry, name):
+        self.registry = registry
+        self.name = name
+
+    def prepare(self, key):
+        names, keys = split_pipeline(self.name, key)
+        stages = []
+        for name, stage_key in zip(names, keys):
+            cipher = self.registry.get(name)
+            if cipher is None or isinstance(cipher, PipelineCipher) or name == "aes_session":
+                raise ValueError(f"Zincirde kullanılamayan algoritma: {name}")
+            stages.append((name, cipher, self.registry.prepare(name, stage_key)))
+        return CompiledPipeline(stages)
+
+    def encrypt(self, prepared, text, timer=None):
+        return prepared.encrypt(text, timer)
+
+    def decrypt(self, prepared, text, timer=None):
+        return prepared.decrypt(text, timer)
@@ -0,0 +1,84 @@
+"""
+Soket dinleyicisi için sınırlı işçi havuzu. Accept thread'i yalnızca
+bağlantıyı kabul edip kuyruğa atar; okuma ve çözme işçi thread'lerinde
+yapılır. Aynı anda en fazla max_connections bağlantı açık olur, fazlası
+acquire() üzerinde bekler ve kabul edilmeden kernel kuyruğunda kalır.
+
+İşçiler daemon thread'dir: açık kalan bir istemci bağlantısı süreç
+kapanışını bekletmez (ThreadPoolExecutor işçileri çıkışta join edilir).
+İşçiler ihtiyaç oldukça açılır: thread sayısı o ana kadarki en yüksek
+eşzamanlı bağlantı sayısıdır, max_connections'ı geçmez.
+"""
+import queue
+import threading
+
+MAX_CONNECTIONS = 32
+
+
+class ConnectionWorkers:
+    def __init__(self, handler, max_connections=MAX_CONNECTIONS, name="conn"):
+        if max_connections < 1:
+            raise ValueError("max_connections en az 1 olmalı")
+        self.handler = handler
+        self.max_connections = max_connections
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self._queue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self.name = name
+        self.active = 0
+        self.served = 0
+        self._threads = []
+        self._closed = False
+
+    def acquire(self, timeout=None):
+        """Boş bağlantı yeri bekler; accept() öncesinde çağrılır."""
+        return self._slots.acquire(timeout=timeout)
+
+    def release(self):
+        self._slots.release()
+
+    def submit(self, conn, addr):
+        """acquire() ile alınan yer, bağlantı kapandığında işçi tarafından bırakılır."""
+        with self._lock:
+            self.active += 1
+            # her işçi tek bağlantı işler; active (kuyruktakiler dahil) thread
+            # sayısını aşıyorsa boşta işçi yoktur
+            if self.active > len(self._threads) and not self._closed:
+                t = threading.Thread(target=self._work, name=f"{self.name}-{len(self._threads)}",
+                                     daemon=True)
+                self._threads.append(t)
+                t.start()
+        self._queue.put((conn, addr))
+
+    def _work(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            conn, addr = item
+            try:
+                self.handler(conn, addr)
+            except Exception:
+                pass
+            finally:
+                try:
+                    conn.close()
+                except OSError:
+                    pass
+                with self._lock:
+                    self.active -= 1
+                    self.served += 1
+                self._slots.release()
+
+    def shutdown(self):
+        """Boştaki işçileri durdurur; açık bağlantılar kapanınca diğerleri de çıkar."""
+        with self._lock:
+            self._closed = True
+            count = len(self._threads)
+        for _ in range(count):
+            self._queue.put(None)
+
+    def stats(self):
+        with self._lock:
+            return {"mode": "blocking", "active": self.active, "served": self.served,
+                    "threads": len(self._threads), "max_connections": self.max_connections}
@@ -1,78 +1,151 @@
 import math
 import os
+import re
+from fractions import Fraction
+from functools import lru_cache
 from des_from_scratch import des_encrypt_message, des_decrypt_message
 
 from des_with_library import des_encrypt_message_lib, des_decrypt_message_lib
 from aes_from_scratch import aes_encrypt_message, aes_decrypt_message
 from aes_with_library import aes_encrypt_message_lib, aes_decrypt_message_lib
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+TURKISH_CHARS = "çğıöşüÇĞİÖŞÜ"
+BULK_THRESHOLD = 4096
+
+
 def safe_char(c):
-    turkish_chars = "çğıöşüÇĞİÖŞÜ"
-    return c if c in turkish_chars else None
+    return c if c in TURKISH_CHARS else None
 
 def normalize_text(text):
     mapping = str.maketrans("ığüşöçİĞÜŞÖÇ", "igusocIGUSOC")
     return text.translate(mapping)
 
+
+class CharTable(dict):
+    """
+    str.translate için karakter tablosu. ASCII kısmı baştan hesaplanır,
+    diğer karakterler ilk görüldüklerinde func ile hesaplanıp saklanır.
+    """
+
+    def __init__(self, func):
+        super().__init__()
+        self.func = func
+        self._lut = None
+        for code in range(128):
+            self[code] = func(chr(code))
+
+    def __missing__(self, code):
+        value = self.func(chr(code))
+        self[code] = value
+        return value
+
+    def ascii_lut(self):
+        if self._lut is None:
+            values = "".join(self[code] for code in range(128))
+            if np is not None and len(values) == 128 and values.isascii():
+                self._lut = np.frombuffer(values.encode("ascii"), dtype=np.uint8)
+            else:
+                self._lut = False
+        return self._lut if self._lut is not False else None
+
+
+def _linear_char(mul, add):
+    def func(ch):
+        if safe_char(ch) or not ch.isalpha():
+            return ch
+        base = ord('A') if ch.isupper() else ord('a')
+        return chr((mul * (ord(ch) - base) + add) % 26 + base)
+    return func
+
+def _substitution_char(key_items):
+    mapping = dict(key_items)
+    def func(ch):
+        if safe_char(ch):
+            return ch
+        return mapping.get(ch, ch)
+    return func
+
+@lru_cache(maxsize=256)
+def translation_table(algorithm, key):
+    """
+    (algoritma, anahtar) için derlenmiş tablo.
+    linear: key = (a, b) -> (a*x + b) mod 26  (Caesar ve Affine)
+    substitution: key = key_map.items() demeti
+    """
+    if algorithm == "linear":
+        mul, add = key
+        return CharTable(_linear_char(mul % 26, add % 26))
+    if algorithm == "substitution":
+        return CharTable(_substitution_char(key))
+    raise ValueError(f"Bilinmeyen tablo algoritması: {algorithm}")
+
+def _to_ascii_codes(text):
+    return np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+
+def apply_table(text, table):
+    if np is not None and len(text) >= BULK_THRESHOLD and text.isascii():
+        lut = table.ascii_lut()
+        if lut is not None:
+            return lut[_to_ascii_codes(text)].tobytes().decode("ascii")
+    return text.translate(table)
+
 def caesar_encrypt(text, shift):
-    result = ""
-    for char in text:
-        if safe_char(char):
-            result += char
-        elif char.isalpha():
-            base = 'A' if char.isupper() else 'a'
-            result += chr((ord(char) - ord(base) + shift) % 26 + ord(base))
-        else:
-            result += char
-    return result
+    return apply_table(text, translation_table("linear", (1, shift)))
 
 def caesar_decrypt(cipher, shift):
     return caesar_encrypt(cipher, -shift)
 
-def vigenere_encrypt(text, key):
-    text = normalize_text(text)
-    key = normalize_text(key.lower())
-    result = ""
-    key_index = 0
+@lru_cache(maxsize=256)
+def vigenere_shifts(key):
+    return tuple((ord(k) - ord('a')) % 26 for k in normalize_text(key.lower()))
+
+def _vigenere_bulk(text, shifts, sign, start):
+    codes = _to_ascii_codes(text).astype(np.int16)
+    upper = (codes >= ord('A')) & (codes <= ord('Z'))
+    letters = upper | ((codes >= ord('a')) & (codes <= ord('z')))
+    key_index = np.cumsum(letters)[letters] - 1 + start
+    base = np.where(upper[letters], ord('A'), ord('a'))
+    shift = np.array(shifts, dtype=np.int16)[key_index % len(shifts)] * sign
+    codes[letters] = (codes[letters] - base + shift) % 26 + base
+    return codes.astype(np.uint8).tobytes().decode("ascii"), start + len(key_index)
+
+def vigenere_transform(text, shifts, sign, start=0):
+    """
+    Normalize edilmiş metni dönüştürür; start anahtar indeksinin başlangıcıdır.
+    (sonuç, sonraki anahtar indeksi) döner.
+    """
+    if np is not None and shifts and len(text) >= BULK_THRESHOLD and text.isascii():
+        return _vigenere_bulk(text, shifts, sign, start)
+    # periyodik tablo: anahtarın her harfi için bir kaydırma tablosu
+    tables = [translation_table("linear", (1, sign * s)) for s in shifts]
+    period = len(tables)
+    result = []
+    key_index = start
     for char in text:
-        if safe_char(char):
-            result += char
-        elif char.isalpha():
-            shift = ord(key[key_index % len(key)]) - ord('a')
-            base = ord('A') if char.isupper() else ord('a')
-            result += chr((ord(char) - base + shift) % 26 + base)
+        if char.isalpha():
+            result.append(tables[key_index % period][ord(char)])
             key_index += 1
         else:
-            result += char
-    return result
+            result.append(char)
+    return "".join(result), key_index
+
+def _vigenere_apply(text, key, sign):
+    return vigenere_transform(normalize_text(text), vigenere_shifts(key), sign)[0]
+
+def vigenere_encrypt(text, key):
+    return _vigenere_apply(text, key, 1)
 
 def vigenere_decrypt(cipher, key):
-    cipher = normalize_text(cipher)
-    key = normalize_text(key.lower())
-    result = ""
-    key_index = 0
-    for char in cipher:
-        if safe_char(char):
-            result += char
-        elif char.isalpha():
-            shift = ord(key[key_index % len(key)]) - ord('a')
-            base = ord('A') if char.isupper() else ord('a')
-            result += chr((ord(char) - base - shift) % 26 + base)
-            key_index += 1
-        else:
-            result += char
-    return result
+    return _vigenere_apply(cipher, key, -1)
 
 def substitution_encrypt(text, key_map):
-    result = ""
-    for char in text.lower():
-        if safe_char(char):
-            result += char
-        elif char in key_map:
-            result += key_map[char]
-        else:
-            result += char
-    return result
+    table = translation_table("substitution", tuple(key_map.items()))
+    return apply_table(text.lower(), table)
 
 def substitution_decrypt(cipher, key_map):
     rev_map = {v: k for k, v in key_map.items()}
@@ -81,34 +154,16 @@ def substitution_decrypt(cipher, key_map):
 def affine_encrypt(text, a, b):
     if math.gcd(a, 26) != 1:
         raise ValueError("a değeri 26 ile aralarında asal olmalı")
-    result = ""
-    for char in text:
-        if safe_char(char):
-            result += char
-        elif char.isalpha():
-            base = 'A' if char.isupper() else 'a'
-            result += chr(((a * (ord(char) - ord(base)) + b) % 26) + ord(base))
-        else:
-            result += char
-    return result
+    return apply_table(text, translation_table("linear", (a, b)))
 
 def affine_decrypt(cipher, a, b):
     if math.gcd(a, 26) != 1:
         raise ValueError("a değeri 26 ile aralarında asal olmalı")
-    result = ""
     try:
         a_inv = pow(a, -1, 26)
     except ValueError:
         raise ValueError("a değeri için mod ters hesaplanamadı")
-    for char in cipher:
-        if safe_char(char):
-            result += char
-        elif char.isalpha():
-            base = 'A' if char.isupper() else 'a'
-            result += chr((a_inv * ((ord(char) - ord(base) - b)) % 26) + ord(base))
-        else:
-            result += char
-    return result
+    return apply_table(cipher, translation_table("linear", (a_inv, -a_inv * b)))
 
 def prepare_playfair_matrix(key):
     key = normalize_text(key.lower().replace("j", "i"))
@@ -128,230 +183,198 @@ def playfair_find_position(matrix, char):
                 return i, j
     return None, None
 
-def playfair_prepare_text(text):
+def playfair_letters(text):
     text = normalize_text(text.lower().replace("j", "i"))
-    cleaned = [c for c in text if c.isalpha()]
+    return "".join([c for c in text if c.isalpha()])
+
+def playfair_digraphs(letters):
+    """
+    Harfleri digraflara böler. Eşleşmemiş son harf ikinci değer olarak döner;
+    akış şifrelemede bir sonraki parçayla birleştirilir.
+    """
     pairs = []
     i = 0
-    while i < len(cleaned):
-        a = cleaned[i]
-        b = ''
-        if i + 1 < len(cleaned):
-            b = cleaned[i + 1]
+    while i + 1 < len(letters):
+        a = letters[i]
+        b = letters[i + 1]
         if a == b:
-            pairs.append((a, 'x'))
+            pairs.append(a + 'x')
             i += 1
         else:
-            if b:
-                pairs.append((a, b))
-                i += 2
-            else:
-                pairs.append((a, 'x'))
-                i += 1
-    return pairs
+            pairs.append(a + b)
+            i += 2
+    return pairs, letters[i:]
 
-def playfair_encrypt(text, key):
+def playfair_prepare_text(text):
+    pairs, rest = playfair_digraphs(playfair_letters(text))
+    if rest:
+        pairs.append(rest + 'x')
+    return [(p[0], p[1]) for p in pairs]
+
+def _playfair_digraph(matrix, row_a, col_a, row_b, col_b, step):
+    if row_a == row_b:
+        pair = matrix[row_a][(col_a + step) % 5] + matrix[row_b][(col_b + step) % 5]
+    elif col_a == col_b:
+        pair = matrix[(row_a + step) % 5][col_a] + matrix[(row_b + step) % 5][col_b]
+    else:
+        pair = matrix[row_a][col_b] + matrix[row_b][col_a]
+    return pair.upper()
+
+@lru_cache(maxsize=128)
+def playfair_tables(key):
+    """
+    Anahtar başına bir kez: 25x25 digraf -> digraf şifreleme ve çözme tabloları.
+    """
     matrix = prepare_playfair_matrix(key)
-    pairs = playfair_prepare_text(text)
-    result = ""
-    for a, b in pairs:
-        row_a, col_a = playfair_find_position(matrix, a)
-        row_b, col_b = playfair_find_position(matrix, b)
-        if row_a == row_b:
-            result += matrix[row_a][(col_a + 1) % 5]
-            result += matrix[row_b][(col_b + 1) % 5]
-        elif col_a == col_b:
-            result += matrix[(row_a + 1) % 5][col_a]
-            result += matrix[(row_b + 1) % 5][col_b]
-        else:
-            result += matrix[row_a][col_b]
-            result += matrix[row_b][col_a]
-    return result.upper()
+    positions = {ch: (r, c) for r, row in enumerate(matrix) for c, ch in enumerate(row)}
+    encrypt_table = {}
+    decrypt_table = {}
+    for a, (row_a, col_a) in positions.items():
+        for b, (row_b, col_b) in positions.items():
+            encrypt_table[a + b] = _playfair_digraph(matrix, row_a, col_a, row_b, col_b, 1)
+            decrypt_table[a + b] = _playfair_digraph(matrix, row_a, col_a, row_b, col_b, -1)
+    return encrypt_table, decrypt_table
+
+def playfair_encrypt(text, key):
+    table = playfair_tables(key)[0]
+    pairs, rest = playfair_digraphs(playfair_letters(text))
+    if rest:
+        pairs.append(rest + 'x')
+    return "".join([table[pair] for pair in pairs])
 
 def playfair_decrypt(cipher, key):
-    matrix = prepare_playfair_matrix(key)
+    table = playfair_tables(key)[1]
     cipher = normalize_text(cipher.lower().replace("j", "i"))
-    pairs = [(cipher[i], cipher[i + 1]) for i in range(0, len(cipher), 2)]
-    result = ""
-    for a, b in pairs:
-        row_a, col_a = playfair_find_position(matrix, a)
-        row_b, col_b = playfair_find_position(matrix, b)
-        if row_a == row_b:
-            result += matrix[row_a][(col_a - 1) % 5]
-            result += matrix[row_b][(col_b - 1) % 5]
-        elif col_a == col_b:
-            result += matrix[(row_a - 1) % 5][col_a]
-            result += matrix[(row_b - 1) % 5][col_b]
-        else:
-            result += matrix[row_a][col_b]
-            result += matrix[row_b][col_a]
-    return result.upper()
-def rail_fence_encrypt(text, key):
-    if not isinstance(key, int) or key <= 1 or len(text) <= 1:
-        return text
-    rails = ['' for _ in range(key)]
-    direction_down = False
-    row = 0
-    for char in text:
-        rails[row] += char
-        if row == 0 or row == key - 1:
-            direction_down = not direction_down
-        row += 1 if direction_down else -1
-    return ''.join(rails)
+    if len(cipher) % 2 == 1:
+        raise ValueError("Playfair şifreli metni çift sayıda harf içermeli")
+    return "".join([table[cipher[i:i + 2]] for i in range(0, len(cipher), 2)])
 
+class Permutation:
+    """Derlenmiş indeks dizisi: gather(text)[i] == text[indices[i]]."""
 
+    __slots__ = ("indices", "_array")
 
-def rail_fence_decrypt(cipher, key):
-    if not isinstance(key, int) or key <= 1 or len(cipher) <= 1:
-        return cipher
-    if not isinstance(key, int) or key <= 1:
-        raise ValueError("Anahtar (satır sayısı) 2 veya daha büyük bir tam sayı olmalıdır")
-    rail_pattern = []
-    direction_down = None
-    row = 0
-    for _ in range(len(cipher)):
-        rail_pattern.append(row)
-        if row == 0:
-            direction_down = True
-        elif row == key - 1:
-            direction_down = False
-        row += 1 if direction_down else -1
-    rails = ['' for _ in range(key)]
-    index = 0
-    for i in range(key):
-        for j in range(len(cipher)):
-            if rail_pattern[j] == i:
-                rails[i] += cipher[index]
-                index += 1
-    result = ''
-    rail_pos = [0] * key
-    row = 0
-    for i in range(len(cipher)):
-        result += rails[row][rail_pos[row]]
-        rail_pos[row] += 1
-        if row == 0:
-            direction_down = True
-        elif row == key - 1:
-            direction_down = False
-        row += 1 if direction_down else -1
-    return result
+    def __init__(self, indices):
+        self.indices = indices
+        self._array = None
 
-def route_encrypt(text, cols, clockwise=True):
-    text = text.replace(" ", "").upper()
-    if not cols or cols <= 0:
-        return text
-    rows = (len(text) + cols - 1) // cols
-    matrix = [["X" for _ in range(cols)] for _ in range(rows)]
-    idx = 0
-    for r in range(rows):
-        for c in range(cols):
-            if idx < len(text):
-                matrix[r][c] = text[idx]
-                idx += 1
+    def __len__(self):
+        return len(self.indices)
 
-    result = []
+    def gather(self, text):
+        if np is not None and len(self.indices) >= BULK_THRESHOLD:
+            if self._array is None:
+                self._array = np.array(self.indices, dtype=np.intp)
+            if text.isascii():
+                return _to_ascii_codes(text)[self._array].tobytes().decode("ascii")
+            codes = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+            return codes[self._array].tobytes().decode("utf-32-le")
+        return "".join([text[i] for i in self.indices])
+
+
+def _rail_fence_order(rails, length):
+    cycle = 2 * (rails - 1)
+    rows = [min(i % cycle, cycle - i % cycle) for i in range(length)]
+    return sorted(range(length), key=rows.__getitem__)
+
+def _route_order(cols, length):
+    rows = (length + cols - 1) // cols
+    order = []
     top, left = 0, 0
     bottom, right = rows - 1, cols - 1
-
     while top <= bottom and left <= right:
-        for c in range(right, left - 1, -1):
-            result.append(matrix[top][c])
+        order.extend(top * cols + c for c in range(right, left - 1, -1))
         top += 1
-        for r in range(top, bottom + 1):
-            result.append(matrix[r][left])
+        order.extend(r * cols + left for r in range(top, bottom + 1))
         left += 1
         if top <= bottom:
-            for c in range(left, right + 1):
-                result.append(matrix[bottom][c])
+            order.extend(bottom * cols + c for c in range(left, right + 1))
             bottom -= 1
         if left <= right:
-            for r in range(bottom, top - 1, -1):
-                result.append(matrix[r][right])
+            order.extend(r * cols + right for r in range(bottom, top - 1, -1))
             right -= 1
-    return "".join(result)
+    return order
 
+def _columnar_order(key, length):
+    cols = len(key)
+    rows = (length + cols - 1) // cols
+    col_order = sorted(range(cols), key=key.__getitem__)
+    return [r * cols + c for c in col_order for r in range(rows)]
+
+_TRANSPOSITION_ORDERS = {
+    "railfence": _rail_fence_order,
+    "route": _route_order,
+    "columnar": _columnar_order,
+}
+
+def transposition_width(algorithm, key):
+    if algorithm == "route":
+        return key
+    if algorithm == "columnar":
+        return len(key)
+    return 1
+
+def padded_length(algorithm, key, length):
+    width = transposition_width(algorithm, key)
+    return (length + width - 1) // width * width
+
+@lru_cache(maxsize=256)
+def transposition_permutation(algorithm, key, length):
+    """Şifreleme sırası: çıktının i. karakteri girdinin indices[i]. karakteri."""
+    return Permutation(_TRANSPOSITION_ORDERS[algorithm](key, length))
+
+@lru_cache(maxsize=256)
+def transposition_inverse(algorithm, key, length):
+    """
+    Çözme sırası, şifreleme permütasyonundan türetilir. Izgarayı tam
+    doldurmayan (kısa) metinlerde yalnızca ilk length konum kullanılır.
+    """
+    full = padded_length(algorithm, key, length)
+    positions = transposition_permutation(algorithm, key, full).indices[:length]
+    if full == length:
+        inverse = [0] * length
+        for i, pos in enumerate(positions):
+            inverse[pos] = i
+    else:
+        inverse = sorted(range(length), key=positions.__getitem__)
+    return Permutation(inverse)
+
+def _pad_to_grid(text, width):
+    rows = (len(text) + width - 1) // width
+    return text + "X" * (rows * width - len(text))
+
+def rail_fence_encrypt(text, key):
+    if not isinstance(key, int) or key <= 1 or len(text) <= 1:
+        return text
+    return transposition_permutation("railfence", key, len(text)).gather(text)
+
+def rail_fence_decrypt(cipher, key):
+    if not isinstance(key, int) or key <= 1 or len(cipher) <= 1:
+        return cipher
+    return transposition_inverse("railfence", key, len(cipher)).gather(cipher)
+
+def route_encrypt(text, cols, clockwise=True):
+    text = text.replace(" ", "").upper()
+    if not cols or cols <= 0:
+        return text
+    text = _pad_to_grid(text, cols)
+    return transposition_permutation("route", cols, len(text)).gather(text)
 
 def route_decrypt(cipher, cols, clockwise=True):
     if not cols or cols <= 0:
         return cipher
-    text = list(cipher)
-    rows = (len(cipher) + cols - 1) // cols
-    matrix = [["" for _ in range(cols)] for _ in range(rows)]
-    top, left = 0, 0
-    bottom, right = rows - 1, cols - 1
-    idx = 0
-
-    while top <= bottom and left <= right:
-        for c in range(right, left - 1, -1):
-            if idx < len(cipher):
-                matrix[top][c] = text[idx]
-                idx += 1
-        top += 1
-        for r in range(top, bottom + 1):
-            if idx < len(cipher):
-                matrix[r][left] = text[idx]
-                idx += 1
-        left += 1
-        if top <= bottom:
-            for c in range(left, right + 1):
-                if idx < len(cipher):
-                    matrix[bottom][c] = text[idx]
-                    idx += 1
-            bottom -= 1
-        if left <= right:
-            for r in range(bottom, top - 1, -1):
-                if idx < len(cipher):
-                    matrix[r][right] = text[idx]
-                    idx += 1
-            right -= 1
+    return transposition_inverse("route", cols, len(cipher)).gather(cipher)
 
-    result = []
-    for r in range(rows):
-        for c in range(cols):
-            result.append(matrix[r][c])
-    return "".join(result)
 def columnar_encrypt(text, key):
     text = text.replace(" ", "").upper()
     key = key.upper()
-    cols = len(key)
-    rows = (len(text) + cols - 1) // cols
-    matrix = [["X" for _ in range(cols)] for _ in range(rows)]
-    idx = 0
-    for r in range(rows):
-        for c in range(cols):
-            if idx < len(text):
-                matrix[r][c] = text[idx]
-                idx += 1
-    key_order = sorted(list(key))
-    order = [key_order.index(k) + 1 for k in key]
-    result = ""
-    for num in sorted(order):
-        col = order.index(num)
-        for r in range(rows):
-            result += matrix[r][col]
-    return result
-
+    text = _pad_to_grid(text, len(key))
+    return transposition_permutation("columnar", key, len(text)).gather(text)
 
 def columnar_decrypt(cipher, key):
     key = key.upper()
-    cols = len(key)
-    rows = (len(cipher) + cols - 1) // cols
-    key_order = sorted(list(key))
-    order = [key_order.index(k) + 1 for k in key]
-    matrix = [["" for _ in range(cols)] for _ in range(rows)]
-    col_lengths = [rows] * cols
-    idx = 0
-    for num in sorted(order):
-        col = order.index(num)
-        for r in range(col_lengths[col]):
-            if idx < len(cipher):
-                matrix[r][col] = cipher[idx]
-                idx += 1
-    result = ""
-    for r in range(rows):
-        for c in range(cols):
-            result += matrix[r][c]
-    return result
+    return transposition_inverse("columnar", key, len(cipher)).gather(cipher)
+
 def polybius_encrypt(text):
     text = normalize_text(text).upper().replace("J", "I").replace(" ", "")
     alphabet = "ABCDEFGHIKLMNOPQRSTUVWXYZ"
@@ -367,8 +390,10 @@ def polybius_encrypt(text):
     return "".join(out)
 
 
-def polybius_decrypt(cipher):
-    cipher = cipher.replace(" ", "")
+def polybius_decode(cipher):
+    """
+    (çözülen metin, kalan) döner; kalan, eşi henüz gelmemiş tek rakamdır.
+    """
     alphabet = "ABCDEFGHIKLMNOPQRSTUVWXYZ"
     out = []
     i = 0
@@ -380,100 +405,125 @@ def polybius_decrypt(cipher):
             if 0 <= idx < 25:
                 out.append(alphabet[idx])
             i += 2
+        elif i + 1 == len(cipher) and cipher[i].isdigit():
+            return "".join(out), cipher[i]
         else:
             i += 1
-    return "".join(out)
+    return "".join(out), ""
+
+
+def polybius_decrypt(cipher):
+    return polybius_decode(cipher.replace(" ", ""))[0]
+PIGPEN_GLYPHS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_PIGPEN_DROP = re.compile(f"[^{PIGPEN_GLYPHS}]+")
+
 def pigpen_encrypt(text):
-    base_path = "static/pigpen"
-    text = text.upper().replace(" ", "")
-    result = []
-    for ch in text:
-        if 'A' <= ch <= 'Z':
-            result.append(f"/{base_path}/{ch}.png")
-    return "|".join(result)
+    # her sembol tek karakter: PIGPEN_GLYPHS içindeki sırası glif indeksidir
+    return _PIGPEN_DROP.sub("", text.upper())
 
 def pigpen_decrypt(cipher):
-    parts = cipher.split("|")
-    result = ""
-    for p in parts:
-        if p.strip():
-            ch = p.split("/")[-1].split(".")[0]
-            result += ch
-    return result
+    if "|" in cipher or "/" in cipher:
+        # eski biçim: "/static/pigpen/A.png|/static/pigpen/B.png"
+        parts = cipher.split("|")
+        return "".join(p.split("/")[-1].split(".")[0] for p in parts if p.strip())
+    return _PIGPEN_DROP.sub("", cipher)
 
 
 def _hill_parse_key(key_str):
     """
-    key_str: 2x2 matris için 4 sayı (virgül veya boşlukla ayrılmış)
-    Örn: "3 3 2 5" veya "3,3,2,5"
+    key_str: n x n matris için n*n sayı, satır satır (virgül veya boşlukla ayrılmış)
+    Örn: "3 3 2 5" (2x2) veya "6 24 1 13 16 10 20 17 15" (3x3)
     """
     parts = key_str.replace(",", " ").split()
-    if len(parts) != 4:
-        raise ValueError("Hill anahtarı 4 sayı içermeli (2x2 matris). Örn: '3 3 2 5'")
+    size = math.isqrt(len(parts))
+    if size < 2 or size * size != len(parts):
+        raise ValueError("Hill anahtarı n×n matris için kare sayıda (4, 9, 16, ...) sayı içermeli. Örn: '3 3 2 5'")
 
     nums = []
     for p in parts:
         if not p.lstrip("-").isdigit():
             raise ValueError("Hill anahtarı sadece tam sayılardan oluşmalıdır.")
         nums.append(int(p) % 26)
-
-    a, b, c, d = nums
-    det = (a * d - b * c) % 26
-    if math.gcd(det, 26) != 1:
+    return tuple(tuple(nums[r * size:(r + 1) * size]) for r in range(size))
+
+
+def _hill_det_adjugate(matrix):
+    # Fraction ile tam Gauss-Jordan; det * A^-1 = adj(A) tam sayıdır
+    size = len(matrix)
+    rows = [[Fraction(v) for v in row] + [Fraction(int(r == c)) for c in range(size)]
+            for r, row in enumerate(matrix)]
+    det = Fraction(1)
+    for col in range(size):
+        pivot = next((r for r in range(col, size) if rows[r][col] != 0), None)
+        if pivot is None:
+            return 0, None
+        if pivot != col:
+            rows[col], rows[pivot] = rows[pivot], rows[col]
+            det = -det
+        pivot_value = rows[col][col]
+        det *= pivot_value
+        rows[col] = [v / pivot_value for v in rows[col]]
+        for r in range(size):
+            if r != col and rows[r][col] != 0:
+                factor = rows[r][col]
+                rows[r] = [v - factor * w for v, w in zip(rows[r], rows[col])]
+    adjugate = [[int(v * det) for v in row[size:]] for row in rows]
+    return int(det), adjugate
+
+
+def _hill_inverse_matrix(matrix):
+    det, adjugate = _hill_det_adjugate(matrix)
+    if math.gcd(det % 26, 26) != 1:
         raise ValueError("Geçersiz Hill anahtarı: determinant 26 ile aralarında asal olmalı.")
-    return a, b, c, d
+    det_inv = pow(det % 26, -1, 26)
+    return tuple(tuple(det_inv * v % 26 for v in row) for row in adjugate)
 
 
-def _hill_inverse_matrix(a, b, c, d):
-    det = (a * d - b * c) % 26
-    det_inv = pow(det, -1, 26)  
-    ia = ( det_inv * d) % 26
-    ib = (-det_inv * b) % 26
-    ic = (-det_inv * c) % 26
-    id = ( det_inv * a) % 26
-    return ia, ib, ic, id
+@lru_cache(maxsize=128)
+def hill_prepare_key(key):
+    matrix = _hill_parse_key(key)
+    return matrix, _hill_inverse_matrix(matrix)
 
 
-def hill_encrypt(text, key):
-  
-    a, b, c, d = _hill_parse_key(key)
-    text = normalize_text(text).lower()
-    letters = [ch for ch in text if ch.isalpha()]
+@lru_cache(maxsize=128)
+def _hill_array(matrix):
+    return np.array(matrix, dtype=np.int64).T
 
-    
-    if len(letters) % 2 == 1:
-        letters.append('x')
 
+def _hill_letter_codes(text):
+    text = normalize_text(text).lower()
+    if text.isascii():
+        codes = _to_ascii_codes(text)
+        return codes[(codes >= ord('a')) & (codes <= ord('z'))].astype(np.int64) - ord('a')
+    letters = "".join([ch for ch in text if ch.isalpha()])
+    codes = np.frombuffer(letters.encode("utf-32-le"), dtype=np.uint32).astype(np.int64)
+    return (codes - ord('a')) % 26
+
+
+def hill_apply(text, matrix):
+    """Metni (n/N)xN blok matrise çevirip tek çarpımla mod 26 dönüştürür."""
+    size = len(matrix)
+    if np is not None:
+        codes = _hill_letter_codes(text)
+        padding = np.full(-len(codes) % size, ord('x') - ord('a'), dtype=np.int64)
+        blocks = np.concatenate([codes, padding]).reshape(-1, size)
+        out = (blocks @ _hill_array(matrix)) % 26 + ord('A')
+        return out.astype(np.uint8).tobytes().decode("ascii")
+
+    text = normalize_text(text).lower()
+    letters = [ch for ch in text if ch.isalpha()]
+    letters += ['x'] * (-len(letters) % size)
     result = []
-    for i in range(0, len(letters), 2):
-        p0 = ord(letters[i])   - ord('a')
-        p1 = ord(letters[i+1]) - ord('a')
-        c0 = (a * p0 + b * p1) % 26
-        c1 = (c * p0 + d * p1) % 26
-        result.append(chr(c0 + ord('A')))
-        result.append(chr(c1 + ord('A')))
+    for i in range(0, len(letters), size):
+        block = [(ord(ch) - ord('a')) % 26 for ch in letters[i:i + size]]
+        for row in matrix:
+            result.append(chr(sum(k * p for k, p in zip(row, block)) % 26 + ord('A')))
     return "".join(result)
 
 
-def hill_decrypt(cipher, key):
-   
-    a, b, c, d = _hill_parse_key(key)
-    ia, ib, ic, id = _hill_inverse_matrix(a, b, c, d)
-
-    cipher = normalize_text(cipher).lower()
-    letters = [ch for ch in cipher if ch.isalpha()]
+def hill_encrypt(text, key):
+    return hill_apply(text, hill_prepare_key(key)[0])
 
-  
-    if len(letters) % 2 == 1:
-        letters.append('x')
-
-    result = []
-    for i in range(0, len(letters), 2):
-        c0 = ord(letters[i])   - ord('a')
-        c1 = ord(letters[i+1]) - ord('a')
-        p0 = (ia * c0 + ib * c1) % 26
-        p1 = (ic * c0 + id * c1) % 26
-        result.append(chr(p0 + ord('A')))
-        result.append(chr(p1 + ord('A')))
-    return "".join(result)
 
+def hill_decrypt(cipher, key):
+    return hill_apply(cipher, hill_prepare_key(key)[1])
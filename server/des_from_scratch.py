@@ -1,4 +1,13 @@
-import time
+import struct
+
+from buffers import byte_view, output_view
+from key_schedule import cached_schedule
+from timing import PhaseTimer
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 IP = [
     58, 50, 42, 34, 26, 18, 10,  2,
@@ -121,77 +130,187 @@ S_BOXES = [
 
 
 
-def hex_to_bin(hex_str: str, bits: int) -> str:
-    return bin(int(hex_str, 16))[2:].zfill(bits)
-
-def bin_to_hex(bin_str: str, hex_len: int) -> str:
-    return hex(int(bin_str, 2))[2:].upper().zfill(hex_len)
+# Tamsayı çekirdeği: bloklar 64-bit int, bit 1 = en anlamlı bit.
 
-def permute(bits: str, table: list[int]) -> str:
-    return ''.join(bits[i - 1] for i in table)
+def _permutation_tables(table: list[int], in_bits: int) -> tuple:
+    """Bayt indeksli permütasyon: girdinin j. baytının her değeri için çıktı bitleri."""
+    out_bits = len(table)
+    tables = []
+    for j in range(in_bits // 8):
+        row = []
+        for v in range(256):
+            word = 0
+            for pos, src in enumerate(table):
+                if (src - 1) // 8 == j and (v >> (7 - (src - 1) % 8)) & 1:
+                    word |= 1 << (out_bits - 1 - pos)
+            row.append(word)
+        tables.append(tuple(row))
+    return tuple(tables)
 
-def left_shift(bits: str, n: int) -> str:
-    return bits[n:] + bits[:n]
-
-def xor(a: str, b: str) -> str:
-    return ''.join('1' if x != y else '0' for x, y in zip(a, b))
+def _permute_int(value: int, table: list[int], in_bits: int) -> int:
+    out = 0
+    for src in table:
+        out = (out << 1) | ((value >> (in_bits - src)) & 1)
+    return out
 
+def _sp_tables() -> tuple:
+    """S-kutusu + P: 6-bit girdi -> P uygulanmış 32-bit katkı (kutu başına)."""
+    tables = []
+    for i in range(8):
+        row = []
+        for v in range(64):
+            s = S_BOXES[i][((v >> 4) & 2) | (v & 1)][(v >> 1) & 15]
+            row.append(_permute_int(s << (28 - 4 * i), P, 32))
+        tables.append(tuple(row))
+    return tuple(tables)
 
+def _rotl28(value: int, n: int) -> int:
+    return ((value << n) | (value >> (28 - n))) & 0xFFFFFFF
 
-def generate_round_keys(key_hex: str) -> list[str]:
-    key_bin = hex_to_bin(key_hex, 64)
-    key56 = permute(key_bin, PC1)
-    C = key56[:28]
-    D = key56[28:]
+def generate_round_keys(key: int) -> list[int]:
+    """64-bit anahtardan 16 adet 48-bit round anahtarı (PC1, kaydırma, PC2)."""
+    key56 = _permute_int(key, PC1, 64)
+    C = key56 >> 28
+    D = key56 & 0xFFFFFFF
     keys = []
     for s in SHIFT_SCHEDULE:
-        C = left_shift(C, s)
-        D = left_shift(D, s)
-        keys.append(permute(C + D, PC2))
+        C = _rotl28(C, s)
+        D = _rotl28(D, s)
+        keys.append(_permute_int((C << 28) | D, PC2, 56))
     return keys
 
+IP_TABLES = _permutation_tables(IP, 64)
+FP_TABLES = _permutation_tables(FP, 64)
+SP_TABLES = _sp_tables()
 
 
-def sbox_substitution(bits48: str) -> str:
-    out = ""
-    for i in range(8):
-        chunk = bits48[i*6:(i+1)*6]
-        row = int(chunk[0] + chunk[5], 2)
-        col = int(chunk[1:5], 2)
-        val = S_BOXES[i][row][col]
-        out += bin(val)[2:].zfill(4)
+def des_round_keys(key_hex: str) -> tuple:
+    """
+    16 round anahtarı, her biri 8 adet 6-bit parça (S-kutusu girdileri);
+    türetilmiş anahtar başına bir kez hesaplanır.
+    """
+    def build(key):
+        keys = []
+        for k in generate_round_keys(int.from_bytes(key, "big")):
+            keys.append(tuple((k >> (42 - 6 * i)) & 63 for i in range(8)))
+        return tuple(keys)
+    return cached_schedule("des", bytes.fromhex(key_hex), build)
+
+
+def des_crypt_block_int(block: int, keys) -> int:
+    """Tek 64-bit blok; çözme için keys ters sırada verilir."""
+    t0, t1, t2, t3, t4, t5, t6, t7 = IP_TABLES
+    x = (t0[block >> 56] | t1[(block >> 48) & 255] | t2[(block >> 40) & 255] | t3[(block >> 32) & 255]
+         | t4[(block >> 24) & 255] | t5[(block >> 16) & 255] | t6[(block >> 8) & 255] | t7[block & 255])
+    L = x >> 32
+    R = x & 0xFFFFFFFF
+    sp0, sp1, sp2, sp3, sp4, sp5, sp6, sp7 = SP_TABLES
+    for k0, k1, k2, k3, k4, k5, k6, k7 in keys:
+        # E genişletmesi: sağa 1 döndürülmüş R'nin ardışık 6-bit pencereleri
+        rr = ((R >> 1) | (R << 31)) & 0xFFFFFFFF
+        f = (sp0[(rr >> 26) ^ k0] | sp1[((rr >> 22) & 63) ^ k1]
+             | sp2[((rr >> 18) & 63) ^ k2] | sp3[((rr >> 14) & 63) ^ k3]
+             | sp4[((rr >> 10) & 63) ^ k4] | sp5[((rr >> 6) & 63) ^ k5]
+             | sp6[((rr >> 2) & 63) ^ k6] | sp7[(((R << 1) | (R >> 31)) & 63) ^ k7])
+        L, R = R, L ^ f
+    x = (R << 32) | L
+    t0, t1, t2, t3, t4, t5, t6, t7 = FP_TABLES
+    return (t0[x >> 56] | t1[(x >> 48) & 255] | t2[(x >> 40) & 255] | t3[(x >> 32) & 255]
+            | t4[(x >> 24) & 255] | t5[(x >> 16) & 255] | t6[(x >> 8) & 255] | t7[x & 255])
+
+_unpack_block = struct.Struct(">Q").unpack_from
+_pack_block = struct.Struct(">Q").pack_into
+
+def des_crypt_bytes(data, keys, out=None):
+    """ECB, len(data) 8'in katı; sonuç out'a (yoksa yeni bytearray'e) yazılır ve döner."""
+    if out is None:
+        out = bytearray(len(data))
+    for i in range(0, len(data), 8):
+        _pack_block(out, i, des_crypt_block_int(_unpack_block(data, i)[0], keys))
     return out
 
-def feistel_function(R32: str, K48: str) -> str:
-    R48 = permute(R32, E)
-    x = xor(R48, K48)
-    s = sbox_substitution(x)
-    return permute(s, P)
+# Bitsliced DES: 64 bağımsız blok bir uint64 kelimede, her bit konumu
+# (64, W) boyutlu bir "bit düzlemi" dizisi. Permütasyonlar satır seçimine,
+# S-kutuları 6 seviyeli multiplexer ağacına (boolean devre) dönüşür ve
+# sekiz kutu x dört çıkış biti tek seferde hesaplanır.
+DES_BITSLICE_THRESHOLD = 128
+DES_BITSLICE_CHUNK = 8192
+
+if np is not None:
+    _ONES = 0xFFFFFFFFFFFFFFFF
+    _IP_IDX = np.array(IP) - 1
+    _FP_IDX = np.array(FP) - 1
+    _E_IDX = np.array(E) - 1
+    _P_IDX = np.array(P) - 1
+    # (kutu, çıkış biti, 6-bit girdi, 1): çıkış biti 1 ise tüm bitleri 1 olan maske
+    _SBOX_TRUTH = np.array([
+        [[_ONES if (S_BOXES[i][((v >> 4) & 2) | (v & 1)][(v >> 1) & 15] >> (3 - j)) & 1 else 0
+          for v in range(64)] for j in range(4)]
+        for i in range(8)
+    ], dtype=np.uint64)[..., None]
+
+
+def _sboxes_bitsliced(x):
+    """x: (8 kutu, 6 girdi biti, W) -> P öncesi 32 çıkış düzlemi (32, W)."""
+    t = _SBOX_TRUTH
+    for b in range(5, -1, -1):
+        # girdi biti b'ye göre çiftlerden birini seç: lo ^ ((lo ^ hi) & x)
+        lo, hi = t[:, :, 0::2], t[:, :, 1::2]
+        t = lo ^ ((lo ^ hi) & x[:, b][:, None, None, :])
+    return t[:, :, 0].reshape(32, -1)
+
+def des_bitslice_key_masks(key_hex: str):
+    """(16, 48, 1) uint64 round anahtarı maskeleri (bit 1 -> tüm bitler 1)."""
+    def build(key):
+        masks = np.zeros((16, 48), dtype=np.uint64)
+        for r, chunks in enumerate(des_round_keys(key.hex().upper())):
+            for i, chunk in enumerate(chunks):
+                for b in range(6):
+                    if (chunk >> (5 - b)) & 1:
+                        masks[r, 6 * i + b] = _ONES
+        return masks[:, :, None]
+    return cached_schedule("des_bitslice", bytes.fromhex(key_hex), build)
+
+def des_crypt_bytes_bitsliced(data, masks, out=None):
+    """ECB, len(data) 8'in katı; çözme için masks ters sırada verilir."""
+    n = len(data) // 8
+    if out is None:
+        out = bytearray(len(data))
+    blocks = np.frombuffer(data, dtype=np.uint8).reshape(n, 8)
+    dst = np.frombuffer(out, dtype=np.uint8)[:n * 8].reshape(n, 8)
+    for start in range(0, n, DES_BITSLICE_CHUNK):
+        chunk = blocks[start:start + DES_BITSLICE_CHUNK]
+        m = len(chunk)
+        bits = np.zeros((64, -(-m // 64) * 64), dtype=np.uint8)
+        bits[:, :m] = np.unpackbits(chunk, axis=1).T
+        planes = np.packbits(bits, axis=1).view(np.uint64)[_IP_IDX]
+        L, R = planes[:32], planes[32:]
+        for rnd in range(16):
+            x = (R[_E_IDX] ^ masks[rnd]).reshape(8, 6, -1)
+            L, R = R, L ^ _sboxes_bitsliced(x)[_P_IDX]
+        planes = np.concatenate((R, L))[_FP_IDX]
+        bits = np.unpackbits(planes.view(np.uint8), axis=1)[:, :m]
+        dst[start:start + m] = np.packbits(bits.T, axis=1)
+    return out
+
+def _des_engine(key_hex: str, length: int, decrypt: bool):
+    """length baytlık ECB işi için (çalıştırıcı, sıralı round anahtarları)."""
+    if np is not None and length // 8 >= DES_BITSLICE_THRESHOLD:
+        masks = des_bitslice_key_masks(key_hex)
+        return des_crypt_bytes_bitsliced, masks[::-1] if decrypt else masks
+    keys = des_round_keys(key_hex)
+    return des_crypt_bytes, keys[::-1] if decrypt else keys
+
+def _des_ecb(src, dst, engine) -> None:
+    run, keys = engine
+    run(src, keys, dst)
 
 
 def des_encrypt_block(plaintext_hex: str, key_hex: str) -> str:
-    pt = hex_to_bin(plaintext_hex, 64)
-    pt = permute(pt, IP)
-    L = pt[:32]
-    R = pt[32:]
-    keys = generate_round_keys(key_hex)
-    for i in range(16):
-        L, R = R, xor(L, feistel_function(R, keys[i]))
-    pre = R + L
-    ct = permute(pre, FP)
-    return bin_to_hex(ct, 16)
+    return format(des_crypt_block_int(int(plaintext_hex, 16), des_round_keys(key_hex)), "016X")
 
 def des_decrypt_block(cipher_hex: str, key_hex: str) -> str:
-    ct = hex_to_bin(cipher_hex, 64)
-    ct = permute(ct, IP)
-    L = ct[:32]
-    R = ct[32:]
-    keys = generate_round_keys(key_hex)
-    for i in range(15, -1, -1):
-        L, R = R, xor(L, feistel_function(R, keys[i]))
-    pre = R + L
-    pt = permute(pre, FP)
-    return bin_to_hex(pt, 16)
+    return format(des_crypt_block_int(int(cipher_hex, 16), des_round_keys(key_hex)[::-1]), "016X")
 
 
 def pad(data: bytes, block_size: int = 8) -> bytes:
@@ -214,27 +333,57 @@ def password_to_key_hex(password: str) -> str:
         b = b[:8]
     return b.hex().upper()
 
-def des_encrypt_message(message: str, password: str) -> tuple:
-    start_time = time.time()
+def encrypt_bytes(data, password: str, out=None, timer=None):
+    """
+    PKCS7 + ECB, bayt girdi/çıktı. data buffer protokolünü destekleyen herhangi
+    bir nesne olabilir. out verilirse (en az len(data)//8*8 + 8 bayt) şifreli
+    metin oraya yazılır ve yazılan bayt sayısı döner; verilmezse bytes döner.
+    timer verilirse anahtar hazırlığı "key" fazı olarak işaretlenir.
+    """
+    src = byte_view(data)
     key_hex = password_to_key_hex(password)
-    data = pad(message.encode("utf-8"), 8)
-    out = ""
-    for i in range(0, len(data), 8):
-        block_hex = data[i:i+8].hex().upper().zfill(16)
-        out += des_encrypt_block(block_hex, key_hex)
-    elapsed = time.time() - start_time
-    return (out, elapsed)
+    full = len(src) - len(src) % 8
+    dst = output_view(out, full + 8)
+    body = _des_engine(key_hex, full, decrypt=False)
+    tail = _des_engine(key_hex, 8, decrypt=False)
+    if timer is not None:
+        timer.lap("key")
+    if full:
+        _des_ecb(src[:full], dst[:full], body)
+    _des_ecb(pad(bytes(src[full:]), 8), dst[full:], tail)
+    return bytes(dst) if out is None else len(dst)
 
-def des_decrypt_message(cipher_hex: str, password: str) -> tuple:
-    start_time = time.time()
-    key_hex = password_to_key_hex(password)
+def decrypt_bytes(data, password: str, out=None, timer=None):
+    """encrypt_bytes'ın tersi; out en az len(data) bayt olmalı, verilirse düz metin uzunluğu döner."""
+    src = byte_view(data)
+    if len(src) % 8 != 0:
+        raise ValueError("Şifreli veri uzunluğu 8'in (blok) katı olmalı.")
+    dst = output_view(out, len(src))
+    engine = _des_engine(password_to_key_hex(password), len(src), decrypt=True)
+    if timer is not None:
+        timer.lap("key")
+    _des_ecb(src, dst, engine)
+    size = len(src) - 8 + len(unpad(bytes(dst[-8:])))
+    return bytes(dst[:size]) if out is None else size
+
+def des_encrypt_message(message: str, password: str, timer=None) -> tuple:
+    timer = PhaseTimer() if timer is None else timer
+    data = message.encode("utf-8")
+    timer.lap("encode")
+    ct = encrypt_bytes(data, password, timer=timer)
+    timer.lap("core")
+    out = ct.hex().upper()
+    timer.lap("serialize")
+    return (out, timer.seconds)
+
+def des_decrypt_message(cipher_hex: str, password: str, timer=None) -> tuple:
+    timer = PhaseTimer() if timer is None else timer
     if len(cipher_hex) % 16 != 0:
         raise ValueError("Cipher uzunluğu 16'nın katı olmalı.")
-    raw = b""
-    for i in range(0, len(cipher_hex), 16):
-        p_hex = des_decrypt_block(cipher_hex[i:i+16], key_hex)
-        raw += bytes.fromhex(p_hex)
-    raw = unpad(raw)
-    result = raw.decode("utf-8", errors="ignore")
-    elapsed = time.time() - start_time
-    return (result, elapsed)
+    raw = bytes.fromhex(cipher_hex)
+    timer.lap("serialize")
+    pt = decrypt_bytes(raw, password, timer=timer)
+    timer.lap("core")
+    result = pt.decode("utf-8", errors="ignore")
+    timer.lap("encode")
+    return (result, timer.seconds)
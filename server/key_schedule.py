@@ -0,0 +1,18 @@
+"""
+Parola tabanlı AES/DES için round anahtarı önbelleği. Anahtar, parolanın
+kendisi değil türetilmiş anahtar baytlarıdır; farklı parolalar aynı baytlara
+kısaltılıp dolduruluyorsa aynı kaydı paylaşır.
+"""
+from lru import LRUCache
+
+SCHEDULES = LRUCache(128)
+
+
+def cached_schedule(algorithm, key, factory):
+    """(algoritma, anahtar baytları) için factory(key) sonucunu önbellekten döndürür."""
+    key = bytes(key)
+    return SCHEDULES.get_or_create((algorithm, key), lambda: factory(key))
+
+
+def stats():
+    return SCHEDULES.stats()
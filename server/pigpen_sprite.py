@@ -0,0 +1,45 @@
+"""
+Pigpen glifleri için tek SVG sprite: static/pigpen altındaki PNG'ler
+base64 olarak gömülür, her glif CELL×CELL boyutlu bir hücreye ölçeklenir.
+Tarayıcı sprite'ı bir kez indirir; glif i, x = -i * hücre konumundadır.
+"""
+import base64
+import hashlib
+import os
+from functools import lru_cache
+
+from crypto_algorithms import PIGPEN_GLYPHS
+
+CELL = 100
+
+
+@lru_cache(maxsize=4)
+def build_sprite(directory):
+    """(svg baytları, sürüm) döndürür; sürüm içerik özetidir."""
+    images = []
+    for i, glyph in enumerate(PIGPEN_GLYPHS):
+        with open(os.path.join(directory, f"{glyph}.png"), "rb") as f:
+            data = base64.b64encode(f.read()).decode("ascii")
+        images.append(
+            f'<image x="{i * CELL}" y="0" width="{CELL}" height="{CELL}" '
+            f'preserveAspectRatio="xMidYMid meet" href="data:image/png;base64,{data}"/>'
+        )
+    width = CELL * len(PIGPEN_GLYPHS)
+    svg = (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{CELL}" '
+        f'viewBox="0 0 {width} {CELL}">' + "".join(images) + "</svg>"
+    ).encode("ascii")
+    return svg, hashlib.sha1(svg).hexdigest()[:12]
+
+
+def sprite_response(app):
+    svg, version = build_sprite(os.path.join(app.static_folder, "pigpen"))
+    response = app.response_class(svg, mimetype="image/svg+xml")
+    # URL sürüm içerdiğinden yanıt hiç değişmez
+    response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+    response.headers["ETag"] = version
+    return response
+
+
+def sprite_version(app):
+    return build_sprite(os.path.join(app.static_folder, "pigpen"))[1]
@@ -0,0 +1,180 @@
+"""
+/send_batch için ortak adımlar: JSON öğelerini doğrular, hazır anahtar
+önbelleğiyle şifreler, hedefe göre gruplar ve her hedefe tüm çerçeveleri tek
+sendall ile yazar. Hedefler eşzamanlı yazılır ve toplam süre SEND_DEADLINE
+ile sınırlıdır. Öğe başına sonuç döner; bir öğenin hatası diğerlerini
+durdurmaz, bir hedefe yazılamazsa yalnızca o hedefin öğeleri hatalıdır.
+Öğe durumu "sent", "failed" ya da "unknown"dur: yazım yarıda kaldıysa veya
+süre dolduğunda hâlâ sürüyorsa öğelerin karşıya ulaşıp ulaşmadığı bilinmez.
+
+Öğe: {"message", "algorithm", "key", "target"}; target "ip:port",
+[ip, port] veya {"ip", "port"} olabilir, yoksa isteğin üst düzey target'ı
+kullanılır.
+"""
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from batch import POOL_THRESHOLD, encrypt_many
+from cipher_registry import REGISTRY
+from connection_pool import PartialSendError
+from framing import encode_frames
+
+MAX_ITEMS = 1000
+# tüm hedeflere yazım için üst süre (s); bağlanamayan hedefler birbirini beklemez
+SEND_DEADLINE = 10.0
+SEND_WORKERS = 16
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+class BatchItem:
+    __slots__ = ("index", "message", "algorithm", "key", "target",
+                 "encrypted", "phases", "error", "unknown")
+
+    def __init__(self, index, message, algorithm, key, target):
+        self.index = index
+        self.message = message
+        self.algorithm = algorithm
+        self.key = key
+        self.target = target
+        self.encrypted = None
+        self.phases = None
+        self.error = None
+        self.unknown = False
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    @property
+    def status(self):
+        if self.unknown:
+            return "unknown"
+        return "sent" if self.ok else "failed"
+
+    def payload(self):
+        return f"{self.algorithm}||{self.key or ''}||{self.encrypted}".encode("utf-8")
+
+    def result(self):
+        return {"index": self.index, "success": self.ok, "status": self.status, "error": self.error,
+                "target": f"{self.target[0]}:{self.target[1]}" if self.target else None,
+                "encrypted": self.encrypted}
+
+
+def parse_target(target):
+    """(ip, port) döndürür; biçim hatalıysa ValueError."""
+    if isinstance(target, dict):
+        ip, port = target.get("ip"), target.get("port")
+    elif isinstance(target, (list, tuple)) and len(target) == 2:
+        ip, port = target
+    elif isinstance(target, str) and ":" in target:
+        ip, port = target.rsplit(":", 1)
+    else:
+        raise ValueError("target 'ip:port' biçiminde olmalı")
+    if not ip or port in (None, ""):
+        raise ValueError("IP veya Port eksik")
+    return (str(ip), int(port))
+
+
+def parse_items(body, default_algorithm="caesar"):
+    """İstek gövdesinden BatchItem listesi; gövde geçersizse ValueError."""
+    if isinstance(body, list):
+        raw_items, default_target = body, None
+    elif isinstance(body, dict) and isinstance(body.get("items"), list):
+        raw_items, default_target = body["items"], body.get("target")
+    else:
+        raise ValueError("Gövde öğe listesi ya da {\"items\": [...]} olmalı")
+    if len(raw_items) > MAX_ITEMS:
+        raise ValueError(f"Tek istekte en fazla {MAX_ITEMS} öğe gönderilebilir")
+
+    items = []
+    for i, raw in enumerate(raw_items):
+        if not isinstance(raw, dict):
+            raw = {}
+        item = BatchItem(i, raw.get("message"), raw.get("algorithm") or default_algorithm,
+                         raw.get("key") or None, None)
+        try:
+            item.target = parse_target(raw.get("target") or default_target)
+            if not isinstance(item.message, str) or not item.message:
+                raise ValueError("message eksik")
+        except (TypeError, ValueError) as e:
+            item.error = str(e)
+        items.append(item)
+    return items
+
+
+def encrypt_items(items, resolve_key):
+    """
+    Geçerli öğeleri şifreler; resolve_key(algoritma, anahtar) oturum anahtarı
+    gibi çevirileri yapar. Büyük mesajlar batch süreç havuzunda işlenir.
+    """
+    large = []
+    for item in items:
+        if not item.ok:
+            continue
+        try:
+            key = resolve_key(item.algorithm, item.key)
+            if len(item.message) >= POOL_THRESHOLD:
+                large.append((item, key))
+                continue
+            item.encrypted, timer = REGISTRY.encrypt_timed(item.algorithm, key, item.message)
+            item.phases = timer.phases if timer else None
+        except Exception as e:
+            item.error = str(e)
+
+    if large:
+        results = encrypt_many([(item.algorithm, key, item.message) for item, key in large])
+        for (item, _), res in zip(large, results):
+            item.encrypted, item.error, item.phases = res.text, res.error, res.phases
+            if res.phases is not None:
+                REGISTRY.timings.record(item.algorithm, "encrypt", res.phases)
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=SEND_WORKERS, thread_name_prefix="send-batch")
+        return _executor
+
+
+def _send_group(pool, target, group):
+    """(hata, bilinmiyor) ya da başarıda None; öğeler burada değiştirilmez."""
+    try:
+        pool.send(target[0], target[1], encode_frames(item.payload() for item in group))
+    except PartialSendError as e:
+        return (str(e), True)
+    except Exception as e:
+        return (str(e), False)
+    return None
+
+
+def send_grouped(pool, items, deadline=SEND_DEADLINE):
+    """
+    Başarılı öğeleri hedefe göre gruplar; her hedefe tek yazım, hedefler
+    eşzamanlı. deadline saniyede bitmeyen hedeflerin öğeleri "unknown" olur,
+    hiç başlamamış olanlar iptal edilip "failed" sayılır.
+    """
+    groups = OrderedDict()
+    for item in items:
+        if item.ok:
+            groups.setdefault(item.target, []).append(item)
+    if not groups:
+        return
+    executor = _get_executor()
+    futures = {executor.submit(_send_group, pool, target, group): group
+               for target, group in groups.items()}
+    wait(futures, timeout=deadline)
+    for future, group in futures.items():
+        if future.done():
+            outcome = future.result()
+        elif future.cancel():
+            outcome = ("Gönderim süresi doldu, gönderilmedi", False)
+        else:
+            # yazım arka planda sürüyor; sonucu beklenmez
+            outcome = ("Gönderim süresi doldu, durum bilinmiyor", True)
+        if outcome is not None:
+            for item in group:
+                item.error, item.unknown = outcome
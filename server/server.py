@@ -2,231 +2,215 @@ from flask import Flask, render_template, request, jsonify
 from flask_socketio import SocketIO, emit
 import socket
 import threading
-from crypto_algorithms import *
-import math
+from concurrent.futures import Future
+from cipher_registry import REGISTRY
+from batch import POOL_THRESHOLD, submit_decrypt
+import key_schedule
+from timing import timing_fields
+from pigpen_sprite import sprite_response, sprite_version
 from rsa_key_exchange import generate_rsa_keypair, rsa_decrypt_key
+from connection_workers import MAX_CONNECTIONS, ConnectionWorkers
+from framing import FrameError, FrameParser, encode_frame, read_frames
+from connection_pool import ConnectionPool
+from send_batch import encrypt_items, parse_items, send_grouped
+from async_listener import MAX_CONNECTIONS as ASYNC_MAX_CONNECTIONS, AsyncListener
 
 app = Flask(__name__)
 socketio = SocketIO(app, async_mode="threading", cors_allowed_origins="*")
 
 CURRENT_IP = None
 CURRENT_PORT = None
-SERVER_PRIVATE_PEM, SERVER_PUBLIC_PEM = generate_rsa_keypair(2048)
+# anahtar çifti ilk kullanımda üretilir; batch işçileri bu modülü yeniden
+# içe aktardığında RSA-2048 üretimi tekrarlanmaz
+SERVER_PRIVATE_PEM = None
+SERVER_PUBLIC_PEM = None
+_rsa_lock = threading.Lock()
 SESSION_AES_KEY = None
+# aes_session için parola biçimi; anahtar kurulurken bir kez çözülür
+SESSION_AES_PASSWORD = None
 messages = []
 server_socket = None
 server_running = False
+# "asyncio" veya "blocking"; /start_server'da listener_mode ile seçilebilir
+LISTENER_MODE = "asyncio"
+socket_listener = None
+# engelleyen modda fazla bağlantılar accept edilmeden bu kuyrukta bekler
+LISTEN_BACKLOG = 128
+# istemcilere giden kalıcı bağlantılar, (ip, port) başına bir tane
+outbound = ConnectionPool()
+
+def server_keys():
+    """(özel, açık) PEM çifti; ilk çağrıda üretilir."""
+    global SERVER_PRIVATE_PEM, SERVER_PUBLIC_PEM
+    with _rsa_lock:
+        if SERVER_PRIVATE_PEM is None:
+            SERVER_PRIVATE_PEM, SERVER_PUBLIC_PEM = generate_rsa_keypair(2048)
+        return SERVER_PRIVATE_PEM, SERVER_PUBLIC_PEM
 
 @app.route("/rsa/public_key", methods=["GET"])
 def get_public_key():
-    return jsonify({"public_key": SERVER_PUBLIC_PEM.decode("utf-8")})
+    return jsonify({"public_key": server_keys()[1].decode("utf-8")})
 
 @app.route("/rsa/set_aes_key", methods=["POST"])
 def set_aes_key():
-    global SESSION_AES_KEY
+    global SESSION_AES_KEY, SESSION_AES_PASSWORD
     enc_b64 = request.form.get("enc_key")
     if not enc_b64:
         return jsonify({"success": False, "error": "enc_key eksik"})
     try:
-        SESSION_AES_KEY = rsa_decrypt_key(enc_b64, SERVER_PRIVATE_PEM)
+        SESSION_AES_KEY = rsa_decrypt_key(enc_b64, server_keys()[0])
+        SESSION_AES_PASSWORD = SESSION_AES_KEY.decode("utf-8", errors="ignore")
         return jsonify({"success": True})
     except Exception as e:
         return jsonify({"success": False, "error": str(e)})
 
+def session_key(algorithm, key):
+    if algorithm != "aes_session":
+        return key
+    if SESSION_AES_KEY is None:
+        raise ValueError("Önce RSA ile AES anahtarı kurulmalı.")
+    return SESSION_AES_PASSWORD
+
 def decrypt_message(algorithm, text, key=None):
+    """(düz metin, fazlar); fazlar ns cinsinden PhaseTimer sözlüğü, hata varsa None."""
     try:
-        if algorithm == "caesar":
-            shift = int(key) if key else 3
-            return (caesar_decrypt(text, shift), 0.0)
-        elif algorithm == "vigenere":
-            key = key if key else "anahtar"
-            return (vigenere_decrypt(text, key), 0.0)
-        elif algorithm == "substitution":
-            key_map = {chr(97 + i): chr(97 + ((i + 5) % 26)) for i in range(26)}
-            return (substitution_decrypt(text, key_map), 0.0)
-        elif algorithm == "affine":
-            if not key or "," not in key:
-                return ("Hatalı affine anahtarı", 0.0)
-            a, b = map(int, key.split(","))
-            if math.gcd(a, 26) != 1:
-                return (f"a={a} 26 ile aralarında asal değil!", 0.0)
-            return (affine_decrypt(text, a, b), 0.0)
-        elif algorithm == "playfair":
-            key = key if key else "monarchy"
-            return (playfair_decrypt(text, key), 0.0)
-        elif algorithm == "railfence":
-            key = int(key) if key else 2
-            return (rail_fence_decrypt(text, key), 0.0)
-        elif algorithm == "route":
-            cols = int(key) if key else 5
-            return (route_decrypt(text, cols), 0.0)
-        elif algorithm == "columnar":
-            key = key if key else "TRUVA"
-            return (columnar_decrypt(text, key), 0.0)
-        elif algorithm == "polybius":
-            return (polybius_decrypt(text), 0.0)
-        elif algorithm == "pigpen":
-            return (pigpen_decrypt(text), 0.0)
-        elif algorithm == "hill":
-            key = key if key else "3 3 2 5"
-            return (hill_decrypt(text, key), 0.0)
-        elif algorithm == "des":
-            key = key if key else "despass1"
-            return des_decrypt_message(text, key)
-        elif algorithm == "des_lib":
-            key = key if key else "despass1"
-            return des_decrypt_message_lib(text, key)
-        elif algorithm == "aes":
-            key = key if key else "aespass123"
-            return aes_decrypt_message(text, key)
-        elif algorithm == "aes_lib":
-            key = key if key else "aespass123"
-            return aes_decrypt_message_lib(text, key)
-        elif algorithm == "aes_session":
-            if SESSION_AES_KEY is None:
-                return ("Hata: RSA ile AES anahtarı kurulmadı (SESSION_AES_KEY boş)", 0.0)
-            return aes_decrypt_message(text, SESSION_AES_KEY.decode("utf-8", errors="ignore"))
-        else:
-            return (text, 0.0)
+        if algorithm == "aes_session" and SESSION_AES_KEY is None:
+            return ("Hata: RSA ile AES anahtarı kurulmadı (SESSION_AES_KEY boş)", None)
+        key = session_key(algorithm, key)
+        if len(text) >= POOL_THRESHOLD:
+            # büyük mesajlar GIL'i tutmasın diye süreç havuzunda çözülür
+            result = submit_decrypt(algorithm, key, text).result()
+            if result.error is not None:
+                return (f"Hata: {result.error}", None)
+            if result.phases is not None:
+                REGISTRY.timings.record(algorithm, "decrypt", result.phases)
+            return (result.text, result.phases)
+        text, timer = REGISTRY.decrypt_timed(algorithm, key, text)
+        return (text, timer.phases if timer else None)
     except Exception as e:
-        return (f"Hata: {e}", 0.0)
+        return (f"Hata: {e}", None)
+
+def process_payload(data):
+    """Gelen tek mesajı çözer, geçmişe ekler ve arayüze yollar; yanıt OK'tur."""
+    payload = data.decode("utf-8", errors="replace").strip()
+
+    algo_label = ""
+    key_used = None
+    cipher_text = payload
+
+    parts = payload.split("||", 2)
+    if len(parts) == 3:
+        algo_label, key_used, cipher_text = parts[0], parts[1], parts[2]
+        if key_used == "":
+            key_used = None
+
+    decrypted_text, decrypt_phases = decrypt_message(algo_label, cipher_text, key_used)
+
+    new_message = {
+        "direction": "Client → Server",
+        "algorithm": algo_label,
+        "encrypted": cipher_text,
+        "decrypted": decrypted_text,
+        **timing_fields("decrypt", decrypt_phases),
+    }
+    messages.append(new_message)
+    socketio.emit("new_message", new_message)
+    return b"OK"
 
-def start_socket_server(ip, port):
-    global server_socket, server_running
+def handle_connection(conn, addr):
+    """Engelleyen mod: bağlantı kapanana kadar mesajları işler."""
+    parser = FrameParser()
+    while True:
+        try:
+            data, frames = read_frames(conn, parser)
+        except (ConnectionResetError, OSError, FrameError):
+            break
+
+        reply = b"".join(process_payload(frame) for frame in frames)
+
+        if reply:
+            try:
+                conn.sendall(reply)
+            except:
+                pass
+        if data == b"":
+            break
+
+def start_socket_server(ip, port, max_connections=None, mode=None):
+    """
+    mode "asyncio" (varsayılan): tek event loop, çözme executor'da.
+    mode "blocking": accept thread'i + sınırlı işçi thread havuzu (yedek mod).
+    Her iki modda da bind/listen hatası çağırana fırlatılır.
+    """
+    global server_running, socket_listener
     if server_running:
         return
+    mode = mode or LISTENER_MODE
+    if mode == "asyncio":
+        socket_listener = AsyncListener(process_payload, max_connections or ASYNC_MAX_CONNECTIONS)
+        socket_listener.start(ip, port)
+        server_running = True
+        return
+    if mode != "blocking":
+        raise ValueError(f"Bilinmeyen dinleyici modu: {mode}")
 
-    def server_loop(bind_ip, bind_port):
-        global server_socket, server_running
+    def server_loop(bind_ip, bind_port, ready):
+        global server_socket, server_running, socket_listener
+        workers = None
+        server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         try:
-            server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             server_socket.bind((bind_ip, int(bind_port)))
-            server_socket.listen(5)
+            server_socket.listen(LISTEN_BACKLOG)
+        except Exception as e:
+            server_socket.close()
+            ready.set_exception(e)
+            return
+        try:
+            workers = socket_listener = ConnectionWorkers(handle_connection, max_connections or MAX_CONNECTIONS)
             server_running = True
+            ready.set_result(None)
 
+            # accept thread'i yalnızca kabul eder; okuma ve çözme işçilerde
             while server_running:
-                conn, addr = server_socket.accept()
-                while True:
-                    try:
-                        data = conn.recv(4096)
-                        if not data:
-                            break
-                        payload = data.decode("utf-8", errors="replace").strip()
-                    except ConnectionResetError:
-                        break
-
-                    algo_label = ""
-                    key_used = None
-                    cipher_text = payload
-
-                    parts = payload.split("||", 2)
-                    if len(parts) == 3:
-                        algo_label, key_used, cipher_text = parts[0], parts[1], parts[2]
-                        if key_used == "":
-                            key_used = None
-
-                    decrypted_text, decrypt_time = decrypt_message(algo_label, cipher_text, key_used)
-
-                    new_message = {
-                        "direction": "Client → Server",
-                        "algorithm": algo_label,
-                        "encrypted": cipher_text,
-                        "decrypted": decrypted_text,
-                        "decrypt_time": f"{decrypt_time:.6f}" if decrypt_time > 0 else None
-                    }
-                    messages.append(new_message)
-                    socketio.emit("new_message", new_message)
-
-                    try:
-                        conn.send(b"OK")
-                    except:
-                        pass
-
-                conn.close()
+                workers.acquire()
+                try:
+                    conn, addr = server_socket.accept()
+                except Exception:
+                    workers.release()
+                    raise
+                workers.submit(conn, addr)
 
         except Exception:
             pass
         finally:
             server_running = False
+            if workers:
+                workers.shutdown()
             if server_socket:
                 try:
                     server_socket.close()
                 except:
                     pass
 
-    t = threading.Thread(target=server_loop, args=(ip, port), daemon=True)
+    ready = Future()
+    t = threading.Thread(target=server_loop, args=(ip, port, ready), daemon=True)
     t.start()
+    ready.result(5.0)
 
 def send_to_client(ip, port, message, algorithm="caesar", key=None):
     try:
-        encrypt_time = 0.0
-        if algorithm == "caesar":
-            shift = int(key) if key else 3
-            encrypted = caesar_encrypt(message, shift)
-        elif algorithm == "vigenere":
-            key = key if key else "anahtar"
-            encrypted = vigenere_encrypt(message, key)
-        elif algorithm == "substitution":
-            key_map = {chr(97 + i): chr(97 + ((i + 5) % 26)) for i in range(26)}
-            encrypted = substitution_encrypt(message, key_map)
-        elif algorithm == "affine":
-            if not key or "," not in key:
-                raise ValueError("Affine anahtarı a,b şeklinde olmalı")
-            a, b = map(int, key.split(","))
-            if math.gcd(a, 26) != 1:
-                raise ValueError(f"a={a} 26 ile aralarında asal değil!")
-            encrypted = affine_encrypt(message, a, b)
-        elif algorithm == "playfair":
-            key = key if key else "monarchy"
-            encrypted = playfair_encrypt(message, key)
-        elif algorithm == "railfence":
-            key = int(key) if key else 2
-            encrypted = rail_fence_encrypt(message, key)
-        elif algorithm == "route":
-            cols = int(key) if key else 5
-            encrypted = route_encrypt(message, cols)
-        elif algorithm == "columnar":
-            key = key if key else "TRUVA"
-            encrypted = columnar_encrypt(message, key)
-        elif algorithm == "polybius":
-            encrypted = polybius_encrypt(message)
-        elif algorithm == "pigpen":
-            encrypted = pigpen_encrypt(message)
-        elif algorithm == "hill":
-            key = key if key else "3 3 2 5"
-            encrypted = hill_encrypt(message, key)
-        elif algorithm == "des":
-            key = key if key else "despass1"
-            encrypted, encrypt_time = des_encrypt_message(message, key)
-        elif algorithm == "des_lib":
-            key = key if key else "despass1"
-            encrypted, encrypt_time = des_encrypt_message_lib(message, key)
-        elif algorithm == "aes":
-            key = key if key else "aespass123"
-            encrypted, encrypt_time = aes_encrypt_message(message, key)
-        elif algorithm == "aes_lib":
-            key = key if key else "aespass123"
-            encrypted, encrypt_time = aes_encrypt_message_lib(message, key)
-        elif algorithm == "aes_session":
-            if SESSION_AES_KEY is None:
-                return False, "Hata: Önce RSA ile AES anahtarı kurulmalı."
-            encrypted, encrypt_time = aes_encrypt_message(message, SESSION_AES_KEY.decode("utf-8", errors="ignore"))
-        else:
-            encrypted = message
-
-        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        s.connect((ip, int(port)))
+        encrypted, timer = REGISTRY.encrypt_timed(algorithm, session_key(algorithm, key), message)
+
         send_data = f"{algorithm}||{key or ''}||{encrypted}"
-        s.send(send_data.encode("utf-8"))
-        s.close()
+        outbound.send(ip, port, encode_frame(send_data.encode("utf-8")))
 
         new_message = {
             "direction": "Server → Client",
             "algorithm": algorithm,
             "encrypted": encrypted,
             "decrypted": message,
-            "encrypt_time": f"{encrypt_time:.6f}" if encrypt_time > 0 else None
+            **timing_fields("encrypt", timer.phases if timer else None),
         }
         messages.append(new_message)
         socketio.emit("new_message", new_message)
@@ -237,7 +221,23 @@ def send_to_client(ip, port, message, algorithm="caesar", key=None):
 
 @app.route("/")
 def index():
-    return render_template("server.html", started=server_running, ip=CURRENT_IP, port=CURRENT_PORT)
+    return render_template("server.html", started=server_running, ip=CURRENT_IP, port=CURRENT_PORT,
+                           pigpen_version=sprite_version(app))
+
+@app.route("/pigpen/sprite.svg")
+def pigpen_sprite():
+    return sprite_response(app)
+
+@app.route("/cache_stats", methods=["GET"])
+def cache_stats():
+    return jsonify({"prepared_keys": REGISTRY.stats(), "key_schedules": key_schedule.stats(),
+                    "connections": socket_listener.stats() if socket_listener else None,
+                    "outbound": outbound.stats()})
+
+@app.route("/timing_stats", methods=["GET"])
+def timing_stats():
+    """Algoritma ve işlem başına son ölçümlerin faz ortalamaları, p50/p99 ve histogramı."""
+    return jsonify(REGISTRY.timings.summary())
 
 @app.route("/start_server", methods=["POST"])
 def start_server():
@@ -246,7 +246,17 @@ def start_server():
     CURRENT_PORT = request.form.get("port")
     if not CURRENT_IP or not CURRENT_PORT:
         return jsonify({"success": False, "error": "IP veya Port eksik"})
-    start_socket_server(CURRENT_IP, int(CURRENT_PORT))
+    try:
+        max_connections = int(request.form.get("max_connections") or 0) or None
+        if max_connections is not None and max_connections < 1:
+            raise ValueError
+    except ValueError:
+        return jsonify({"success": False, "error": "max_connections pozitif bir sayı olmalı"})
+    try:
+        start_socket_server(CURRENT_IP, int(CURRENT_PORT), max_connections,
+                            request.form.get("listener_mode") or None)
+    except (OSError, ValueError) as e:
+        return jsonify({"success": False, "error": str(e)})
     return jsonify({"success": True, "ip": CURRENT_IP, "port": CURRENT_PORT})
 
 @app.route("/send", methods=["POST"])
@@ -264,6 +274,33 @@ def send_message():
 def send_message_legacy():
     return send_message()
 
+@app.route("/send_batch", methods=["POST"])
+def send_batch():
+    """JSON: öğe listesi veya {"items": [...], "target": "ip:port"}; öğe başına sonuç döner."""
+    try:
+        items = parse_items(request.get_json(silent=True))
+    except ValueError as e:
+        return jsonify({"success": False, "error": str(e)})
+
+    encrypt_items(items, session_key)
+    send_grouped(outbound, items)
+
+    for item in items:
+        if item.ok:
+            new_message = {
+                "direction": "Server → Client",
+                "algorithm": item.algorithm,
+                "encrypted": item.encrypted,
+                "decrypted": item.message,
+                **timing_fields("encrypt", item.phases),
+            }
+            messages.append(new_message)
+            socketio.emit("new_message", new_message)
+
+    results = [item.result() for item in items]
+    return jsonify({"success": all(r["success"] for r in results),
+                    "sent": sum(r["success"] for r in results), "results": results})
+
 @socketio.on("connect")
 def on_connect():
     emit("message_history", messages)
@@ -274,4 +311,5 @@ def on_clear():
     emit("messages_cleared")
 
 if __name__ == "__main__":
+    server_keys()
     socketio.run(app, host="0.0.0.0", port=5000)